@@ -0,0 +1,142 @@
+"""
+Benchmark of FAISS index backends of the KNN surrogate. Approximate indexes are compared
+with exact search by build and query time, recall of the nearest neighbors and Spearman
+rank correlation of the surrogate estimates.
+
+Usage:
+    python benchmarks/knn_index_backends.py --num_points 50000 --dim 100
+"""
+
+import argparse
+import time
+from typing import TypedDict
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+from tabulate import tabulate
+
+from optilab.data_classes import ColumnarPointList
+from optilab.functions.multimodal import RastriginFunction
+from optilab.functions.surrogate import KNNSurrogateObjectiveFunction
+
+
+class BackendOptions(TypedDict, total=False):
+    """Keyword arguments of the KNN surrogate selecting and tuning its index."""
+
+    index_type: str
+    hnsw_ef_search: int
+    ivf_nprobe: int
+
+
+BACKENDS: dict[str, BackendOptions] = {
+    "flat": {"index_type": "flat"},
+    "hnsw": {"index_type": "hnsw"},
+    "hnsw_ef256": {"index_type": "hnsw", "hnsw_ef_search": 256},
+    "ivf": {"index_type": "ivf"},
+    "ivf_nprobe32": {"index_type": "ivf", "ivf_nprobe": 32},
+}
+"Benchmarked index configurations, passed to the KNN surrogate as keyword arguments."
+
+
+def benchmark_backend(
+    name: str,
+    train_set: ColumnarPointList,
+    queries: np.ndarray,
+    num_neighbors: int,
+    exact_labels: np.ndarray,
+    exact_estimates: np.ndarray,
+) -> dict[str, float | str]:
+    """
+    Measure a single index backend of the KNN surrogate.
+
+    Args:
+        name: Name of the benchmarked backend, a key of BACKENDS.
+        train_set: Training set of the surrogate.
+        queries: Matrix of query points of shape (n, dim).
+        num_neighbors: Number of neighbors of the surrogate.
+        exact_labels: Labels of exact nearest neighbors of the queries.
+        exact_estimates: Estimates of the surrogate with exact search.
+
+    Returns:
+        Row of the results table.
+    """
+    surrogate = KNNSurrogateObjectiveFunction(num_neighbors, **BACKENDS[name])
+
+    start = time.perf_counter()
+    surrogate.train(train_set)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    estimates = surrogate.predict_batch(queries)
+    query_time = time.perf_counter() - start
+
+    assert surrogate.faiss_index is not None
+    _, labels = surrogate.faiss_index.search(queries.astype(np.float32), num_neighbors)
+    recall = np.mean(
+        [
+            len(np.intersect1d(found, exact)) / num_neighbors
+            for found, exact in zip(labels, exact_labels)
+        ]
+    )
+
+    return {
+        "backend": name,
+        "build_s": build_time,
+        "query_s": query_time,
+        f"recall@{num_neighbors}": recall,
+        "spearman": spearmanr(estimates, exact_estimates).statistic,
+    }
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark KNN surrogate indexes.")
+    parser.add_argument("--num_points", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=100)
+    parser.add_argument("--num_queries", type=int, default=1000)
+    parser.add_argument("--num_neighbors", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    function = RastriginFunction(args.dim)
+
+    # points clustered around a few centers, like populations of an optimizer
+    centers = rng.uniform(-5, 5, (20, args.dim))
+    xs = centers[rng.integers(len(centers), size=args.num_points)]
+    xs += rng.normal(scale=0.5, size=xs.shape)
+    train_set = ColumnarPointList.from_arrays(
+        xs, function.evaluate_batch(xs), np.ones(len(xs), dtype=bool)
+    )
+    queries = centers[rng.integers(len(centers), size=args.num_queries)]
+    queries += rng.normal(scale=0.5, size=queries.shape)
+
+    exact = KNNSurrogateObjectiveFunction(args.num_neighbors)
+    exact.train(train_set)
+    assert exact.faiss_index is not None
+    _, exact_labels = exact.faiss_index.search(
+        queries.astype(np.float32), args.num_neighbors
+    )
+    exact_estimates = exact.predict_batch(queries)
+
+    results = pd.DataFrame(
+        [
+            benchmark_backend(
+                name,
+                train_set,
+                queries,
+                args.num_neighbors,
+                exact_labels,
+                exact_estimates,
+            )
+            for name in BACKENDS
+        ]
+    )
+    print(tabulate(results, headers="keys", tablefmt="github", showindex=False))
+
+
+if __name__ == "__main__":
+    main()
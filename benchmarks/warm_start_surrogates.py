@@ -0,0 +1,147 @@
+"""
+Benchmark of warm started retraining of MLP and XGBoost surrogates. A population drifting
+towards the optimum is simulated, and every generation the surrogate is retrained on a sliding
+window of evaluated points. Warm started surrogates are compared with ones fitted from scratch
+by training time per generation and Spearman rank correlation of the estimates of the next
+population with its true values.
+
+Usage:
+    python benchmarks/warm_start_surrogates.py --dim 10 --num_generations 50
+"""
+
+import argparse
+import itertools
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+from tabulate import tabulate
+
+from optilab.data_classes import ColumnarPointList, PointRingBuffer
+from optilab.functions.multimodal import RosenbrockFunction
+from optilab.functions.surrogate import (
+    MLPSurrogateObjectiveFunction,
+    NormalizedMLPSurrogateObjectiveFunction,
+    SurrogateObjectiveFunction,
+    XGBoostSurrogateObjectiveFunction,
+)
+
+SURROGATES: dict[str, Callable[[], SurrogateObjectiveFunction]] = {
+    "mlp_cold": lambda: MLPSurrogateObjectiveFunction((32,), random_seed=0),
+    "mlp_warm": lambda: MLPSurrogateObjectiveFunction(
+        (32,), random_seed=0, warm_start=True
+    ),
+    "normalized_mlp_cold": lambda: NormalizedMLPSurrogateObjectiveFunction(
+        (32,), random_seed=0
+    ),
+    "normalized_mlp_warm": lambda: NormalizedMLPSurrogateObjectiveFunction(
+        (32,), random_seed=0, warm_start=True
+    ),
+    "xgboost_cold": lambda: XGBoostSurrogateObjectiveFunction(),
+    "xgboost_warm": lambda: XGBoostSurrogateObjectiveFunction(warm_start=True),
+}
+"Benchmarked surrogate configurations."
+
+
+def simulate_populations(
+    dim: int, population_size: int, num_generations: int, seed: int
+) -> list[ColumnarPointList]:
+    """
+    Generate populations of an optimizer converging to the optimum of Rosenbrock function.
+
+    Args:
+        dim: Dimensionality of the points.
+        population_size: Number of points in a population.
+        num_generations: Number of populations.
+        seed: Seed of the random number generator.
+
+    Returns:
+        Evaluated populations, one per generation.
+    """
+    rng = np.random.default_rng(seed)
+    function = RosenbrockFunction(dim)
+    mean = rng.uniform(-5, 5, dim)
+    populations = []
+
+    for generation in range(num_generations):
+        progress = generation / max(num_generations - 1, 1)
+        center = (1 - progress) * mean + progress * np.ones(dim)
+        xs = center + rng.normal(
+            scale=2 * (1 - progress) + 0.1, size=(population_size, dim)
+        )
+        populations.append(
+            ColumnarPointList.from_arrays(
+                xs, function.evaluate_batch(xs), np.ones(population_size, dtype=bool)
+            )
+        )
+
+    return populations
+
+
+def benchmark_surrogate(
+    name: str, populations: list[ColumnarPointList], buffer_size: int
+) -> dict[str, float | str]:
+    """
+    Measure a single surrogate configuration over all generations.
+
+    Args:
+        name: Name of the benchmarked surrogate, a key of SURROGATES.
+        populations: Evaluated populations, one per generation.
+        buffer_size: Number of last evaluated points the surrogate is trained on.
+
+    Returns:
+        Row of the results table.
+    """
+    surrogate = SURROGATES[name]()
+    window = PointRingBuffer(buffer_size)
+    train_times = []
+    correlations = []
+
+    for population, next_population in itertools.pairwise(populations):
+        window.extend(population)
+
+        start = time.perf_counter()
+        surrogate.update(population, window.view())
+        train_times.append(time.perf_counter() - start)
+
+        estimates = surrogate.predict_batch(next_population.x())
+        correlations.append(spearmanr(estimates, next_population.y()).statistic)
+
+    return {
+        "surrogate": name,
+        "train_ms_per_generation": 1000 * float(np.mean(train_times)),
+        "spearman": float(np.mean(correlations)),
+    }
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the results table.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark warm started retraining of surrogates."
+    )
+    parser.add_argument("--dim", type=int, default=10)
+    parser.add_argument("--population_size", type=int, default=20)
+    parser.add_argument("--num_generations", type=int, default=50)
+    parser.add_argument("--buffer_size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    populations = simulate_populations(
+        args.dim, args.population_size, args.num_generations, args.seed
+    )
+
+    results = pd.DataFrame(
+        [
+            benchmark_surrogate(name, populations, args.buffer_size)
+            for name in SURROGATES
+        ]
+    )
+    print(tabulate(results, headers="keys", tablefmt="github", showindex=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@ def main() -> None:
     parser.add_argument(
         "pickle_path",
         type=Path,
-        help="Path to pickle file or directory with optimization runs.",
+        help="Path to pickle or npz file or directory with optimization runs.",
     )
     parser.add_argument(
         "--aggregate_pvalues",
@@ -44,6 +44,17 @@ def main() -> None:
         action="store_true",
         help="Hide plots when running the script.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files analyzed in parallel. Default is 1, files are analyzed serially.",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="If specified, analyses of files are not cached in the save path.",
+    )
     parser.add_argument(
         "--no_save",
         action="store_true",
@@ -76,6 +87,11 @@ def main() -> None:
         action="store_true",
         help="Perform Mann-Whitney U test on y values.",
     )
+    parser.add_argument(
+        "--to_npz",
+        action="store_true",
+        help="Convert analyzed pickle files to npz files saved in the save path.",
+    )
     OptilabCLI(parser.parse_args()).run()
 
 
@@ -1,23 +1,56 @@
 """
-CLI runner for analyzing optilab optimization result pickles.
+CLI runner for analyzing optilab optimization result files (pickles and npz).
 """
 
 import argparse
+import io
+from contextlib import redirect_stdout
+from multiprocessing.pool import Pool
 from pathlib import Path
+from typing import NamedTuple
 
 import pandas as pd
 from tabulate import tabulate
 
+from . import plotting
 from .data_classes import OptimizationRun
-from .plotting import plot_box_plot, plot_convergence_curve, plot_ecdf_curves
 from .utils.aggregate_pvalues import aggregate_pvalues
 from .utils.aggregate_stats import aggregate_stats
-from .utils.pickle_utils import list_all_pickles, load_from_pickle
+from .utils.analysis_cache import (
+    ANALYSIS_CACHE_FILENAME,
+    AnalysisCache,
+    FileStat,
+    file_stat,
+)
+from .utils.npz_utils import convert_to_npz, list_all_results, load_results
 from .utils.stat_test import display_test_grid, mann_whitney_u_test_grid
 
+AggregateTables = tuple[pd.DataFrame | None, pd.DataFrame | None, pd.DataFrame | None]
+"Stats, y p-values and evals p-values of a single file to aggregate."
+
+
+class FileAnalysis(NamedTuple):
+    """Results of an analysis of a single result file."""
+
+    report: str
+    "Printed report of the file."
+
+    tables: AggregateTables
+    "Stats, y p-values and evals p-values to aggregate, None if not aggregated."
+
+    artifacts: list[str]
+    "Names of the saved artifacts."
+
+
+def _init_analysis_worker() -> None:
+    """Switch matplotlib to a non-interactive backend in an analysis worker process."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
 
 class OptilabCLI:
-    """CLI runner that analyzes optilab optimization result pickles."""
+    """CLI runner that analyzes optilab optimization result files (pickles and npz)."""
 
     def __init__(self, args: argparse.Namespace) -> None:
         """
@@ -38,6 +71,9 @@ class OptilabCLI:
         self.significance: float = args.significance
         self.test_evals: bool = args.test_evals
         self.test_y: bool = args.test_y
+        self.to_npz: bool = args.to_npz
+        self.jobs: int = args.jobs
+        self.no_cache: bool = args.no_cache
 
         self.stats_to_aggregate_df = pd.DataFrame(
             columns=["model", "function", "y_median", "y_iqr"]
@@ -50,37 +86,208 @@ class OptilabCLI:
         )
 
     def run(self) -> None:
-        """Iterate over all pickle files and analyze each one, then print aggregated results."""
-        for file_path in list_all_pickles(self.pickle_path):
-            self._analyze_file(file_path)
+        """
+        Iterate over all result files and analyze each one, then print aggregated results.
+        With more than one job the files are analyzed in a process pool, and their reports
+        and tables are merged in the order of the files.
+        """
+        file_paths = list_all_results(self.pickle_path)
+
+        if self.jobs > 1:
+            self.hide_plots = True
+            with Pool(self.jobs, initializer=_init_analysis_worker) as pool:
+                analyses = list(pool.imap(self._analyze_or_restore, file_paths))
+        else:
+            analyses = [self._analyze_or_restore(file_path) for file_path in file_paths]
+
+        cache = self._open_cache()
+        for file_path, (cache_entry, analysis) in zip(
+            file_paths, analyses, strict=True
+        ):
+            print(f"# File {file_path}")
+            print(analysis.report, end="")
+            self._merge_tables(analysis.tables)
+            if cache is not None and cache_entry is not None:
+                key, stat = cache_entry
+                cache.put(
+                    key,
+                    file_path,
+                    stat,
+                    analysis.report,
+                    analysis.tables,
+                    [self.save_path / name for name in analysis.artifacts],
+                )
+        if cache is not None:
+            cache.close()
+
         self._finalize()
 
-    def _analyze_file(self, file_path: Path) -> None:
+    def _open_cache(self) -> AnalysisCache | None:
+        """
+        Open the analysis cache in the save path.
+
+        Returns:
+            The analysis cache, None if caching is disabled or no artifacts are saved.
+        """
+        if self.no_cache or self.no_save:
+            return None
+        return AnalysisCache(self.save_path / ANALYSIS_CACHE_FILENAME)
+
+    def _cache_key(self, file_path: Path) -> str:
         """
-        Load and analyze a single pickle file.
+        Make the cache key of an analysis of a file with the current options.
 
         Args:
-            file_path: Path to the pickle file containing optimization runs.
+            file_path: Path to the analyzed file.
+
+        Returns:
+            The cache key.
+        """
+        return AnalysisCache.make_key(
+            file_path,
+            {
+                "aggregate_pvalues": self.aggregate_pvalues_flag,
+                "aggregate_stats": self.aggregate_stats_flag,
+                "entries": self.entries,
+                "hide_outliers": self.hide_outliers,
+                "raw_values": self.raw_values,
+                "significance": self.significance,
+                "test_evals": self.test_evals,
+                "test_y": self.test_y,
+            },
+        )
+
+    def _artifact_names(self, filename_stem: str) -> list[str]:
+        """
+        Get names of artifacts saved by an analysis of a file.
+
+        Args:
+            filename_stem: Base name used for output file names.
+
+        Returns:
+            List of names of the artifacts.
+        """
+        suffixes = ["convergence.png", "ecdf.png", "box_plot.png", "stats.csv"]
+        if self.test_y:
+            suffixes.append("pvalues_y.csv")
+        if self.test_evals:
+            suffixes.append("pvalues_evals.csv")
+        return [f"{filename_stem}.{suffix}" for suffix in suffixes]
+
+    def _analyze_or_restore(
+        self, file_path: Path
+    ) -> tuple[tuple[str, FileStat] | None, FileAnalysis]:
+        """
+        Analyze a single result file, capturing the printed report. If the analysis
+        of the unchanged file with the same options is cached and its artifacts are still
+        saved, its report and tables are reused instead. Cached analyses are not used
+        when plots are shown.
+
+        Args:
+            file_path: Path to the pickle or npz file containing optimization runs.
+
+        Returns:
+            Cache key of the analysis and size and modification time of the file before
+            it was analyzed (None if it was restored or caching is disabled),
+            and the analysis.
         """
-        print(f"# File {file_path}")
         filename_stem = file_path.stem.split(".")[0]
+        cache = self._open_cache()
+        if cache is None:
+            return None, self._analyze_captured(file_path)
+
+        key = self._cache_key(file_path)
+        stat = file_stat(file_path)
+        with cache:
+            cached = (
+                cache.get(key, file_path, self.save_path) if self.hide_plots else None
+            )
 
-        data = load_from_pickle(file_path)
+        converted = (self.save_path / f"{filename_stem}.npz").exists()
+        if cached is None or (
+            self.to_npz and file_path.suffix != ".npz" and not converted
+        ):
+            analysis = self._analyze_captured(file_path)
+            artifacts = [
+                name
+                for name in self._artifact_names(filename_stem)
+                if (self.save_path / name).exists()
+            ]
+            return (key, stat), analysis._replace(artifacts=artifacts)
+
+        report, tables = cached
+        return None, FileAnalysis(report, tables, [])
+
+    def _analyze_captured(self, file_path: Path) -> FileAnalysis:
+        """
+        Analyze a single result file, capturing the printed report.
 
-        if self.entries:
-            data = [data[i] for i in self.entries if 0 <= i < len(data)]
+        Args:
+            file_path: Path to the pickle or npz file containing optimization runs.
+
+        Returns:
+            The analysis, without artifacts.
+        """
+        with redirect_stdout(io.StringIO()) as report:
+            tables = self._analyze_file(file_path)
+        return FileAnalysis(report.getvalue(), tables, [])
+
+    def _merge_tables(self, tables: AggregateTables) -> None:
+        """
+        Append tables of a single file to the tables to aggregate.
+
+        Args:
+            tables: Stats, y p-values and evals p-values to aggregate.
+        """
+        stats_df, y_pvalues_df, evals_pvalues_df = tables
+        if stats_df is not None:
+            self.stats_to_aggregate_df = pd.concat(
+                [self.stats_to_aggregate_df, stats_df], axis=0
+            )
+        if y_pvalues_df is not None:
+            self.y_pvalues_to_aggregate_df = pd.concat(
+                [self.y_pvalues_to_aggregate_df, y_pvalues_df], axis=0
+            )
+        if evals_pvalues_df is not None:
+            self.evals_pvalues_to_aggregate_df = pd.concat(
+                [self.evals_pvalues_to_aggregate_df, evals_pvalues_df], axis=0
+            )
+
+    def _analyze_file(self, file_path: Path) -> AggregateTables:
+        """
+        Load and analyze a single result file.
+
+        Args:
+            file_path: Path to the pickle or npz file containing optimization runs.
+
+        Returns:
+            Stats, y p-values and evals p-values to aggregate, None if not aggregated.
+        """
+        filename_stem = file_path.stem.split(".")[0]
+
+        if self.to_npz and file_path.suffix != ".npz" and not self.no_save:
+            file_path = convert_to_npz(
+                file_path, self.save_path / f"{filename_stem}.npz"
+            )
+
+        # npz files are memory-mapped, only logs of selected entries are paged in
+        data = load_results(file_path, self.entries or None, lazy=True)
 
         assert isinstance(data, list)
         for run in data:
             assert isinstance(run, OptimizationRun)
 
         self._plot(data, filename_stem)
-        stats_df = self._report_stats(data, filename_stem)
+        stats_df, stats_to_aggregate = self._report_stats(data, filename_stem)
 
+        y_pvalues_to_aggregate = None
         if self.test_y:
-            self._test_y(data, stats_df, filename_stem)
+            y_pvalues_to_aggregate = self._test_y(data, stats_df, filename_stem)
+        evals_pvalues_to_aggregate = None
         if self.test_evals:
-            self._test_evals(data, stats_df, filename_stem)
+            evals_pvalues_to_aggregate = self._test_evals(data, stats_df, filename_stem)
+
+        return stats_to_aggregate, y_pvalues_to_aggregate, evals_pvalues_to_aggregate
 
     def _plot(self, data: list[OptimizationRun], filename_stem: str) -> None:
         """
@@ -90,7 +297,7 @@ class OptilabCLI:
             data: List of optimization runs to plot.
             filename_stem: Base name used for output file names.
         """
-        plot_convergence_curve(
+        plotting.plot_convergence_curve(
             data={run.model_metadata.name: run.logs for run in data},
             savepath=(
                 (self.save_path / f"{filename_stem}.convergence.png")
@@ -101,7 +308,7 @@ class OptilabCLI:
             function_name=data[0].function_metadata.name,
         )
 
-        plot_ecdf_curves(
+        plotting.plot_ecdf_curves(
             data={run.model_metadata.name: run.logs for run in data},
             n_dimensions=data[0].function_metadata.dim,
             n_thresholds=100,
@@ -115,7 +322,7 @@ class OptilabCLI:
             function_name=data[0].function_metadata.name,
         )
 
-        plot_box_plot(
+        plotting.plot_box_plot(
             data={
                 run.model_metadata.name: run.bests_y(self.raw_values) for run in data
             },
@@ -131,7 +338,7 @@ class OptilabCLI:
 
     def _report_stats(
         self, data: list[OptimizationRun], filename_stem: str
-    ) -> pd.DataFrame:
+    ) -> tuple[pd.DataFrame, pd.DataFrame | None]:
         """
         Compute, print, and optionally save descriptive statistics for the given runs.
 
@@ -140,19 +347,18 @@ class OptilabCLI:
             filename_stem: Base name used for the output CSV file name.
 
         Returns:
-            DataFrame with non-evals/y columns, used as a label source for stat tests.
+            DataFrame with non-evals/y columns, used as a label source for stat tests,
+            and stats to aggregate (None if stats are not aggregated).
         """
         stats = pd.concat(
             [run.stats(self.raw_values) for run in data], ignore_index=True
         )
 
+        stats_to_aggregate = None
         if self.aggregate_stats_flag:
-            stats_to_concat = pd.DataFrame(
+            stats_to_aggregate = pd.DataFrame(
                 stats, columns=self.stats_to_aggregate_df.columns
             )
-            self.stats_to_aggregate_df = pd.concat(
-                [self.stats_to_aggregate_df, stats_to_concat], axis=0
-            )
 
         stats_evals = stats.filter(like="evals_", axis=1)
         stats_y = stats.filter(like="y_", axis=1)
@@ -165,11 +371,11 @@ class OptilabCLI:
         print(tabulate(stats_y, headers="keys", tablefmt="github"), "\n")
         print(tabulate(stats_evals, headers="keys", tablefmt="github"), "\n")
 
-        return stats_df
+        return stats_df, stats_to_aggregate
 
     def _test_y(
         self, data: list[OptimizationRun], stats_df: pd.DataFrame, filename_stem: str
-    ) -> None:
+    ) -> pd.DataFrame | None:
         """
         Run Mann-Whitney U test on best y values and print the p-value grid.
 
@@ -177,9 +383,13 @@ class OptilabCLI:
             data: List of optimization runs to test.
             stats_df: Stats DataFrame used to label models and functions in the aggregate.
             filename_stem: Base name used for the output CSV file name.
+
+        Returns:
+            P-values to aggregate, None if p-values are not aggregated.
         """
         pvalues_y = mann_whitney_u_test_grid([run.bests_y() for run in data])
 
+        pvalues_to_aggregate = None
         if self.aggregate_pvalues_flag:
             better_df = pd.DataFrame(
                 [
@@ -207,9 +417,7 @@ class OptilabCLI:
                     )
                 ]
             )
-            self.y_pvalues_to_aggregate_df = pd.concat(
-                [self.y_pvalues_to_aggregate_df, better_df, worse_df], axis=0
-            )
+            pvalues_to_aggregate = pd.concat([better_df, worse_df], axis=0)
 
         print("## Mann Whitney U test on optimization results (y).")
         print("p-values for alternative hypothesis row < column")
@@ -222,9 +430,11 @@ class OptilabCLI:
             )
             pvalues_y_df.to_csv(self.save_path / f"{filename_stem}.pvalues_y.csv")
 
+        return pvalues_to_aggregate
+
     def _test_evals(
         self, data: list[OptimizationRun], stats_df: pd.DataFrame, filename_stem: str
-    ) -> None:
+    ) -> pd.DataFrame | None:
         """
         Run Mann-Whitney U test on objective function evaluation counts and print the p-value grid.
 
@@ -232,9 +442,13 @@ class OptilabCLI:
             data: List of optimization runs to test.
             stats_df: Stats DataFrame used to label models and functions in the aggregate.
             filename_stem: Base name used for the output CSV file name.
+
+        Returns:
+            P-values to aggregate, None if p-values are not aggregated.
         """
         pvalues_evals = mann_whitney_u_test_grid([run.log_lengths() for run in data])
 
+        pvalues_to_aggregate = None
         if self.aggregate_pvalues_flag:
             better_df = pd.DataFrame(
                 [
@@ -264,14 +478,7 @@ class OptilabCLI:
                     )
                 ]
             )
-            self.evals_pvalues_to_aggregate_df = pd.concat(
-                [
-                    self.evals_pvalues_to_aggregate_df,
-                    better_df,
-                    worse_df,
-                ],
-                axis=0,
-            )
+            pvalues_to_aggregate = pd.concat([better_df, worse_df], axis=0)
 
         print("## Mann Whitney U test on number of objective function evaluations.")
         print("p-values for alternative hypothesis row < column")
@@ -286,6 +493,8 @@ class OptilabCLI:
                 self.save_path / f"{filename_stem}.pvalues_evals.csv"
             )
 
+        return pvalues_to_aggregate
+
     def _finalize(self) -> None:
         """Print and optionally save aggregated stats and p-values across all processed files."""
         if self.aggregate_stats_flag:
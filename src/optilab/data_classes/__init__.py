@@ -3,17 +3,23 @@ Classes used for data exchange.
 """
 
 from .bounds import Bounds
+from .columnar_point_list import ColumnarPointList
 from .function_metadata import FunctionMetadata
 from .optimization_run import OptimizationRun
 from .optimizer_metadata import OptimizerMetadata
 from .point import Point
+from .point_index import PointIndex
 from .point_list import PointList
+from .point_ring_buffer import PointRingBuffer
 
 __all__ = [
     "Bounds",
+    "ColumnarPointList",
     "FunctionMetadata",
     "OptimizationRun",
     "OptimizerMetadata",
     "Point",
+    "PointIndex",
     "PointList",
+    "PointRingBuffer",
 ]
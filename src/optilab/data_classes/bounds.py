@@ -2,10 +2,8 @@
 Class representing bounds of the search space.
 """
 
-from copy import deepcopy
-
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 from .point import Point
 from .point_list import PointList
@@ -13,32 +11,106 @@ from .point_list import PointList
 
 class Bounds(BaseModel):
     """
-    Class representing bounds of the search space.
+    Class representing bounds of the search space. The bounds are either the same
+    for every dimension (scalar lower and upper) or given per dimension (box bounds).
+    A scalar bound is broadcast against a per dimension one.
     """
 
-    lower: float
-    "The lower bound of search space."
+    lower: float | list[float]
+    "The lower bound of search space, a single value or one value per dimension."
+
+    upper: float | list[float]
+    "The upper bound of search space, a single value or one value per dimension."
+
+    @field_validator("lower", "upper", mode="before")
+    @classmethod
+    def _coerce_bound(cls, v: object) -> object:
+        if isinstance(v, np.ndarray):
+            return v.tolist()
+        return v
+
+    def lower_array(self) -> np.ndarray:
+        """
+        Return the lower bound as an array that broadcasts against points.
+
+        Returns:
+            The lower bound as a float64 array, 0-dimensional for scalar bounds.
+        """
+        return np.asarray(self.lower, dtype=np.float64)
+
+    def upper_array(self) -> np.ndarray:
+        """
+        Return the upper bound as an array that broadcasts against points.
+
+        Returns:
+            The upper bound as a float64 array, 0-dimensional for scalar bounds.
+        """
+        return np.asarray(self.upper, dtype=np.float64)
+
+    def dim(self) -> int | None:
+        """
+        Return the dimensionality of box bounds.
+
+        Returns:
+            The number of dimensions of box bounds, None if both bounds are scalar.
+        """
+        if isinstance(self.lower, list):
+            return len(self.lower)
+        if isinstance(self.upper, list):
+            return len(self.upper)
+        return None
+
+    def width(self) -> np.ndarray:
+        """
+        Return the width of the search space in each dimension.
+
+        Returns:
+            The distance between the upper and lower bound, 0-dimensional array
+                for scalar bounds.
+        """
+        return self.upper_array() - self.lower_array()
+
+    def max_width(self) -> float:
+        """
+        Return the width of the search space in its widest dimension.
+
+        Returns:
+            The largest distance between the upper and lower bound.
+        """
+        return float(np.max(self.width()))
+
+    def sigma_scaling(self, dim: int) -> np.ndarray:
+        """
+        Return per dimension multipliers of the step size, proportional to the width
+        of the search space in each dimension. The widest dimension has multiplier 1.
+
+        Args:
+            dim: The dimensionality of the search space.
 
-    upper: float
-    "The upper bound of search space."
+        Returns:
+            Array of dim multipliers, all equal to 1 for scalar bounds.
+        """
+        return np.broadcast_to(self.width(), (dim,)) / self.max_width()
 
-    def to_list(self) -> list[float]:
+    def to_list(self) -> list[float | list[float]]:
         """
-        Return the bounds as a list of two floats.
+        Return the bounds as a list of two elements, accepted by the bounds option of cma.
 
         Returns:
-            List containing the lower and upper bound.
+            List containing the lower and upper bound, each one either a float
+                or a list of per dimension values.
         """
         return [self.lower, self.upper]
 
     def __len__(self) -> int:
         """
         Returns the width of the search space - the distance between the lower and upper bound.
+        For box bounds it's the width of the widest dimension.
 
         Returns:
             The width of the search space.
         """
-        return int(self.upper - self.lower)
+        return int(self.max_width())
 
     def __str__(self) -> str:
         """
@@ -56,7 +128,10 @@ class Bounds(BaseModel):
         Returns:
             True if bounds are valid, false otherwise.
         """
-        return self.lower < self.upper
+        lower, upper = self.lower_array(), self.upper_array()
+        if lower.ndim == upper.ndim == 1 and len(lower) != len(upper):
+            return False
+        return bool(np.all(lower < upper))
 
     def __contains__(self, point: Point) -> bool:
         """
@@ -66,7 +141,9 @@ class Bounds(BaseModel):
             True if point lies in the bounds.
         """
         assert point.x is not None
-        return bool(np.all((point.x >= self.lower) & (point.x <= self.upper)))
+        return bool(
+            np.all((point.x >= self.lower_array()) & (point.x <= self.upper_array()))
+        )
 
     def random_point(self, dim: int) -> Point:
         """
@@ -78,11 +155,16 @@ class Bounds(BaseModel):
         Returns:
             Randomly sampled point from the search space.
         """
-        return Point(x=np.random.uniform(low=self.lower, high=self.upper, size=dim))
+        return Point(
+            x=np.random.uniform(
+                low=self.lower_array(), high=self.upper_array(), size=dim
+            )
+        )
 
     def random_point_list(self, num_points: int, dim: int) -> PointList:
         """
         Sample the bounds for a list of random points of given dimensionality.
+        All points are sampled at once as a (num_points, dim) matrix.
 
         Args:
             num_points: The number of points to sample.
@@ -91,96 +173,185 @@ class Bounds(BaseModel):
         Returns:
             List of randomly sampled points from the search space.
         """
-        return PointList(points=[self.random_point(dim) for _ in range(num_points)])
+        xs = np.random.uniform(
+            low=self.lower_array(), high=self.upper_array(), size=(num_points, dim)
+        )
+        return PointList(points=[Point(x=x) for x in xs])
+
+    # vectorized search space bounds handling methods
+    @staticmethod
+    def _output_array(xs: np.ndarray, in_place: bool) -> np.ndarray:
+        """
+        Prepare the array that handled values are written to.
+
+        Args:
+            xs: Array of values to handle.
+            in_place: If true, xs itself is returned and must be a float64 array.
+
+        Returns:
+            xs if in_place is true, otherwise its float64 copy.
+        """
+        if in_place:
+            if not (isinstance(xs, np.ndarray) and xs.dtype == np.float64):
+                raise TypeError("In place bounds handling requires a float64 array.")
+            return xs
+        return np.array(xs, dtype=np.float64)
+
+    def reflect_array(self, xs: np.ndarray, *, in_place: bool = False) -> np.ndarray:
+        """
+        Handle bounds of an array of values, for example a (n, dim) population matrix,
+        by reflecting the values back into the search area.
+
+        Args:
+            xs: Array of values to handle.
+            in_place: If true, xs is modified in place. Default False.
+
+        Returns:
+            Array of reflected values.
+        """
+        out = self._output_array(xs, in_place)
+        lower, upper = self.lower_array(), self.upper_array()
+        width = upper - lower
+        shifted = out - lower
+        remainder = shifted % width
+        reflected = np.where(
+            (shifted // width) % 2 == 0, lower + remainder, upper - remainder
+        )
+        np.copyto(out, reflected, where=(out < lower) | (out > upper))
+        return out
+
+    def wrap_array(self, xs: np.ndarray, *, in_place: bool = False) -> np.ndarray:
+        """
+        Handle bounds of an array of values, for example a (n, dim) population matrix,
+        by wrapping the values around the search area.
+
+        Args:
+            xs: Array of values to handle.
+            in_place: If true, xs is modified in place. Default False.
+
+        Returns:
+            Array of wrapped values.
+        """
+        out = self._output_array(xs, in_place)
+        lower, upper = self.lower_array(), self.upper_array()
+        wrapped = (out - lower) % (upper - lower) + lower
+        np.copyto(out, wrapped, where=(out < lower) | (out > upper))
+        return out
+
+    def project_array(self, xs: np.ndarray, *, in_place: bool = False) -> np.ndarray:
+        """
+        Handle bounds of an array of values, for example a (n, dim) population matrix,
+        by projecting the values onto the bounds of the search area.
+
+        Args:
+            xs: Array of values to handle.
+            in_place: If true, xs is modified in place. Default False.
+
+        Returns:
+            Array of projected values.
+        """
+        out = self._output_array(xs, in_place)
+        return np.clip(out, self.lower_array(), self.upper_array(), out=out)
+
+    def handle_bounds_array(
+        self, xs: np.ndarray, mode: str, *, in_place: bool = False
+    ) -> np.ndarray:
+        """
+        Function to choose the vectorized bound handling method by name of the method.
+
+        Args:
+            xs: Array of values to handle, for example a (n, dim) population matrix.
+            mode: Bound handling mode to use, choose from reflect, wrap or project.
+            in_place: If true, xs is modified in place. Default False.
+
+        Returns:
+            Array of handled values.
+        """
+        methods = {
+            "reflect": self.reflect_array,
+            "wrap": self.wrap_array,
+            "project": self.project_array,
+        }
+        try:
+            method = methods[mode]
+        except KeyError as err:
+            raise ValueError(f"Invalid mode {mode} in Bounds.handle_bounds!") from err
+        return method(xs, in_place=in_place)
 
     # search space bounds handling methods
-    def reflect(self, point: Point) -> Point:
+    def _handle_point(self, point: Point, mode: str, in_place: bool) -> Point:
         """
-        Handle bounds by reflecting the point back into the
-        search area.
+        Handle bounds of a single point with one of the vectorized methods.
 
         Args:
             point: The point to handle.
+            mode: Bound handling mode to use, choose from reflect, wrap or project.
+            in_place: If true, x of the point is modified in place and the same point
+                is returned. Otherwise a copy of the point is returned.
 
         Returns:
-            Reflected point.
+            Handled point.
         """
         assert point.x is not None
-        new_x = []
+        if in_place:
+            self.handle_bounds_array(point.x, mode, in_place=True)
+            return point
+        return point.model_copy(update={"x": self.handle_bounds_array(point.x, mode)})
 
-        for val in point.x:
-            if val < self.lower or val > self.upper:
-                val -= self.lower
-                remainder = val % (self.upper - self.lower)
-                relative_distance = val // (self.upper - self.lower)
+    def reflect(self, point: Point, *, in_place: bool = False) -> Point:
+        """
+        Handle bounds by reflecting the point back into the
+        search area.
 
-                if relative_distance % 2 == 0:
-                    new_x.append(self.lower + remainder)
-                else:
-                    new_x.append(self.upper - remainder)
-            else:
-                new_x.append(val)
+        Args:
+            point: The point to handle.
+            in_place: If true, the point is modified instead of copied. Default False.
 
-        new_point = deepcopy(point)
-        new_point.x = np.array(new_x, dtype=np.float64)
-        return new_point
+        Returns:
+            Reflected point.
+        """
+        return self._handle_point(point, "reflect", in_place)
 
-    def wrap(self, point: Point) -> Point:
+    def wrap(self, point: Point, *, in_place: bool = False) -> Point:
         """
         Handle bounds by wrapping the point around the
         search area.
 
         Args:
             point: The point to handle.
+            in_place: If true, the point is modified instead of copied. Default False.
 
         Returns:
             Wrapped point.
         """
-        assert point.x is not None
-        new_x = []
-
-        for val in point.x:
-            if val < self.lower or val > self.upper:
-                val -= self.lower
-                val %= self.upper - self.lower
-                val += self.lower
-                new_x.append(val)
-            else:
-                new_x.append(val)
+        return self._handle_point(point, "wrap", in_place)
 
-        new_point = deepcopy(point)
-        new_point.x = np.array(new_x, dtype=np.float64)
-        return new_point
-
-    def project(self, point: Point) -> Point:
+    def project(self, point: Point, *, in_place: bool = False) -> Point:
         """
         Handle bounds by projecting the point onto the bounds
         of the search area.
 
         Args:
             point: The point to handle.
+            in_place: If true, the point is modified instead of copied. Default False.
 
         Returns:
             Projected point.
         """
-        assert point.x is not None
-        new_point = deepcopy(point)
-        new_point.x = np.clip(point.x, self.lower, self.upper)
-        return new_point
+        return self._handle_point(point, "project", in_place)
 
-    def handle_bounds(self, point: Point, mode: str) -> Point:
+    def handle_bounds(
+        self, point: Point, mode: str, *, in_place: bool = False
+    ) -> Point:
         """
         Function to choose the bound handling method by name of the method.
 
         Args:
             point: The point to handle.
             mode: Bound handling mode to use, choose from reflect, wrap or project.
+            in_place: If true, the point is modified instead of copied. Default False.
 
         Returns:
             Handled point.
         """
-        methods = {"reflect": self.reflect, "wrap": self.wrap, "project": self.project}
-        try:
-            return methods[mode](point)
-        except KeyError as err:
-            raise ValueError(f"Invalid mode {mode} in Bounds.handle_bounds!") from err
+        return self._handle_point(point, mode, in_place)
@@ -0,0 +1,522 @@
+"""
+Array-backed list of points, a columnar alternative to PointList.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, overload
+
+import numpy as np
+
+from .point import Point
+from .point_index import PointIndex
+from .point_list import PointList
+
+
+class ColumnarPointList:
+    """
+    Array-backed list of points, a columnar alternative to PointList. The x values are stored
+    in a growable contiguous (capacity, dim) float64 buffer, y values and is_evaluated flags
+    in parallel arrays. Appending is amortized O(1), and x(), y(), pairs() and slicing
+    return views of the buffers without copying.
+
+    Point objects are materialized only when the list is iterated or indexed with an integer,
+    so modifying them does not change the list. Missing y values are stored as NaN.
+    """
+
+    def __init__(self, dim: int | None = None, capacity: int = 16) -> None:
+        """
+        Class constructor.
+
+        Args:
+            dim: Dimensionality of the points. If None, it's deduced from the first
+                appended point.
+            capacity: Initial number of points that fit in the buffers.
+        """
+        self._dim = dim
+        self._size = 0
+        self._has_x = True
+        self._xs = np.empty((capacity, dim or 0), dtype=np.float64)
+        self._ys = np.empty(capacity, dtype=np.float64)
+        self._is_evaluated = np.empty(capacity, dtype=bool)
+        self._best_scanned = 0
+        self._best_index: int | None = None
+
+    # alternative constructors
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: np.ndarray | None,
+        ys: np.ndarray | None = None,
+        is_evaluated: np.ndarray | None = None,
+        *,
+        copy: bool = True,
+    ) -> ColumnarPointList:
+        """
+        Alternative constructor that takes columns of values.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim). If None, the points have no x values
+                and ys must be provided.
+            ys: Array of n y values. If None, all y values are missing.
+            is_evaluated: Array of n is_evaluated flags. If None, all flags are False.
+            copy: If False, the provided arrays are used as buffers directly, for example
+                to wrap memory-mapped data. They are copied on the first append.
+
+        Returns:
+            Object of class ColumnarPointList containing the given values.
+        """
+        if xs is None:
+            assert ys is not None
+            num_points = len(ys)
+            xs = np.empty((num_points, 0), dtype=np.float64)
+            has_x = False
+        else:
+            xs = np.asarray(xs, dtype=np.float64)
+            if xs.size == 0 and xs.ndim < 2:
+                xs = xs.reshape(0, 0)
+            num_points = len(xs)
+            has_x = True
+
+        if ys is None:
+            ys = np.full(num_points, np.nan, dtype=np.float64)
+        if is_evaluated is None:
+            is_evaluated = np.zeros(num_points, dtype=bool)
+
+        if not len(ys) == len(is_evaluated) == num_points:
+            raise ValueError("Provided columns have different lengths.")
+
+        new_list = cls.__new__(cls)
+        new_list._dim = xs.shape[1] if has_x and num_points > 0 else None
+        new_list._size = num_points
+        new_list._has_x = has_x
+        new_list._xs = np.array(xs, copy=copy or None)
+        new_list._ys = np.array(ys, dtype=np.float64, copy=copy or None)
+        new_list._is_evaluated = np.array(is_evaluated, dtype=bool, copy=copy or None)
+        new_list._best_scanned = 0
+        new_list._best_index = None
+        return new_list
+
+    @classmethod
+    def from_list(cls, xs: list[np.ndarray]) -> ColumnarPointList:
+        """
+        Alternative constructor that takes a list of x values.
+
+        Args:
+            xs: List of x values.
+
+        Returns:
+            Object of class ColumnarPointList containing points with given x.
+        """
+        if len(xs) == 0:
+            return cls()
+        return cls.from_arrays(np.array(xs, dtype=np.float64))
+
+    @classmethod
+    def from_point_list(cls, point_list: PointList) -> ColumnarPointList:
+        """
+        Alternative constructor that copies the contents of a PointList.
+
+        Args:
+            point_list: The list of points to copy.
+
+        Returns:
+            Object of class ColumnarPointList containing the same points.
+        """
+        new_list = cls()
+        new_list.extend(point_list)
+        return new_list
+
+    def to_point_list(self) -> PointList:
+        """
+        Materialize the contents of this list as a PointList.
+
+        Returns:
+            PointList containing the same points.
+        """
+        return PointList(points=self.points)
+
+    # buffer management
+    def _reserve(self, num_points: int, dim: int) -> None:
+        """
+        Make sure that the buffers fit num_points more points, growing them geometrically.
+
+        Args:
+            num_points: Number of points to be added.
+            dim: Dimensionality of the points to be added.
+
+        Raises:
+            ValueError: If dim doesn't match the dimensionality of points in the list.
+        """
+        if self._has_x:
+            if self._dim is None:
+                self._dim = dim
+                self._xs = np.empty((len(self._ys), dim), dtype=np.float64)
+            elif dim != self._dim:
+                raise ValueError(
+                    f"Cannot add points of dimensionality {dim} to a list of "
+                    f"dimensionality {self._dim}."
+                )
+
+        required = self._size + num_points
+        if required <= len(self._ys):
+            return
+
+        capacity = max(required, 2 * len(self._ys), 16)
+        xs = np.empty((capacity, self._xs.shape[1]), dtype=np.float64)
+        xs[: self._size] = self._xs[: self._size]
+        ys = np.empty(capacity, dtype=np.float64)
+        ys[: self._size] = self._ys[: self._size]
+        is_evaluated = np.empty(capacity, dtype=bool)
+        is_evaluated[: self._size] = self._is_evaluated[: self._size]
+        self._xs, self._ys, self._is_evaluated = xs, ys, is_evaluated
+
+    def _append_columns(
+        self, xs: np.ndarray, ys: np.ndarray, is_evaluated: np.ndarray
+    ) -> None:
+        """
+        Append columns of values to the buffers.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim).
+            ys: Array of n y values.
+            is_evaluated: Array of n is_evaluated flags.
+        """
+        num_points = len(ys)
+        if num_points == 0:
+            return
+        self._reserve(num_points, xs.shape[1])
+        end = self._size + num_points
+        if self._has_x:
+            self._xs[self._size : end] = xs
+        self._ys[self._size : end] = ys
+        self._is_evaluated[self._size : end] = is_evaluated
+        self._size = end
+
+    # adding points to the list
+    def append(self, new_point: Point) -> None:
+        """
+        Add new point to the list.
+
+        Args:
+            new_point: Point to append to this object.
+        """
+        assert new_point.x is not None
+        self._append_columns(
+            new_point.x[np.newaxis, :],
+            np.array([np.nan if new_point.y is None else new_point.y]),
+            np.array([new_point.is_evaluated]),
+        )
+
+    def extend(self, new_points: PointList | ColumnarPointList) -> None:
+        """
+        Append a list of points to this list.
+
+        Args:
+            new_points: A list of point to append to this object.
+        """
+        if len(new_points) == 0:
+            return
+
+        if isinstance(new_points, ColumnarPointList):
+            self._append_columns(
+                new_points.x(), new_points.y(), new_points.is_evaluated()
+            )
+            return
+
+        self._append_columns(
+            new_points.x(),
+            np.array(
+                [np.nan if point.y is None else point.y for point in new_points],
+                dtype=np.float64,
+            ),
+            np.array([point.is_evaluated for point in new_points], dtype=bool),
+        )
+
+    # getting point values
+    def x(self) -> np.ndarray:
+        """
+        Get all x values of points in this list. The result is a view of the buffer.
+
+        Returns:
+            Matrix of shape (n, dim) containing x values of all points.
+        """
+        return self._xs[: self._size]
+
+    def y(self) -> np.ndarray:
+        """
+        Get all y values of points in this list. The result is a view of the buffer.
+
+        Returns:
+            Array of y values of all points, NaN where the value is missing.
+        """
+        return self._ys[: self._size]
+
+    def is_evaluated(self) -> np.ndarray:
+        """
+        Get is_evaluated flags of points in this list. The result is a view of the buffer.
+
+        Returns:
+            Array of is_evaluated flags of all points.
+        """
+        return self._is_evaluated[: self._size]
+
+    def pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the contents of this list as views of x and y values.
+
+        Returns:
+            Matrix of x values and array of y values.
+        """
+        return self.x(), self.y()
+
+    def view(self) -> ColumnarPointList:
+        """
+        Get a list sharing the buffers of this one. Points appended later to this list
+        are not visible in the view.
+
+        Returns:
+            ColumnarPointList viewing the current points.
+        """
+        return self[:]
+
+    def only_evaluated(self) -> ColumnarPointList:
+        """
+        Return list of only those points that have been evaluated.
+
+        Returns:
+            List containing evaluated points.
+        """
+        mask = self.is_evaluated()
+        return ColumnarPointList.from_arrays(
+            self.x()[mask] if self._has_x else None,
+            self.y()[mask],
+            mask[mask],
+        )
+
+    def _point(self, index: int) -> Point:
+        """
+        Materialize a single point of the list.
+
+        Args:
+            index: Index of the point.
+
+        Returns:
+            New Point object with values of the point.
+        """
+        y = self._ys[index]
+        return Point(
+            x=self._xs[index].copy() if self._has_x else None,
+            y=None if np.isnan(y) else float(y),
+            is_evaluated=bool(self._is_evaluated[index]),
+        )
+
+    @property
+    def points(self) -> list[Point]:
+        """
+        The points of this list, materialized as Point objects.
+        """
+        return list(self)
+
+    # magic methods for list abstraction
+    def __iter__(self) -> Iterator[Point]:
+        return (self._point(i) for i in range(self._size))
+
+    @overload
+    def __getitem__(self, index: int) -> Point: ...
+    @overload
+    def __getitem__(self, index: slice) -> ColumnarPointList: ...
+    def __getitem__(self, index: int | slice) -> Point | ColumnarPointList:
+        """
+        Allows indexing and slicing this object like a list.
+
+        Args:
+            index: The index or slice of objects to fetch.
+
+        Returns:
+            A single materialized Point object for integer index,
+                or a new ColumnarPointList sharing the buffers for slicing.
+        """
+        if isinstance(index, slice):
+            new_list = ColumnarPointList.from_arrays(
+                self.x()[index] if self._has_x else None,
+                self.y()[index],
+                self.is_evaluated()[index],
+                copy=False,
+            )
+            return new_list
+
+        if not -self._size <= index < self._size:
+            raise IndexError("ColumnarPointList index out of range")
+        return self._point(index % self._size)
+
+    def __len__(self) -> int:
+        """
+        Return number of points stored in the list.
+
+        Returns:
+            Number of points stored in the list.
+        """
+        return self._size
+
+    def __contains__(self, point: Point) -> bool:
+        """
+        Check if a point with the same x value is in the list.
+
+        Args:
+            point: Point to look for.
+
+        Returns:
+            True if a point with equal x is in the list.
+        """
+        assert point.x is not None
+        if self._size == 0 or not self._has_x or point.dim() != self._dim:
+            return False
+        return bool(np.any(np.all(self.x() == point.x, axis=1)))
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Trim unused buffer capacity before pickling.
+
+        Returns:
+            State of the object.
+        """
+        state = self.__dict__.copy()
+        state["_xs"] = self.x().copy()
+        state["_ys"] = self.y().copy()
+        state["_is_evaluated"] = self.is_evaluated().copy()
+        return state
+
+    # fancy methods
+    def rank(self, *, reverse: bool = False) -> None:
+        """
+        Sort points by y value in place ascending. Sorting is stable and points with
+        missing y values are placed last.
+
+        Args:
+            reverse: If true, sorting is done descending. Default False.
+        """
+        ys = self.y()
+        order = np.argsort(-ys if reverse else ys, kind="stable")
+        self._xs = self.x()[order]
+        self._ys = ys[order]
+        self._is_evaluated = self.is_evaluated()[order]
+        self.invalidate_best()
+
+    def x_difference(
+        self, other: PointList | ColumnarPointList, tolerance: float | None = None
+    ) -> ColumnarPointList:
+        """
+        Return list of points in self that do not appear in other based on their x values.
+
+        Args:
+            other: Another list of points to compare against.
+            tolerance: If provided, x values are quantized to a grid with this spacing
+                before comparing. Default None, x values are compared exactly.
+
+        Returns:
+            List of points in self that are not in other.
+        """
+        mask = ~other.index(tolerance).contains_array(self.x())
+        return ColumnarPointList.from_arrays(
+            self.x()[mask], self.y()[mask], self.is_evaluated()[mask]
+        )
+
+    def index(self, tolerance: float | None = None) -> PointIndex:
+        """
+        Build a hash index of points in this list for fast membership queries.
+        The index is a snapshot, points added to the list later are not indexed.
+
+        Args:
+            tolerance: If provided, x values are quantized to a grid with this spacing.
+                Default None, x values are compared exactly.
+
+        Returns:
+            Index of points in this list, with positions equal to indices in the list.
+        """
+        return PointIndex.from_array(self.x(), tolerance)
+
+    def remove_x(self) -> None:
+        """
+        Drop x values of points. This is done to save memory since xs are rarely used.
+        """
+        self._has_x = False
+        self._xs = np.empty((len(self._ys), 0), dtype=np.float64)
+
+    # best value getters and similar methods
+    def invalidate_best(self) -> None:
+        """
+        Drop the running best-so-far state, so that it's recomputed on the next lookup.
+        Call it after writing to the arrays returned by y().
+        """
+        self._best_scanned = 0
+        self._best_index = None
+
+    def _update_best(self) -> int | None:
+        """
+        Update the running best-so-far state with points added since the last lookup
+        and return the index of the best point.
+
+        Returns:
+            The index of the point with the lowest y value, None if there is none.
+        """
+        if self._best_scanned > self._size:
+            self.invalidate_best()
+
+        new_ys = self._ys[self._best_scanned : self._size]
+        if len(new_ys) > 0 and not np.all(np.isnan(new_ys)):
+            new_best = self._best_scanned + int(np.nanargmin(new_ys))
+            if (
+                self._best_index is None
+                or self._ys[new_best] < self._ys[self._best_index]
+            ):
+                self._best_index = new_best
+
+        self._best_scanned = self._size
+        return self._best_index
+
+    def best(self) -> Point:
+        """
+        Get the best point by y value from the list.
+
+        Returns:
+            The Point with the lowest y value in the list.
+        """
+        return self._point(self.best_index())
+
+    def best_index(self) -> int:
+        """
+        Get the index of the best point by y value in the list.
+
+        Raises:
+            ValueError: If the list has no y values.
+
+        Returns:
+            The index of the point with the lowest y value.
+        """
+        best_index = self._update_best()
+        if best_index is None:
+            raise ValueError("best_index() of a list without y values.")
+        return best_index
+
+    def best_y(self) -> float:
+        """
+        Get the best y value found. If list is empty, infinity is returned.
+
+        Returns:
+            The best y value found.
+        """
+        best_index = self._update_best()
+        if best_index is None:
+            return np.inf
+        return float(self._ys[best_index])
+
+    def slice_to_best(self) -> ColumnarPointList:
+        """
+        Return a list of all points up to the best in the list, including the best.
+
+        Returns:
+            List of points up to the best point.
+        """
+        return self[: self.best_index() + 1]
@@ -2,22 +2,30 @@
 Class containing information about an optimization run.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 import numpy as np
-import pandas as pd
-import scipy
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .bounds import Bounds
+from .columnar_point_list import ColumnarPointList
 from .function_metadata import FunctionMetadata
 from .optimizer_metadata import OptimizerMetadata
 from .point_list import PointList
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class OptimizationRun(BaseModel):
     """
     Dataclass containing information about an optimization run.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     model_metadata: OptimizerMetadata
     "Metadata describing the model used in optimization."
 
@@ -30,8 +38,26 @@ class OptimizationRun(BaseModel):
     tolerance: float
     "Tolerated error value to stop the search."
 
-    logs: list[PointList]
-    "Logs of points from the optimization runs."
+    logs: list[PointList | ColumnarPointList]
+    "Logs of points from the optimization runs, columnar when loaded from npz files."
+
+    seed: int | None = None
+    "Entropy of the root SeedSequence the seeds of the runs were spawned from."
+
+    run_seeds: list[int] | None = None
+    "Seeds of the global numpy random generator used in each run, in order of logs."
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """
+        Restore the object from pickle. Runs pickled before seeds were recorded
+        get None as their seeds.
+
+        Args:
+            state: Pickled state of the object.
+        """
+        state["__dict__"].setdefault("seed", None)
+        state["__dict__"].setdefault("run_seeds", None)
+        super().__setstate__(state)
 
     def bests_y(self, raw_values: bool = False) -> list[float]:
         """
@@ -67,6 +93,10 @@ class OptimizationRun(BaseModel):
         :Returns:
             pd.DataFrame: Dataframe containing stats and summary of the run.
         """
+        # imported here, so that pandas and scipy are not imported with optilab
+        import pandas as pd
+        import scipy
+
         return pd.DataFrame(
             {
                 "model": [self.model_metadata.name],
@@ -0,0 +1,189 @@
+"""
+Hash index of points by their x values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from .point import Point
+
+
+class PointIndex:
+    """
+    Hash index of points by their x values, allowing membership queries in O(1).
+
+    In exact mode the float64 buffer of x is hashed, so two points match if their x
+    values are equal element by element, like in Point.__eq__. In quantized mode
+    x is divided by the tolerance and rounded to the nearest integer before hashing,
+    so two points match if they fall into the same cell of a grid with spacing
+    equal to tolerance.
+    """
+
+    def __init__(self, tolerance: float | None = None) -> None:
+        """
+        Class constructor.
+
+        Args:
+            tolerance: Spacing of the quantization grid. If None, x values are compared
+                exactly.
+
+        Raises:
+            ValueError: If tolerance is not positive.
+        """
+        if tolerance is not None and not tolerance > 0:
+            raise ValueError(f"Tolerance must be positive, got {tolerance}.")
+
+        self.tolerance = tolerance
+        self._indices: dict[bytes, int] = {}
+        self._size = 0
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[Point], tolerance: float | None = None
+    ) -> PointIndex:
+        """
+        Alternative constructor that indexes all points of a list.
+
+        Args:
+            points: The points to index, for example a PointList.
+            tolerance: Spacing of the quantization grid. If None, x values are compared
+                exactly.
+
+        Returns:
+            Index of the given points.
+        """
+        index = cls(tolerance)
+        index.extend(points)
+        return index
+
+    @classmethod
+    def from_array(cls, xs: np.ndarray, tolerance: float | None = None) -> PointIndex:
+        """
+        Alternative constructor that indexes rows of a matrix of x values.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim).
+            tolerance: Spacing of the quantization grid. If None, x values are compared
+                exactly.
+
+        Returns:
+            Index of the given x values.
+        """
+        index = cls(tolerance)
+        index.add_array(xs)
+        return index
+
+    def _keys(self, xs: np.ndarray) -> list[bytes]:
+        """
+        Compute hash keys of rows of a matrix of x values.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim).
+
+        Returns:
+            List of n keys.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        if self.tolerance is None:
+            # adding zero turns -0.0 into 0.0, which are equal but differ in bytes
+            normalized = xs + 0.0
+        else:
+            normalized = np.rint(xs / self.tolerance).astype(np.int64)
+        return [row.tobytes() for row in normalized]
+
+    def key(self, x: np.ndarray) -> bytes:
+        """
+        Compute the hash key of a single x value. Points with equal keys are considered
+        equal by this index.
+
+        Args:
+            x: 1D vector of x values.
+
+        Returns:
+            The hash key.
+        """
+        return self._keys(np.asarray(x)[np.newaxis, :])[0]
+
+    # adding points to the index
+    def add(self, point: Point) -> None:
+        """
+        Add a point to the index. Its position is the number of points added before.
+
+        Args:
+            point: The point to add.
+        """
+        assert point.x is not None
+        self.add_array(point.x[np.newaxis, :])
+
+    def add_array(self, xs: np.ndarray) -> None:
+        """
+        Add a matrix of x values to the index, row by row.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim).
+        """
+        for key in self._keys(xs):
+            self._indices.setdefault(key, self._size)
+            self._size += 1
+
+    def extend(self, points: Iterable[Point]) -> None:
+        """
+        Add multiple points to the index.
+
+        Args:
+            points: The points to add.
+        """
+        for point in points:
+            self.add(point)
+
+    # querying the index
+    def index_of(self, point: Point) -> int | None:
+        """
+        Find the position of the first indexed point matching the given point.
+
+        Args:
+            point: The point to look for.
+
+        Returns:
+            Position of the first matching point, None if there is none.
+        """
+        assert point.x is not None
+        return self._indices.get(self.key(point.x))
+
+    def contains_array(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Check which rows of a matrix of x values are in the index.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim).
+
+        Returns:
+            Boolean mask of length n, True for rows present in the index.
+        """
+        return np.array(
+            [key in self._indices for key in self._keys(xs)], dtype=bool
+        ).reshape(len(xs))
+
+    def __contains__(self, point: Point) -> bool:
+        """
+        Check if a matching point is in the index.
+
+        Args:
+            point: The point to look for.
+
+        Returns:
+            True if a matching point was indexed.
+        """
+        return self.index_of(point) is not None
+
+    def __len__(self) -> int:
+        """
+        Return the number of points added to the index.
+
+        Returns:
+            Number of points added to the index.
+        """
+        return self._size
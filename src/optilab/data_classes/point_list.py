@@ -4,12 +4,13 @@ Class holding a list of points.
 
 from __future__ import annotations
 
-from typing import Iterator, overload
+from typing import Any, Iterator, overload
 
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from .point import Point
+from .point_index import PointIndex
 
 
 class PointList(BaseModel):
@@ -21,6 +22,24 @@ class PointList(BaseModel):
     points: list[Point]
     "The list of points"
 
+    _best_cache: tuple[list[Point], int, int, float] | None = PrivateAttr(default=None)
+    """
+    Running best-so-far state: the list of points it refers to, the number of points
+    already scanned, index of the best point and its y value. It's not pickled.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute of the list. Assigning points drops the best-so-far state.
+
+        Args:
+            name: Name of the attribute.
+            value: New value of the attribute.
+        """
+        super().__setattr__(name, value)
+        if name == "points":
+            self.invalidate_best()
+
     # alternative constructors
     @classmethod
     def from_list(cls, xs: list[np.ndarray]) -> PointList:
@@ -46,6 +65,7 @@ class PointList(BaseModel):
             new_point: Point to append to this object.
         """
         self.points.append(new_point)
+        self._scan_best()
 
     def extend(self, new_points: PointList) -> None:
         """
@@ -55,6 +75,7 @@ class PointList(BaseModel):
             new_points: A list of point to append to this object.
         """
         self.points.extend(new_points.points)
+        self._scan_best()
 
     # getting point values
     def x(self) -> np.ndarray:
@@ -128,6 +149,42 @@ class PointList(BaseModel):
         """
         return len(self.points)
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare two lists point by point, ignoring the cached best-so-far state.
+
+        Args:
+            other: Object to compare against.
+
+        Returns:
+            True if other is a PointList with equal points.
+        """
+        if not isinstance(other, PointList):
+            return NotImplemented
+        return self.points == other.points
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """
+        Get the state of the object to pickle, without the best-so-far state.
+        Such state can also be loaded by versions from before it was introduced.
+
+        Returns:
+            Pickled state of the object.
+        """
+        state = super().__getstate__()
+        state["__pydantic_private__"] = None
+        return state
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """
+        Restore the object from pickle, with an empty best-so-far state.
+
+        Args:
+            state: Pickled state of the object.
+        """
+        super().__setstate__(state)
+        self.__pydantic_private__ = {"_best_cache": None}
+
     # fancy methods
     def rank(self, *, reverse: bool = False) -> None:
         """
@@ -139,25 +196,46 @@ class PointList(BaseModel):
         self.points = list(
             sorted(self.points, key=lambda point: point.y, reverse=reverse)
         )
+        self.invalidate_best()
 
-    def x_difference(self, other: PointList) -> PointList:
+    def x_difference(
+        self, other: PointList, tolerance: float | None = None
+    ) -> PointList:
         """
         Return list of points in self that do not appear in other based on their x values.
+        Points of other are hashed into a PointIndex, so the cost is linear.
 
         Args:
             other: Another PointList to compare against.
+            tolerance: If provided, x values are quantized to a grid with this spacing
+                before comparing. Default None, x values are compared exactly.
 
         Returns:
             List of points in self that are not in other.
         """
+        other_index = other.index(tolerance)
         return PointList(
             points=[
                 point_self
                 for point_self in self.points
-                if point_self not in other.points
+                if point_self not in other_index
             ]
         )
 
+    def index(self, tolerance: float | None = None) -> PointIndex:
+        """
+        Build a hash index of points in this list for fast membership queries.
+        The index is a snapshot, points added to the list later are not indexed.
+
+        Args:
+            tolerance: If provided, x values are quantized to a grid with this spacing.
+                Default None, x values are compared exactly.
+
+        Returns:
+            Index of points in this list, with positions equal to indices in the list.
+        """
+        return PointIndex.from_points(self.points, tolerance)
+
     def remove_x(self) -> None:
         """
         Set x values of points to None. This is done to save memory since xs are rarely used.
@@ -166,23 +244,76 @@ class PointList(BaseModel):
             point.remove_x()
 
     # best value getters and similar methods
+    def invalidate_best(self) -> None:
+        """
+        Drop the running best-so-far state, so that it's recomputed on the next lookup.
+        Call it after modifying the points list in place other than by appending,
+        or after modifying y values of points already in the list.
+        """
+        self._best_cache = None
+
+    def _scan_best(self) -> int | None:
+        """
+        Update the running best-so-far state with points added since the last update.
+        Appending and extending the list keep the state up to date, so lookups take O(1).
+        Points appended directly to the points list are scanned on the next lookup.
+        The whole list is rescanned after the state was dropped, or if the list shrunk
+        or its best point changed. Points with missing y values are skipped.
+
+        Returns:
+            The index of the point with the lowest y value, None if there is none.
+        """
+        points = self.points
+        cache = self._best_cache
+        start, best_index, best_y = 0, None, np.inf
+
+        if cache is not None:
+            cached_points, scanned, cached_index, cached_y = cache
+            if (
+                cached_points is points
+                and scanned <= len(points)
+                and points[cached_index].y == cached_y
+            ):
+                start, best_index, best_y = scanned, cached_index, cached_y
+
+        for i in range(start, len(points)):
+            y = points[i].y
+            if y is not None and (best_index is None or y < best_y):
+                best_index, best_y = i, y
+
+        if best_index is None:
+            self._best_cache = None
+            return None
+
+        self._best_cache = (points, len(points), best_index, best_y)
+        return best_index
+
     def best(self) -> Point:
         """
         Get the best point by y value from the PointList.
 
+        Raises:
+            ValueError: If the list has no points with y values.
+
         Returns:
             The Point with the lowest y value in the list.
         """
-        return min(self.points, key=lambda point: point.y)
+        return self.points[self.best_index()]
 
     def best_index(self) -> int:
         """
         Get the index of the best point by y value in the PointList.
 
+        Raises:
+            ValueError: If the list has no points with y values.
+
         Returns:
             The index of the point with the lowest y value.
         """
-        return min(range(len(self.points)), key=lambda i: self.points[i].y)
+        best_index = self._scan_best()
+        if best_index is None:
+            raise ValueError("best_index() of a list without y values.")
+        return best_index
 
     def best_y(self) -> float:
         """
@@ -191,7 +322,12 @@ class PointList(BaseModel):
         Returns:
             The best y value found.
         """
-        return min((point.y for point in self.points), default=np.inf)
+        best_index = self._scan_best()
+        if best_index is None:
+            return np.inf
+        y = self.points[best_index].y
+        assert y is not None
+        return y
 
     def slice_to_best(self) -> PointList:
         """
@@ -0,0 +1,152 @@
+"""
+Fixed-capacity, array-backed ring buffer of the last points added to it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .columnar_point_list import ColumnarPointList
+from .point_list import PointList
+
+
+class PointRingBuffer:
+    """
+    Fixed-capacity, array-backed ring buffer of the last points added to it, used as
+    a sliding training window of surrogate functions. When the buffer is full, adding
+    a point overwrites the oldest one.
+
+    The buffer is mirrored: every value is written both at its position in the ring
+    and capacity rows further, so the current contents are always a contiguous slice
+    of the arrays. This way view() returns the window without copying, at the cost
+    of writing each value twice. A view is valid only until the next extend().
+    """
+
+    def __init__(self, capacity: int, dim: int | None = None) -> None:
+        """
+        Class constructor.
+
+        Args:
+            capacity: Max number of points kept in the buffer.
+            dim: Dimensionality of the points. If None, it's deduced from the first
+                added points.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError(f"Buffer capacity must be positive, got {capacity}.")
+
+        self.capacity = capacity
+        self._dim = dim
+        self._head = 0
+        self._size = 0
+        self._xs = np.empty((2 * capacity, dim or 0), dtype=np.float64)
+        self._ys = np.empty(2 * capacity, dtype=np.float64)
+        self._is_evaluated = np.empty(2 * capacity, dtype=bool)
+
+    def extend(self, new_points: PointList | ColumnarPointList) -> None:
+        """
+        Add points to the buffer, dropping the oldest points that don't fit in it.
+
+        Args:
+            new_points: Points to add.
+
+        Raises:
+            ValueError: If dimensionality of the points doesn't match the buffer.
+        """
+        if len(new_points) == 0:
+            return
+
+        xs = new_points.x()[-self.capacity :]
+        if isinstance(new_points, ColumnarPointList):
+            ys = new_points.y()[-self.capacity :]
+            is_evaluated = new_points.is_evaluated()[-self.capacity :]
+        else:
+            points = new_points.points[-self.capacity :]
+            ys = np.array(
+                [np.nan if point.y is None else point.y for point in points],
+                dtype=np.float64,
+            )
+            is_evaluated = np.array(
+                [point.is_evaluated for point in points], dtype=bool
+            )
+
+        if xs.ndim != 2 or (self._dim is not None and xs.shape[1] != self._dim):
+            raise ValueError(
+                f"Dimensionality of the points doesn't match the buffer. "
+                f"Expected {self._dim}, got {xs.shape[1:]}."
+            )
+        if self._dim is None:
+            self._dim = xs.shape[1]
+            self._xs = np.empty((2 * self.capacity, self._dim), dtype=np.float64)
+
+        positions = (self._head + np.arange(len(xs))) % self.capacity
+        for offset in (0, self.capacity):
+            self._xs[positions + offset] = xs
+            self._ys[positions + offset] = ys
+            self._is_evaluated[positions + offset] = is_evaluated
+
+        self._head = (self._head + len(xs)) % self.capacity
+        self._size = min(self._size + len(xs), self.capacity)
+
+    def _window(self) -> slice:
+        """
+        Get the slice of the mirrored arrays holding the contents of the buffer.
+
+        Returns:
+            Slice of the current window.
+        """
+        start = (self._head - self._size) % self.capacity
+        return slice(start, start + self._size)
+
+    def x(self) -> np.ndarray:
+        """
+        Get x values of points in the buffer, from the oldest. The result is a view.
+
+        Returns:
+            Matrix of shape (n, dim) containing x values of all points.
+        """
+        return self._xs[self._window()]
+
+    def y(self) -> np.ndarray:
+        """
+        Get y values of points in the buffer, from the oldest. The result is a view.
+
+        Returns:
+            Array of y values of all points, NaN where the value is missing.
+        """
+        return self._ys[self._window()]
+
+    def pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the contents of the buffer as views of x and y values.
+
+        Returns:
+            Matrix of x values and array of y values.
+        """
+        return self.x(), self.y()
+
+    def view(self) -> ColumnarPointList:
+        """
+        Get the contents of the buffer as a list of points sharing its arrays.
+
+        Returns:
+            ColumnarPointList viewing the points in the buffer, from the oldest.
+        """
+        window = self._window()
+        return ColumnarPointList.from_arrays(
+            self._xs[window],
+            self._ys[window],
+            self._is_evaluated[window],
+            copy=False,
+        )
+
+    def __len__(self) -> int:
+        """
+        Return number of points stored in the buffer.
+
+        Returns:
+            Number of points stored in the buffer.
+        """
+        return self._size
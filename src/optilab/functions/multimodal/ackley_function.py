@@ -4,7 +4,6 @@ The ackley objective function
 
 import numpy as np
 
-from ...data_classes import Point
 from ..objective_function import ObjectiveFunction
 
 
@@ -22,32 +21,19 @@ class AckleyFunction(ObjectiveFunction):
         """
         super().__init__("ackley", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-        function_value = (
+        return (
             20
-            - 20
-            * np.exp(-0.2 * np.sqrt(sum(x_i**2 for x_i in point.x) / self.metadata.dim))
+            - 20 * np.exp(-0.2 * np.sqrt(np.mean(xs**2, axis=1)))
             + np.e
-            - np.exp(
-                sum(np.cos(2 * np.pi * x_i) for x_i in point.x) / self.metadata.dim
-            )
-        )
-        return Point(
-            x=point.x,
-            y=function_value,
-            is_evaluated=True,
+            - np.exp(np.mean(np.cos(2 * np.pi * xs), axis=1))
         )
@@ -4,7 +4,6 @@ The rastrigin objective function
 
 import numpy as np
 
-from ...data_classes import Point
 from ..objective_function import ObjectiveFunction
 
 
@@ -22,24 +21,14 @@ class RastriginFunction(ObjectiveFunction):
         """
         super().__init__("rastrigin", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-
-        return Point(
-            x=point.x,
-            y=sum(x_i**2 - 10 * np.cos(2 * np.pi * x_i) + 10 for x_i in point.x),
-            is_evaluated=True,
-        )
+        return np.sum(xs**2 - 10 * np.cos(2 * np.pi * xs) + 10, axis=1)
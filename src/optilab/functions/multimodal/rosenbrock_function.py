@@ -2,7 +2,8 @@
 The rosenbrock objective function
 """
 
-from ...data_classes import Point
+import numpy as np
+
 from ..objective_function import ObjectiveFunction
 
 
@@ -20,28 +21,16 @@ class RosenbrockFunction(ObjectiveFunction):
         """
         super().__init__("rosenbrock", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-
-        function_value = sum(
-            100 * (x_i**2 - x_i_next) ** 2 + (x_i - 1) ** 2
-            for x_i, x_i_next in zip(point.x, point.x[1:])
-        )
-        return Point(
-            x=point.x,
-            y=function_value,
-            is_evaluated=True,
+        return np.sum(
+            100 * (xs[:, :-1] ** 2 - xs[:, 1:]) ** 2 + (xs[:, :-1] - 1) ** 2, axis=1
         )
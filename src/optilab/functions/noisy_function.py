@@ -47,7 +47,32 @@ class NoisyFunction(ObjectiveFunction):
         """
         super().__call__(point)
         evaluated_point = self.function(point)
-        evaluated_point.x *= 1 + self.metadata.hyperparameters[
-            "noise"
-        ] * np.random.normal(0, 1)
-        return evaluated_point
+        assert evaluated_point.y is not None
+        return Point(
+            x=evaluated_point.x,
+            y=evaluated_point.y
+            * (1 + self.metadata.hyperparameters["noise"] * np.random.normal(0, 1)),
+            is_evaluated=evaluated_point.is_evaluated,
+        )
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a batch of points with the objective function, drawing independent noise
+        for every point.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            ValueError: If dimensionality of x doesn't match the dimensionality of the function.
+
+        Returns:
+            Array of n noisy function values.
+        """
+        xs = self._validate_batch(xs)
+        ys = self.function.evaluate_batch(xs)
+        return ys * (
+            1
+            + self.metadata.hyperparameters["noise"]
+            * np.random.normal(0, 1, size=len(ys))
+        )
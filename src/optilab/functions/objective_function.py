@@ -4,12 +4,18 @@ Base class representing a callable objective function.
 
 from typing import Any
 
-from ..data_classes import FunctionMetadata, Point
+import numpy as np
+
+from ..data_classes import FunctionMetadata, Point, PointList
 
 
 class ObjectiveFunction:
     """
     Base class representing a callable objective function.
+
+    Functions given by a vectorized formula only implement _kernel, which __call__
+    and evaluate_batch dispatch to. Other functions override __call__, calling
+    super().__call__ first to validate the point.
     """
 
     def __init__(
@@ -33,9 +39,34 @@ class ObjectiveFunction:
         )
         self.num_calls = 0
 
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Vectorized kernel of the function, evaluating a validated batch of points.
+
+        Args:
+            xs: Matrix of x values of shape (n, dim).
+
+        Raises:
+            NotImplementedError: If the function doesn't have a vectorized kernel.
+
+        Returns:
+            Array of n function values.
+        """
+        raise NotImplementedError
+
+    def _has_kernel(self) -> bool:
+        """
+        Check if the function implements the vectorized kernel.
+
+        Returns:
+            True if _kernel is overridden by the class of the function.
+        """
+        return type(self)._kernel is not ObjectiveFunction._kernel
+
     def __call__(self, point: Point) -> Point:
         """
-        Validate point dimensionality and increment call counter.
+        Validate point dimensionality and increment call counter. If the function
+        has a vectorized kernel, the point is evaluated with it.
 
         Args:
             point: Point to evaluate.
@@ -44,7 +75,8 @@ class ObjectiveFunction:
             ValueError: If dimensionality of x doesn't match self.dim
 
         Returns:
-            The validated point (subclasses return a new evaluated Point).
+            Evaluated point if the function has a vectorized kernel, otherwise
+            the validated point (subclasses return a new evaluated Point).
         """
         assert point.x is not None
         if not len(point.x) == self.metadata.dim:
@@ -53,4 +85,80 @@ class ObjectiveFunction:
                 f"of the function. Expected {self.metadata.dim}, got {len(point.x)}"
             )
         self.num_calls += 1
-        return point
+
+        if not self._has_kernel():
+            return point
+        return Point(
+            x=point.x,
+            y=float(self._kernel(point.x[np.newaxis, :])[0]),
+            is_evaluated=True,
+        )
+
+    def _validate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Validate dimensionality of a batch of points and increment call counter by the size of
+        the batch. Subclasses overriding evaluate_batch should call this method first,
+        just like they call super().__call__ when evaluating a single point.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            ValueError: If the batch is not 2D or its dimensionality doesn't match self.dim.
+
+        Returns:
+            The batch as a 2D float64 array.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        if xs.size == 0:
+            xs = xs.reshape(0, self.metadata.dim)
+        if not (xs.ndim == 2 and xs.shape[1] == self.metadata.dim):
+            raise ValueError(
+                f"The dimensionality of the provided batch is not matching the dimensionality"
+                f"of the function. Expected (n, {self.metadata.dim}), got {xs.shape}"
+            )
+        self.num_calls += len(xs)
+        return xs
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a batch of points at once. Functions with a vectorized kernel evaluate
+        the whole batch with it. For other functions, this is a thin fallback that evaluates
+        the points one by one with __call__, so it works for every objective function.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            Array of n function values.
+        """
+        if self._has_kernel():
+            return self._kernel(self._validate_batch(xs))
+        return np.array(
+            [self(Point(x=x)).y for x in np.asarray(xs, dtype=np.float64)],
+            dtype=np.float64,
+        )
+
+    def evaluate_point_list(self, points: PointList) -> PointList:
+        """
+        Evaluate all points of a PointList with a single evaluate_batch call.
+
+        Args:
+            points: Points to evaluate.
+
+        Raises:
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            New list of evaluated points.
+        """
+        ys = self.evaluate_batch(points.x())
+        return PointList(
+            points=[
+                Point(x=point.x, y=float(y), is_evaluated=True)
+                for point, y in zip(points, ys)
+            ]
+        )
@@ -2,15 +2,35 @@
 Surrogate objective functions, regressors used to estimate objective function values.
 """
 
-from .knn_surrogate_objective_function import KNNSurrogateObjectiveFunction
-from .locally_weighted_polynomial_regression import LocallyWeightedPolynomialRegression
-from .mlp_surrogate_objective_function import MLPSurrogateObjectiveFunction
-from .normalized_mlp_surrogate_objective_function import (
-    NormalizedMLPSurrogateObjectiveFunction,
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .knn_surrogate_objective_function import KNNSurrogateObjectiveFunction
+    from .locally_weighted_polynomial_regression import (
+        LocallyWeightedPolynomialRegression,
+    )
+    from .mlp_surrogate_objective_function import MLPSurrogateObjectiveFunction
+    from .normalized_mlp_surrogate_objective_function import (
+        NormalizedMLPSurrogateObjectiveFunction,
+    )
+    from .polynomial_regression import PolynomialRegression
+    from .surrogate_objective_function import SurrogateObjectiveFunction
+    from .xgboost_surrogate_objective_function import XGBoostSurrogateObjectiveFunction
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "KNNSurrogateObjectiveFunction": "knn_surrogate_objective_function",
+        "LocallyWeightedPolynomialRegression": "locally_weighted_polynomial_regression",
+        "MLPSurrogateObjectiveFunction": "mlp_surrogate_objective_function",
+        "NormalizedMLPSurrogateObjectiveFunction": "normalized_mlp_surrogate_objective_function",
+        "PolynomialRegression": "polynomial_regression",
+        "SurrogateObjectiveFunction": "surrogate_objective_function",
+        "XGBoostSurrogateObjectiveFunction": "xgboost_surrogate_objective_function",
+    },
 )
-from .polynomial_regression import PolynomialRegression
-from .surrogate_objective_function import SurrogateObjectiveFunction
-from .xgboost_surrogate_objective_function import XGBoostSurrogateObjectiveFunction
 
 __all__ = [
     "KNNSurrogateObjectiveFunction",
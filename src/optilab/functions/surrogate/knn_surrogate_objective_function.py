@@ -5,19 +5,44 @@ Surrogate Objective function using FAISS for fast KNN-based regression.
 import faiss
 import numpy as np
 
-from ...data_classes import Point, PointList
+from ...data_classes import ColumnarPointList, Point, PointList
 from .surrogate_objective_function import SurrogateObjectiveFunction
 
+KNN_INDEX_TYPES = ("flat", "hnsw", "ivf")
+"Types of FAISS indexes that can be used by the KNN surrogate."
+
+KNN_METRICS = ("l2", "inner_product")
+"Metrics by which the KNN surrogate can search for the neighbors."
+
 
 class KNNSurrogateObjectiveFunction(SurrogateObjectiveFunction):
     """
     Surrogate objective function using FAISS for fast KNN-based regression.
+
+    By default the neighbors are found with exact, brute-force search. For large training sets
+    in many dimensions, approximate search with an HNSW graph or an inverted file (IVF) index
+    can be used instead, trading some accuracy of the neighbors for speed. Neighbors can be
+    searched by euclidean distance or by inner product, which is the same as cosine similarity
+    for points normalized to unit length. In both cases, neighbors are weighted by the inverse
+    of their euclidean distance from the query point.
+
+    Points of the index are labeled with consecutive ids, so the id of a neighbor minus the id
+    of the oldest point in the training set is the position of the neighbor in the set.
+    Query points for which an approximate index finds no neighbors at all are estimated
+    with exact search instead.
     """
 
     def __init__(
         self,
         num_neighbors: int,
         train_set: PointList | None = None,
+        *,
+        index_type: str = "flat",
+        metric: str = "l2",
+        hnsw_m: int = 32,
+        hnsw_ef_search: int = 64,
+        ivf_nlist: int | None = None,
+        ivf_nprobe: int = 8,
     ) -> None:
         """
         Class constructor.
@@ -25,19 +50,104 @@ class KNNSurrogateObjectiveFunction(SurrogateObjectiveFunction):
         Args:
             num_neighbors: Number of closest neighbors to use in regression.
             train_set: Training data for the model.
+            index_type: Type of the FAISS index, "flat" for exact search, "hnsw" or "ivf"
+                for approximate search. Default "flat".
+            metric: Metric of the neighbor search, "l2" or "inner_product". Default "l2".
+            hnsw_m: Number of neighbors of a node in the HNSW graph.
+            hnsw_ef_search: Size of the candidate list of HNSW search, higher values give
+                more accurate neighbors.
+            ivf_nlist: Number of clusters of the IVF index. If None, it's the square root
+                of the training set size.
+            ivf_nprobe: Number of IVF clusters visited by a search.
+
+        Raises:
+            ValueError: If index type or metric is invalid.
         """
+        if index_type not in KNN_INDEX_TYPES:
+            raise ValueError(f"Invalid index type {index_type} in KNN surrogate!")
+        if metric not in KNN_METRICS:
+            raise ValueError(f"Invalid metric {metric} in KNN surrogate!")
+
         self.num_neighbors = num_neighbors
+        self.index_type = index_type
+        self.metric = metric
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivf_nlist = ivf_nlist
+        self.ivf_nprobe = ivf_nprobe
 
-        self.faiss_index: faiss.IndexFlatL2 | None = None
+        self.faiss_index: faiss.Index | None = None
         self.y_train: np.ndarray | None = None
+        self.squared_norms: np.ndarray | None = None
+        self._first_id = 0
+        self._num_added = 0
 
         super().__init__(
             f"FastKNN{num_neighbors}",
             train_set,
-            {"num_neighbors": num_neighbors},
+            {
+                "num_neighbors": num_neighbors,
+                "index_type": index_type,
+                "metric": metric,
+                "hnsw_m": hnsw_m,
+                "hnsw_ef_search": hnsw_ef_search,
+                "ivf_nlist": ivf_nlist,
+                "ivf_nprobe": ivf_nprobe,
+            },
+        )
+
+    def _faiss_metric(self) -> int:
+        """
+        Get the FAISS constant of the metric of the search.
+
+        Returns:
+            FAISS metric type.
+        """
+        if self.metric == "inner_product":
+            return faiss.METRIC_INNER_PRODUCT
+        return faiss.METRIC_L2
+
+    def _build_index(self, x_train: np.ndarray) -> None:
+        """
+        Build a FAISS index of given points, labeled with ids starting from the id
+        of the oldest point. The IVF index is trained on the points first, so its clusters
+        fit them.
+
+        Args:
+            x_train: Matrix of training x values of shape (n, dim), as float32.
+        """
+        dim = x_train.shape[1]
+
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dim, self.hnsw_m, self._faiss_metric())
+            index.hnsw.efSearch = self.hnsw_ef_search
+            self.faiss_index = faiss.IndexIDMap(index)
+        elif self.index_type == "ivf":
+            nlist = self.ivf_nlist or round(np.sqrt(len(x_train)))
+            nlist = max(1, min(nlist, len(x_train)))
+            quantizer = (
+                faiss.IndexFlatIP(dim)
+                if self.metric == "inner_product"
+                else faiss.IndexFlatL2(dim)
+            )
+            index = faiss.IndexIVFFlat(quantizer, dim, nlist, self._faiss_metric())
+            # by default FAISS warns about clusters smaller than 39 points
+            index.cp.min_points_per_centroid = 1
+            index.train(x_train)
+            index.nprobe = min(self.ivf_nprobe, nlist)
+            self.faiss_index = index
+        elif self.metric == "inner_product":
+            self.faiss_index = faiss.IndexIDMap(faiss.IndexFlatIP(dim))
+        else:
+            self.faiss_index = faiss.IndexIDMap(faiss.IndexFlatL2(dim))
+
+        self.faiss_index.add_with_ids(
+            x_train,
+            np.arange(self._first_id, self._first_id + len(x_train), dtype=np.int64),
         )
+        self._num_added = 0
 
-    def train(self, train_set: PointList) -> None:
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
         Train the FAISS-based KNN Surrogate function with provided data.
 
@@ -47,45 +157,178 @@ class KNNSurrogateObjectiveFunction(SurrogateObjectiveFunction):
         super().train(train_set)
 
         x_train, y_train = self.train_set.pairs()
-        x_train = np.array(x_train, dtype=np.float64)
-        y_train = np.array(y_train, dtype=np.float64)
+        x_train = np.array(x_train, dtype=np.float32)
 
-        self.faiss_index = faiss.IndexFlatL2(x_train.shape[1])
-        self.faiss_index.add(  # type: ignore
-            x_train.astype(np.float32)
-        )
-        self.y_train = y_train
+        self._first_id = 0
+        self._build_index(x_train)
+        self.y_train = np.array(y_train, dtype=np.float64)
+        self.squared_norms = np.sum(x_train.astype(np.float64) ** 2, axis=1)
 
-    def __call__(self, point: Point) -> Point:
+    def update(
+        self,
+        new_points: PointList | ColumnarPointList,
+        train_set: PointList | ColumnarPointList,
+    ) -> None:
         """
-        Estimate the function value at a given point using kNN regression.
+        Add new points to the FAISS index of a trained function, without rebuilding it.
+        Points dropped from the training set are removed from the index by their ids.
+
+        HNSW graphs don't support removal, so they are rebuilt from scratch whenever points
+        are dropped, and updating a sliding window costs as much as training. Clusters of
+        the IVF index are fitted to the points it was built from, so the index is rebuilt
+        once as many points were added as the training set holds, and the window has
+        fully turned over.
 
         Args:
-            point: Point to estimate.
+            new_points: Points appended to the training set since the last training.
+            train_set: The training set after appending the new points.
+
+        Raises:
+            ValueError: If not all new points are evaluated, their dimensionality doesn't
+                match self.dim, or the training set has more points than the old set
+                with the new points.
+        """
+        if (
+            self.faiss_index is None
+            or self.y_train is None
+            or self.squared_norms is None
+        ):
+            super().update(new_points, train_set)
+            return
+
+        num_dropped = self._replace_train_set(new_points, train_set)
+
+        if len(new_points) > 0:
+            x_new, y_new = new_points.pairs()
+            x_new = np.array(x_new, dtype=np.float32)
+            next_id = self._first_id + len(self.y_train)
+            self.faiss_index.add_with_ids(
+                x_new, np.arange(next_id, next_id + len(x_new), dtype=np.int64)
+            )
+            self.y_train = np.concatenate([self.y_train, y_new])
+            self.squared_norms = np.concatenate(
+                [self.squared_norms, np.sum(x_new.astype(np.float64) ** 2, axis=1)]
+            )
+            self._num_added += len(x_new)
+
+        if num_dropped > 0:
+            self._first_id += num_dropped
+            self.y_train = self.y_train[num_dropped:]
+            self.squared_norms = self.squared_norms[num_dropped:]
+
+        if (num_dropped > 0 and self.index_type == "hnsw") or (
+            self.index_type == "ivf" and self._num_added >= len(self.y_train)
+        ):
+            self._build_index(np.array(self.train_set.x(), dtype=np.float32))
+        elif num_dropped > 0:
+            self.faiss_index.remove_ids(
+                faiss.IDSelectorRange(self._first_id - num_dropped, self._first_id)
+            )
+
+    def _exact_search(self, xs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the neighbors of a batch of points by brute force, in the same format
+        as the search of a FAISS index.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
 
         Returns:
-            Estimated value of the function at the given point.
+            Squared euclidean distances or inner products of the neighbors
+            and their ids, both of shape (n, num_neighbors).
+        """
+        assert self.squared_norms is not None
+
+        products = xs @ np.asarray(self.train_set.x(), dtype=np.float64).T
+        if self.metric == "inner_product":
+            distances = products
+            positions = np.argsort(-products, axis=1, kind="stable")
+        else:
+            distances = (
+                np.sum(xs**2, axis=1)[:, None] + self.squared_norms - 2 * products
+            )
+            positions = np.argsort(distances, axis=1, kind="stable")
+
+        positions = positions[:, : self.num_neighbors]
+        distances = np.take_along_axis(distances, positions, axis=1)
+        return distances, positions + self._first_id
+
+    def _predict(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a validated batch with a single FAISS search.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            ValueError: If the train set is smaller than the number of neighbors.
+
+        Returns:
+            Array of n estimated function values.
         """
-        super().__call__(point)
-        assert point.x is not None
         assert self.faiss_index is not None
         assert self.y_train is not None
+        assert self.squared_norms is not None
 
         if len(self.train_set) < self.num_neighbors:
             raise ValueError("Train set length is below number of neighbors.")
 
-        x_query = np.array([point.x], dtype=np.float64)
-        distances, indices = self.faiss_index.search(  # type: ignore
-            x_query.astype(np.float32),
+        distances, labels = self.faiss_index.search(
+            xs.astype(np.float32),
             self.num_neighbors,
         )
         distances = distances.astype(np.float64)
 
+        # approximate indexes return -1 labels when fewer neighbors are found
+        missing = ~np.any(labels >= 0, axis=1)
+        if np.any(missing):
+            distances[missing], labels[missing] = self._exact_search(xs[missing])
+
+        found = labels >= 0
+        positions = np.where(found, labels - self._first_id, 0)
+
+        if self.metric == "inner_product":
+            # squared euclidean distance from the inner product
+            distances = np.maximum(
+                np.sum(xs**2, axis=1)[:, None]
+                + self.squared_norms[positions]
+                - 2 * distances,
+                0,
+            )
+
         weights = 1 / (np.sqrt(distances) + 1e-8)  # avoid division by zero
-        y_pred = np.sum(self.y_train[indices] * weights, axis=1)[0] / weights.sum()
+        weights = np.where(found, weights, 0)
+        return np.sum(self.y_train[positions] * weights, axis=1) / weights.sum(axis=1)
+
+    def __call__(self, point: Point) -> Point:
+        """
+        Estimate the function value at a given point using kNN regression.
+
+        Args:
+            point: Point to estimate.
+
+        Returns:
+            Estimated value of the function at the given point.
+        """
+        super().__call__(point)
+        assert point.x is not None
+
+        y_pred = self._predict(np.array([point.x], dtype=np.float64))[0]
 
         return Point(
             x=point.x,
             y=float(y_pred),
             is_evaluated=False,
         )
+
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a batch of points using kNN regression.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Array of n estimated function values.
+        """
+        return self._predict(self._validate_batch(xs))
@@ -4,29 +4,53 @@ Points are weighted based on mahalanobis distance from query points.
 """
 
 from collections.abc import Callable
+from typing import Any
 
 import faiss
 import numpy as np
 from sklearn.preprocessing import PolynomialFeatures
 
-from ...data_classes import Point, PointList
+from ...data_classes import ColumnarPointList, Point, PointList
 from .surrogate_objective_function import SurrogateObjectiveFunction
 
 
-def biquadratic_kernel_function(x: float) -> float:
+def biquadratic_kernel_function(x: np.ndarray | float) -> np.ndarray:
     """
-    Biquadratic weighting function.
+    Biquadratic weighting function, applied elementwise.
 
     Args:
-        x: Distance between points.
+        x: Distances between points, scaled by the bandwidth.
 
     Returns:
-        Weight value.
+        Weight values.
     """
-    if np.abs(x) >= 1:
-        return 0
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(np.abs(x) >= 1, 0.0, (1 - x**2) ** 2)
 
-    return (1 - x**2) ** 2
+
+def _vectorize_kernel(
+    kernel_function: Callable[[Any], Any],
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Make a kernel function applicable elementwise to arrays. Kernels written for single
+    values, which fail on arrays or don't return an array of the same shape, are wrapped
+    with np.vectorize.
+
+    Args:
+        kernel_function: Kernel function, either vectorized or taking a single value.
+
+    Returns:
+        Kernel function applicable to arrays.
+    """
+    probe = np.array([[0.0, 0.5], [1.0, 2.0]])
+    try:
+        with np.errstate(all="ignore"):
+            result = np.asarray(kernel_function(probe))
+        if result.shape == probe.shape:
+            return kernel_function
+    except (TypeError, ValueError):
+        pass
+    return np.vectorize(kernel_function, otypes=[np.float64])
 
 
 class LocallyWeightedPolynomialRegression(SurrogateObjectiveFunction):
@@ -41,7 +65,8 @@ class LocallyWeightedPolynomialRegression(SurrogateObjectiveFunction):
         num_neighbors: int,
         train_set: PointList | None = None,
         covariance_matrix: np.ndarray | None = None,
-        kernel_function: Callable[[float], float] = biquadratic_kernel_function,
+        kernel_function: Callable[[np.ndarray], np.ndarray]
+        | Callable[[float], float] = biquadratic_kernel_function,
     ) -> None:
         """
         Class constructor.
@@ -52,8 +77,22 @@ class LocallyWeightedPolynomialRegression(SurrogateObjectiveFunction):
             train_set: Training set for the regressor, optional.
             covariance_matrix: Covariance class used in mahalanobis distance,
                 optional. When no such matrix is provided an identity matrix is used.
-            kernel_function: Function used to assign weights to points.
+            kernel_function: Function used to assign weights to points, given distances
+                scaled by the bandwidth. Vectorized kernels are applied to whole arrays
+                of distances, kernels taking a single value are applied elementwise
+                with np.vectorize, which is much slower.
         """
+        self.kernel_function = kernel_function
+        self._vectorized_kernel = _vectorize_kernel(kernel_function)
+        self.preprocessor = PolynomialFeatures(degree=degree)
+
+        self.weights: np.ndarray | None = None
+        self.index: faiss.IndexFlatL2 | None = None
+        self.inverse_sqrt_covariance: np.ndarray | None = None
+
+        if covariance_matrix is not None:
+            self.set_covariance_matrix(covariance_matrix)
+
         self.is_ready = False
         super().__init__(
             f"locally_weighted_polynomial_regression_{degree}_degree",
@@ -61,20 +100,6 @@ class LocallyWeightedPolynomialRegression(SurrogateObjectiveFunction):
             {"degree": degree, "num_neighbors": num_neighbors},
         )
 
-        if covariance_matrix is not None:
-            self.set_covariance_matrix(covariance_matrix)
-        else:
-            self.set_covariance_matrix(np.eye(self.metadata.dim))
-
-        if train_set:
-            self.train(train_set)
-
-        self.kernel_function = kernel_function
-        self.preprocessor = PolynomialFeatures(degree=degree)
-
-        self.weights: np.ndarray | None = None
-        self.index: faiss.IndexFlatL2 | None = None
-
     def set_covariance_matrix(self, new_covariance_matrix: np.ndarray) -> None:
         """
         Setter for the covariance matrix.
@@ -87,28 +112,142 @@ class LocallyWeightedPolynomialRegression(SurrogateObjectiveFunction):
             np.linalg.cholesky(new_covariance_matrix)
         ).T
 
-    def train(self, train_set: PointList) -> None:
+        # distances in the index are measured in the transformed space, so it has
+        # to be rebuilt whenever the transform changes
+        if (
+            self.index is not None
+            and len(self.inverse_sqrt_covariance) == self.metadata.dim
+        ):
+            self._build_index()
+
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
-        Build FAISS index and preprocess data to use Mahalanobis distance.
+        Build FAISS index and preprocess data to use Mahalanobis distance. The polynomial
+        features of the training points are computed once here and shared by all
+        local models.
 
         Args:
             train_set: Training set for the function
         """
         super().train(train_set)
 
+        if (
+            self.inverse_sqrt_covariance is None
+            or len(self.inverse_sqrt_covariance) != self.metadata.dim
+        ):
+            self.set_covariance_matrix(np.eye(self.metadata.dim))
+        assert self.inverse_sqrt_covariance is not None
+
         x_train, y_train = self.train_set.pairs()
 
+        # the train set may be a view of a buffer that is overwritten later
+        self.y_train = y_train.copy()
+        self.design_matrix = self.preprocessor.fit_transform(x_train)
+        self._build_index()
+
+    def update(
+        self,
+        new_points: PointList | ColumnarPointList,
+        train_set: PointList | ColumnarPointList,
+    ) -> None:
+        """
+        Add new points to the FAISS index and the design matrix of a trained function,
+        without rebuilding them. Points dropped from the training set are removed from
+        the start of both, so they stay aligned with the training set.
+
+        Args:
+            new_points: Points appended to the training set since the last training.
+            train_set: The training set after appending the new points.
+
+        Raises:
+            ValueError: If not all new points are evaluated, their dimensionality doesn't
+                match self.dim, or the training set has more points than the old set
+                with the new points.
+        """
+        if self.index is None:
+            super().update(new_points, train_set)
+            return
+        assert self.inverse_sqrt_covariance is not None
+
+        num_dropped = self._replace_train_set(new_points, train_set)
+
+        if len(new_points) > 0:
+            x_new, y_new = new_points.pairs()
+            self.y_train = np.concatenate([self.y_train, y_new])
+            self.design_matrix = np.concatenate(
+                [self.design_matrix, self.preprocessor.transform(x_new)]
+            )
+            self.index.add(self._transform(x_new).astype(np.float32))
+
+        if num_dropped > 0:
+            self.y_train = self.y_train[num_dropped:]
+            self.design_matrix = self.design_matrix[num_dropped:]
+            self.index.remove_ids(faiss.IDSelectorRange(0, num_dropped))
+
+    def _transform(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Transform points to the space where euclidean distance is the mahalanobis distance.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Transformed batch.
+        """
+        assert self.inverse_sqrt_covariance is not None
+
         # ignore warnings about overflows and zero divisions when covariance matrix
         # is ill-conditioned
         with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
-            x_train = x_train @ self.inverse_sqrt_covariance
+            return xs @ self.inverse_sqrt_covariance
 
-        self.y_train = y_train
+    def _build_index(self) -> None:
+        """
+        Build FAISS index of the training points in the transformed space.
+        """
+        x_train = self._transform(self.train_set.x())
 
         self.index = faiss.IndexFlatL2(x_train.shape[1])
-        self.index.add(  # type: ignore
-            x_train.astype(np.float32)
+        self.index.add(x_train.astype(np.float32))
+
+    def _predict(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a validated batch. Neighbors of all query points
+        are found with a single FAISS search, and local weighted least squares problems
+        of all points are solved at once as a stack.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Array of n estimated function values.
+        """
+        assert self.index is not None
+
+        distances, indices = self.index.search(
+            self._transform(xs).astype(np.float32),
+            self.metadata.hyperparameters["num_neighbors"],
         )
+        distances = np.sqrt(distances.astype(np.float64))
+
+        bandwidth = distances[:, -1:]
+        same_location = np.isclose(bandwidth, 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.sqrt(self._vectorized_kernel(distances / bandwidth))
+        # all neighbors are at the same location - use equal weights
+        weights = np.where(same_location, 1.0, weights)
+
+        weighted_x = weights[:, :, None] * self.design_matrix[indices]
+        weighted_y = weights * self.y_train[indices]
+
+        # batched least squares, with the same cutoff of small singular values
+        # as np.linalg.lstsq
+        rcond = np.finfo(np.float64).eps * max(weighted_x.shape[1:])
+        coefficients = np.linalg.pinv(weighted_x, rcond=rcond) @ weighted_y[:, :, None]
+        coefficients = coefficients[:, :, 0]
+        self.weights = coefficients[-1] if len(coefficients) > 0 else None
+
+        return np.sum(self.preprocessor.transform(xs) * coefficients, axis=1)
 
     def __call__(self, point: Point) -> Point:
         """
@@ -126,53 +265,27 @@ class LocallyWeightedPolynomialRegression(SurrogateObjectiveFunction):
         """
         super().__call__(point)
         assert point.x is not None
-        assert self.index is not None
 
-        # ignore warnings about overflows and zero divisions when covariance matrix
-        # is ill-conditioned
-        with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
-            x_query = (
-                np.array([point.x], dtype=np.float64) @ self.inverse_sqrt_covariance
-            )
+        y_pred = self._predict(np.array([point.x], dtype=np.float64))[0]
 
-        distances, indices = self.index.search(  # type: ignore
-            x_query.astype(np.float32),
-            self.metadata.hyperparameters["num_neighbors"],
-        )
-        distances = np.sqrt(distances.astype(np.float64))
-
-        knn_x = np.array(
-            [self.train_set.points[i].x for i in indices[0]], dtype=np.float64
-        )
-        knn_y = np.array(
-            [self.train_set.points[i].y for i in indices[0]], dtype=np.float64
+        return Point(
+            x=point.x,
+            y=float(y_pred),
+            is_evaluated=False,
         )
 
-        bandwidth = distances[0][-1]
-
-        if np.isclose(bandwidth, 0):
-            # All neighbors are at the same location — use equal weights.
-            weights = np.ones(len(knn_y), dtype=np.float64)
-        else:
-            weights = np.array(
-                [np.sqrt(self.kernel_function(d / bandwidth)) for d in distances[0]],
-                dtype=np.float64,
-            )
-
-        weighted_x = weights[:, None] * self.preprocessor.fit_transform(knn_x)
-        weighted_y = weights * knn_y
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate values of a batch of points with the surrogate function, fitting
+        a local model for each point.
 
-        self.weights = np.linalg.lstsq(weighted_x, weighted_y, rcond=None)[0]
+        Args:
+            xs: Batch of x values of shape (n, dim).
 
-        y_pred = float(
-            np.dot(
-                self.preprocessor.fit_transform([point.x])[0],
-                self.weights,
-            )
-        )
+        Raises:
+            ValueError: If dimensionality of x doesn't match self.dim.
 
-        return Point(
-            x=point.x,
-            y=y_pred,
-            is_evaluated=False,
-        )
+        Returns:
+            Array of n estimated function values.
+        """
+        return self._predict(self._validate_batch(xs))
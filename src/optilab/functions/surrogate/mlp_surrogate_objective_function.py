@@ -2,16 +2,23 @@
 Surrogate objective function using sklearn MLPRegressor.
 """
 
+import warnings
+
 import numpy as np
+from sklearn.exceptions import ConvergenceWarning
 from sklearn.neural_network import MLPRegressor
 
-from ...data_classes import Point, PointList
+from ...data_classes import ColumnarPointList, Point, PointList
 from .surrogate_objective_function import SurrogateObjectiveFunction
 
 
 class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
     """
     Surrogate objective function using sklearn MLPRegressor.
+
+    By default a new network is fitted from scratch on every training. In warm start mode,
+    a trained network keeps its weights and is fitted on the new training set for a capped
+    number of epochs, which is much faster when the training set changes by a few points.
     """
 
     def __init__(
@@ -26,6 +33,8 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
         max_iter: int = 200,
         early_stopping: bool = True,
         random_seed: int | None = None,
+        warm_start: bool = False,
+        warm_start_max_iter: int = 10,
     ) -> None:
         """
         Class constructor.
@@ -40,6 +49,9 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
             max_iter: Maximum number of optimization iterations.
             early_stopping: Whether to use validation-based early stopping.
             random_seed: Seed for reproducible initialization.
+            warm_start: If true, retraining continues from weights of the trained network
+                instead of fitting a new one. Default False.
+            warm_start_max_iter: Number of epochs of a warm started training. Default 10.
         """
         self.hidden_layer_sizes = hidden_layer_sizes
         self.activation = activation
@@ -49,6 +61,8 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
         self.max_iter = max_iter
         self.early_stopping = early_stopping
         self.random_seed = random_seed
+        self.warm_start = warm_start
+        self.warm_start_max_iter = warm_start_max_iter
 
         self.model: MLPRegressor | None = None
 
@@ -66,12 +80,15 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
                 "max_iter": max_iter,
                 "early_stopping": early_stopping,
                 "random_seed": random_seed,
+                "warm_start": warm_start,
+                "warm_start_max_iter": warm_start_max_iter,
             },
         )
 
-    def train(self, train_set: PointList) -> None:
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
-        Train the MLP surrogate function with provided data.
+        Train the MLP surrogate function with provided data. In warm start mode, a trained
+        network is fitted further instead of being replaced.
 
         Args:
             train_set: Training data for the model.
@@ -80,6 +97,18 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
 
         x_train, y_train = self.train_set.pairs()
 
+        if self._can_warm_start(self.metadata.dim):
+            assert self.model is not None
+            self.model.set_params(max_iter=self.warm_start_max_iter)
+            # the capped number of epochs is expected to be reached
+            with (
+                warnings.catch_warnings(),
+                np.errstate(divide="ignore", over="ignore", invalid="ignore"),
+            ):
+                warnings.simplefilter("ignore", ConvergenceWarning)
+                self.model.fit(x_train, y_train)
+            return
+
         self.model = MLPRegressor(
             hidden_layer_sizes=self.hidden_layer_sizes,
             activation=self.activation,
@@ -89,6 +118,7 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
             max_iter=self.max_iter,
             early_stopping=self.early_stopping,
             random_state=self.random_seed,
+            warm_start=self.warm_start,
         )
 
         # ignore warnings about overflows and zero divisions when covariance matrix
@@ -96,28 +126,67 @@ class MLPSurrogateObjectiveFunction(SurrogateObjectiveFunction):
         with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
             self.model.fit(x_train, y_train)
 
-    def __call__(self, point: Point) -> Point:
+    def _can_warm_start(self, dim: int) -> bool:
         """
-        Estimate the function value at a given point using MLP regression.
+        Check if the next training continues fitting the trained network.
 
         Args:
-            point: Point to estimate.
+            dim: Dimensionality of the next training set.
 
         Returns:
-            Estimated value of the function at the given point.
+            True in warm start mode, if a network was trained on points of the same
+            dimensionality.
         """
-        super().__call__(point)
+        return (
+            self.warm_start
+            and self.model is not None
+            and getattr(self.model, "n_features_in_", None) == dim
+        )
 
-        x_query = np.array([point.x], dtype=np.float64)
+    def _predict(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a validated batch with the MLP.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
 
+        Returns:
+            Array of n estimated function values.
+        """
         # ignore warnings about overflows and zero divisions when covariance matrix
         # is ill-conditioned
         assert self.model is not None
         with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
-            y_pred = self.model.predict(x_query)[0]
+            return self.model.predict(xs)
+
+    def __call__(self, point: Point) -> Point:
+        """
+        Estimate the function value at a given point using MLP regression.
+
+        Args:
+            point: Point to estimate.
+
+        Returns:
+            Estimated value of the function at the given point.
+        """
+        super().__call__(point)
+
+        y_pred = self._predict(np.array([point.x], dtype=np.float64))[0]
 
         return Point(
             x=point.x,
             y=float(y_pred),
             is_evaluated=False,
         )
+
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a batch of points using MLP regression.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Array of n estimated function values.
+        """
+        return self._predict(self._validate_batch(xs))
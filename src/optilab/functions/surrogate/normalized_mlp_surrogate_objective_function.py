@@ -8,7 +8,7 @@ from sklearn.exceptions import ConvergenceWarning
 from sklearn.preprocessing import StandardScaler
 import numpy as np
 
-from ...data_classes import Point, PointList
+from ...data_classes import ColumnarPointList, PointList
 from .mlp_surrogate_objective_function import MLPSurrogateObjectiveFunction
 
 
@@ -22,49 +22,41 @@ class NormalizedMLPSurrogateObjectiveFunction(MLPSurrogateObjectiveFunction):
     Spearman (rank-based) metrics are invariant to the monotone y-transform.
     """
 
-    def train(self, train_set: PointList) -> None:
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
-        Fit scalers on train_set, then train the MLP on normalized data.
+        Fit scalers on train_set, then train the MLP on normalized data. A warm started
+        network keeps the scalers it was trained with, so its weights see inputs and
+        targets on the same scale.
 
         Args:
             train_set: Training data for the model.
         """
-        self._x_scaler = StandardScaler()
-        self._y_scaler = StandardScaler()
+        xs, ys = train_set.pairs()
 
-        xs = np.array([p.x for p in train_set.points])
-        ys = np.array([[p.y] for p in train_set.points])
+        if not self._can_warm_start(xs.shape[-1]):
+            self._x_scaler = StandardScaler().fit(xs)
+            self._y_scaler = StandardScaler().fit(ys[:, None])
 
-        xs_scaled = self._x_scaler.fit_transform(xs)
-        ys_scaled = self._y_scaler.fit_transform(ys).ravel()
+        xs_scaled = self._x_scaler.transform(xs)
+        ys_scaled = self._y_scaler.transform(ys[:, None]).ravel()
 
-        scaled = PointList(
-            points=[
-                Point(x=x, y=float(y), is_evaluated=True)
-                for x, y in zip(xs_scaled, ys_scaled)
-            ]
+        scaled = ColumnarPointList.from_arrays(
+            xs_scaled, ys_scaled, np.ones(len(ys_scaled), dtype=bool), copy=False
         )
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", ConvergenceWarning)
             super().train(scaled)
 
-    def __call__(self, point: Point) -> Point:
+    def _predict(self, xs: np.ndarray) -> np.ndarray:
         """
-        Scale input, predict with MLP, then inverse-transform the output.
+        Scale inputs, predict with MLP, then inverse-transform the outputs.
 
         Args:
-            point: Point to estimate.
+            xs: Batch of x values of shape (n, dim).
 
         Returns:
-            Estimated value of the function at the given point.
+            Array of n estimated function values.
         """
-        assert point.x is not None
-
-        x_scaled = self._x_scaler.transform([point.x])[0]
-        result = super().__call__(
-            Point(x=x_scaled, y=point.y, is_evaluated=point.is_evaluated)
-        )
-        y_unscaled = float(self._y_scaler.inverse_transform([[result.y]])[0][0])
-
-        return Point(x=point.x, y=y_unscaled, is_evaluated=False)
+        ys_scaled = super()._predict(self._x_scaler.transform(xs))
+        return self._y_scaler.inverse_transform(ys_scaled[:, None]).ravel()
@@ -6,7 +6,7 @@ with polynomial regression with interactions optimized using least squares.
 import numpy as np
 from sklearn.preprocessing import PolynomialFeatures
 
-from ...data_classes import Point, PointList
+from ...data_classes import ColumnarPointList, Point, PointList
 from .surrogate_objective_function import SurrogateObjectiveFunction
 
 
@@ -36,7 +36,7 @@ class PolynomialRegression(SurrogateObjectiveFunction):
             {"degree": degree},
         )
 
-    def train(self, train_set: PointList) -> None:
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
         Train the Surrogate function with provided data
 
@@ -68,3 +68,19 @@ class PolynomialRegression(SurrogateObjectiveFunction):
             y=float(self.preprocessor.transform([point.x])[0] @ self.weights),
             is_evaluated=False,
         )
+
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate values of a batch of points with the surrogate function.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            Array of n estimated function values.
+        """
+        xs = self._validate_batch(xs)
+        return self.preprocessor.transform(xs) @ self.weights
@@ -4,7 +4,9 @@ Abstract base class for surrogate objective functions.
 
 from typing import Any
 
-from ...data_classes import Point, PointList
+import numpy as np
+
+from ...data_classes import ColumnarPointList, Point, PointList
 from ..objective_function import ObjectiveFunction
 
 
@@ -37,7 +39,7 @@ class SurrogateObjectiveFunction(ObjectiveFunction):
         if train_set:
             self.train(train_set)
 
-    def train(self, train_set: PointList) -> None:
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
         Train the Surrogate function with provided data.
 
@@ -47,12 +49,61 @@ class SurrogateObjectiveFunction(ObjectiveFunction):
         Raises:
             ValueError: If not all points are evaluated.
         """
-        if not all((train_point.is_evaluated for train_point in train_set.points)):
-            raise ValueError("Not all points in the training set are evaluated!")
+        dim = self._validate_train_points(train_set)
 
         self.is_ready = True
+        self.metadata.dim = dim
+        self.train_set = train_set
+
+    def update(
+        self,
+        new_points: PointList | ColumnarPointList,
+        train_set: PointList | ColumnarPointList,
+    ) -> None:
+        """
+        Retrain the model after new points were appended to its training set. This default
+        implementation trains the model from scratch, surrogates that can add points
+        to a trained model should override it.
+
+        Args:
+            new_points: Points appended to the training set since the last training.
+            train_set: The training set after appending the new points. The oldest points
+                may have been dropped from it, for example when it's a sliding window.
+
+        Raises:
+            ValueError: If not all points are evaluated or their dimensionalities differ.
+        """
+        self.train(train_set)
+
+    def _validate_train_points(self, points: PointList | ColumnarPointList) -> int:
+        """
+        Check if training points are evaluated and share the same dimensionality.
+
+        Args:
+            points: Training points to check.
+
+        Raises:
+            ValueError: If not all points are evaluated or their dimensionalities differ.
+
+        Returns:
+            Dimensionality of the points.
+        """
+        if isinstance(points, ColumnarPointList):
+            if not np.all(points.is_evaluated()):
+                raise ValueError("Not all points in the training set are evaluated!")
+            if len(points) == 0:
+                raise ValueError(
+                    "Provided train set has x-es with different dimensionalities."
+                )
+            dim = points.x().shape[1]
+            if dim == 0:
+                raise ValueError("0-dim x values found in train set.")
+            return dim
+
+        if not all((train_point.is_evaluated for train_point in points.points)):
+            raise ValueError("Not all points in the training set are evaluated!")
 
-        dim_set = {point.dim() for point in train_set.points}
+        dim_set = {point.dim() for point in points.points}
         if not len(dim_set) == 1:
             raise ValueError(
                 "Provided train set has x-es with different dimensionalities."
@@ -61,9 +112,46 @@ class SurrogateObjectiveFunction(ObjectiveFunction):
         if 0 in dim_set:
             raise ValueError("0-dim x values found in train set.")
 
-        self.metadata.dim = list(dim_set)[0]
+        return list(dim_set)[0]
+
+    def _replace_train_set(
+        self,
+        new_points: PointList | ColumnarPointList,
+        train_set: PointList | ColumnarPointList,
+    ) -> int:
+        """
+        Replace the training set of a trained function with the same set extended with new
+        points. Used by surrogates updating their model incrementally, only the new points
+        are validated.
+
+        Args:
+            new_points: Points appended to the training set since the last training.
+            train_set: The training set after appending the new points.
+
+        Raises:
+            ValueError: If not all new points are evaluated, their dimensionality doesn't
+                match self.dim, or the training set has more points than the old set
+                with the new points.
+
+        Returns:
+            Number of points dropped from the start of the old training set followed
+            by the new points.
+        """
+        if len(new_points) > 0 and (
+            self._validate_train_points(new_points) != self.metadata.dim
+        ):
+            raise ValueError(
+                "Provided points have different dimensionality than the train set."
+            )
+
+        num_dropped = len(self.train_set) + len(new_points) - len(train_set)
+        if num_dropped < 0:
+            raise ValueError(
+                "The training set is longer than the old set with the new points."
+            )
 
         self.train_set = train_set
+        return num_dropped
 
     def __call__(self, point: Point) -> Point:
         """
@@ -82,3 +170,77 @@ class SurrogateObjectiveFunction(ObjectiveFunction):
         if not self.is_ready:
             raise NotImplementedError("The surrogate function is not trained!")
         return super().__call__(point)
+
+    def _validate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Validate a batch of points before estimation.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            NotImplementedError: If the surrogate function is not trained.
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            The batch as a 2D float64 array.
+        """
+        if not self.is_ready:
+            raise NotImplementedError("The surrogate function is not trained!")
+        return super()._validate_batch(xs)
+
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate values of a batch of points. This default implementation is a thin fallback
+        that estimates the points one by one with __call__. Surrogates with a model that can
+        predict the whole batch at once should override it.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            NotImplementedError: If the surrogate function is not trained.
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            Array of n estimated function values.
+        """
+        return super().evaluate_batch(xs)
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate values of a batch of points with predict_batch.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Raises:
+            NotImplementedError: If the surrogate function is not trained.
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            Array of n estimated function values.
+        """
+        return self.predict_batch(xs)
+
+    def evaluate_point_list(self, points: PointList) -> PointList:
+        """
+        Estimate all points of a PointList with a single predict_batch call.
+
+        Args:
+            points: Points to estimate.
+
+        Raises:
+            NotImplementedError: If the surrogate function is not trained.
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            New list of estimated points.
+        """
+        ys = self.predict_batch(points.x())
+        return PointList(
+            points=[
+                Point(x=point.x, y=float(y), is_evaluated=False)
+                for point, y in zip(points, ys)
+            ]
+        )
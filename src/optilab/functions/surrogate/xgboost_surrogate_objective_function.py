@@ -12,13 +12,18 @@ if "OMP_NUM_THREADS" not in os.environ:
 import numpy as np
 import xgboost as xgb
 
-from ...data_classes import Point, PointList
+from ...data_classes import ColumnarPointList, Point, PointList
 from .surrogate_objective_function import SurrogateObjectiveFunction
 
 
 class XGBoostSurrogateObjectiveFunction(SurrogateObjectiveFunction):
     """
     Surrogate objective function using XGBoost for gradient-boosted tree regression.
+
+    By default a new model is fitted from scratch on every training. In warm start mode,
+    boosting continues from the trained model with a few additional rounds fitted on the new
+    training set. Every refit_interval trainings the model is fitted from scratch instead,
+    so it doesn't grow without bound and trees fitted to old data are dropped.
     """
 
     def __init__(
@@ -27,6 +32,10 @@ class XGBoostSurrogateObjectiveFunction(SurrogateObjectiveFunction):
         max_depth: int = 6,
         learning_rate: float = 0.1,
         train_set: PointList | None = None,
+        *,
+        warm_start: bool = False,
+        warm_start_rounds: int = 10,
+        refit_interval: int = 5,
     ) -> None:
         """
         Class constructor.
@@ -36,11 +45,21 @@ class XGBoostSurrogateObjectiveFunction(SurrogateObjectiveFunction):
             max_depth: Maximum depth of each tree.
             learning_rate: Step size shrinkage used to prevent overfitting.
             train_set: Training data for the model.
+            warm_start: If true, retraining continues boosting from the trained model
+                instead of fitting a new one. Default False.
+            warm_start_rounds: Number of boosting rounds added by a warm started training.
+                Default 10.
+            refit_interval: Number of trainings between fits from scratch in warm
+                start mode. Default 5.
         """
         self.n_estimators = n_estimators
         self.max_depth = max_depth
         self.learning_rate = learning_rate
+        self.warm_start = warm_start
+        self.warm_start_rounds = warm_start_rounds
+        self.refit_interval = refit_interval
         self.model: xgb.XGBRegressor | None = None
+        self._num_warm_starts = 0
 
         super().__init__(
             f"XGBoost_n{n_estimators}_d{max_depth}",
@@ -49,12 +68,16 @@ class XGBoostSurrogateObjectiveFunction(SurrogateObjectiveFunction):
                 "n_estimators": n_estimators,
                 "max_depth": max_depth,
                 "learning_rate": learning_rate,
+                "warm_start": warm_start,
+                "warm_start_rounds": warm_start_rounds,
+                "refit_interval": refit_interval,
             },
         )
 
-    def train(self, train_set: PointList) -> None:
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
-        Train the XGBoost surrogate function with provided data.
+        Train the XGBoost surrogate function with provided data. In warm start mode,
+        boosting of a trained model is continued, unless it's time for a refit.
 
         Args:
             train_set: Training data for the model.
@@ -63,6 +86,24 @@ class XGBoostSurrogateObjectiveFunction(SurrogateObjectiveFunction):
 
         x_train, y_train = self.train_set.pairs()
 
+        if (
+            self.warm_start
+            and self.model is not None
+            and self.model.n_features_in_ == self.metadata.dim
+            and self._num_warm_starts + 1 < self.refit_interval
+        ):
+            self._num_warm_starts += 1
+            previous_booster = self.model.get_booster()
+            self.model = xgb.XGBRegressor(
+                n_estimators=self.warm_start_rounds,
+                max_depth=self.max_depth,
+                learning_rate=self.learning_rate,
+                verbosity=0,
+            )
+            self.model.fit(x_train, y_train, xgb_model=previous_booster)
+            return
+
+        self._num_warm_starts = 0
         self.model = xgb.XGBRegressor(
             n_estimators=self.n_estimators,
             max_depth=self.max_depth,
@@ -92,3 +133,18 @@ class XGBoostSurrogateObjectiveFunction(SurrogateObjectiveFunction):
             y=float(y_pred),
             is_evaluated=False,
         )
+
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a batch of points using XGBoost regression.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Array of n estimated function values.
+        """
+        xs = self._validate_batch(xs)
+
+        assert self.model is not None
+        return self.model.predict(xs).astype(np.float64)
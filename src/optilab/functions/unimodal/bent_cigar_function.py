@@ -2,7 +2,8 @@
 Bent Cigar objective function.
 """
 
-from ...data_classes import Point
+import numpy as np
+
 from ..objective_function import ObjectiveFunction
 
 
@@ -20,23 +21,14 @@ class BentCigarFunction(ObjectiveFunction):
         """
         super().__init__("bent_cigar", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-        return Point(
-            x=point.x,
-            y=point.x[0] ** 2 + sum(point.x[1:] ** 2) * (10**6),
-            is_evaluated=True,
-        )
+        return xs[:, 0] ** 2 + np.sum(xs[:, 1:] ** 2, axis=1) * (10**6)
@@ -2,7 +2,8 @@
 Cumulative squared sums function.
 """
 
-from ...data_classes import Point
+import numpy as np
+
 from ..objective_function import ObjectiveFunction
 
 
@@ -20,23 +21,15 @@ class CumulativeSquaredSums(ObjectiveFunction):
         """
         super().__init__("cumulative_squared_sums", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-        return Point(
-            x=point.x,
-            y=sum(sum(point.x[:i]) ** 2 for i in range(point.dim())),
-            is_evaluated=True,
-        )
+        # i-th term is the squared sum of the first i coordinates, for i in 0..dim-1
+        return np.sum(np.cumsum(xs, axis=1)[:, :-1] ** 2, axis=1)
@@ -2,7 +2,8 @@
 Increasing Weight Cigar objective function.
 """
 
-from ...data_classes import Point
+import numpy as np
+
 from ..objective_function import ObjectiveFunction
 
 
@@ -20,23 +21,14 @@ class IncreasingWeightCigar(ObjectiveFunction):
         """
         super().__init__("increasing_weight_cigar", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-        return Point(
-            x=point.x,
-            y=sum(10**i * x_i**2 for i, x_i in enumerate(point.x)),
-            is_evaluated=True,
-        )
+        return np.sum(10.0 ** np.arange(xs.shape[1]) * xs**2, axis=1)
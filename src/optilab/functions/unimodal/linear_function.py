@@ -4,7 +4,6 @@ Linear function. y is the sum of elements of x vector.
 
 import numpy as np
 
-from ...data_classes import Point
 from ..objective_function import ObjectiveFunction
 
 
@@ -22,23 +21,14 @@ class LinearFunction(ObjectiveFunction):
         """
         super().__init__("linear", dim)
 
-    def __call__(self, point: Point) -> Point:
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
         """
-        Evaluate a single point with the objective function.
+        Vectorized kernel of the function.
 
         Args:
-            point: Point to evaluate.
-
-        Raises:
-            ValueError: If dimensionality of x doesn't match self.dim.
+            xs: Matrix of x values of shape (n, dim).
 
         Returns:
-            Evaluated point.
+            Array of n function values.
         """
-        super().__call__(point)
-        assert point.x is not None
-        return Point(
-            x=point.x,
-            y=float(np.sum(point.x)),
-            is_evaluated=True,
-        )
+        return np.sum(xs, axis=1)
@@ -2,9 +2,23 @@
 Module containing metamodels.
 """
 
-from .approximate_ranking_metamodel import ApproximateRankingMetamodel
-from .iepolation_surrogate import IEPolationSurrogate
-from .top_half_metamodel import TopHalfMetamodel
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .approximate_ranking_metamodel import ApproximateRankingMetamodel
+    from .iepolation_surrogate import IEPolationSurrogate
+    from .top_half_metamodel import TopHalfMetamodel
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ApproximateRankingMetamodel": "approximate_ranking_metamodel",
+        "IEPolationSurrogate": "iepolation_surrogate",
+        "TopHalfMetamodel": "top_half_metamodel",
+    },
+)
 
 __all__ = [
     "ApproximateRankingMetamodel",
@@ -2,9 +2,9 @@
 Approximate ranking metamodel based on lmm-CMA-ES.
 """
 
-import copy
+import numpy as np
 
-from ..data_classes import PointList
+from ..data_classes import ColumnarPointList, Point, PointList, PointRingBuffer
 from ..functions import ObjectiveFunction
 from ..functions.surrogate import SurrogateObjectiveFunction
 
@@ -45,6 +45,11 @@ class ApproximateRankingMetamodel:
         self.surrogate_function = surrogate_function
 
         self.buffer_size = buffer_size
+        self.train_window: PointRingBuffer | ColumnarPointList = (
+            PointRingBuffer(buffer_size) if buffer_size else ColumnarPointList()
+        )
+
+        self._predictions: dict[int, tuple[Point, float]] = {}
 
     def init_n(self) -> None:
         """
@@ -70,6 +75,7 @@ class ApproximateRankingMetamodel:
     def __call__(self, points: PointList) -> PointList:
         """
         Approximates the values of provided points with surrogate objective function.
+        Estimates made since the last retrain of the surrogate are reused.
 
         Args:
             points: List of points to evaluate.
@@ -77,16 +83,56 @@ class ApproximateRankingMetamodel:
         Returns:
             List of evaluated points.
         """
-        return PointList(points=[self.surrogate_function(x) for x in points])
+        return PointList(
+            points=[
+                Point(x=point.x, y=float(y), is_evaluated=False)
+                for point, y in zip(points, self._estimate(points))
+            ]
+        )
 
-    def train_surrogate(self) -> None:
+    def _estimate(self, points: PointList) -> np.ndarray:
         """
-        Retrain the surrogate function with samples from the training set.
+        Estimate values of points with the surrogate function. Predictions are cached
+        by identity of the point objects until the surrogate is retrained, so only the points
+        not estimated since then are passed to the surrogate.
+
+        Args:
+            points: List of points to estimate.
+
+        Returns:
+            Array of estimated values.
+        """
+        missing = [
+            point
+            for point in points
+            if self._predictions.get(id(point), (None,))[0] is not point
+        ]
+        if missing:
+            ys = self.surrogate_function.predict_batch(
+                np.array([point.x for point in missing])
+            )
+            for point, y in zip(missing, ys):
+                self._predictions[id(point)] = (point, float(y))
+
+        return np.array(
+            [self._predictions[id(point)][1] for point in points], dtype=np.float64
+        )
+
+    def train_surrogate(self, new_points: PointList | None = None) -> None:
         """
-        if self.buffer_size:
-            self.surrogate_function.train(self.train_set[-self.buffer_size :])
+        Retrain the surrogate function with samples from the training set. Cached
+        predictions are invalidated.
+
+        Args:
+            new_points: Points appended to the training window since the last retrain.
+                If provided, the surrogate is updated with them incrementally instead
+                of being trained from scratch.
+        """
+        self._predictions.clear()
+        if new_points is not None:
+            self.surrogate_function.update(new_points, self.train_window.view())
         else:
-            self.surrogate_function.train(self.train_set)
+            self.surrogate_function.train(self.train_window.view())
 
     def evaluate(self, xs: PointList) -> PointList:
         """
@@ -99,12 +145,11 @@ class ApproximateRankingMetamodel:
         Returns:
             List of evaluated points.
         """
-        result = PointList(
-            points=[self.objective_function(point) for point in xs.points]
-        )
+        result = self.objective_function.evaluate_point_list(xs)
         self.train_set.extend(result)
+        self.train_window.extend(result)
 
-        self.train_surrogate()
+        self.train_surrogate(result)
 
         return result
 
@@ -137,48 +182,42 @@ class ApproximateRankingMetamodel:
             self.evaluate(xs)
             return
 
-        # points not evaluated in this run
-        not_evaluated = copy.deepcopy(xs)
+        # the surrogate may have been changed since the last generation
+        self._predictions.clear()
 
-        # points from current and previous loop
-        items_previous = None
-        items_current = self(xs)
-
-        # rank items
-        items_current.rank()
+        # ranking of the whole population and points not evaluated in this run
+        ranking_current = np.argsort(self._estimate(xs), kind="stable")
+        not_evaluated = ranking_current
 
         # evaluate first n_init items
-        not_evaluated = self(not_evaluated)
-        not_evaluated.rank()
-        self.evaluate(not_evaluated[: self.n_init])
+        self._evaluate_indices(xs, not_evaluated[: self.n_init])
         not_evaluated = not_evaluated[self.n_init :]
 
         num_iter = 0
         for _ in range((self.population_size - self.n_init) // self.n_step):
             # start new loop
             num_iter += 1
-            items_previous = items_current
-            items_current = self(xs)
-
-            # rank items
-            items_current.rank()
+            ranking_previous = ranking_current
+            ys = self._estimate(xs)
+            ranking_current = np.argsort(ys, kind="stable")
 
             # check if the mu ranking changed
-            if all(
-                (
-                    new_pt == pt
-                    for new_pt, pt in zip(
-                        items_previous[: self.mu],
-                        items_current[: self.mu],
-                    )
-                )
-            ):
+            if np.array_equal(ranking_previous[: self.mu], ranking_current[: self.mu]):
                 break
 
             # else evaluate n_step next items
-            not_evaluated = self(not_evaluated)
-            not_evaluated.rank()
-            self.evaluate(not_evaluated[: self.n_step])
+            not_evaluated = not_evaluated[np.argsort(ys[not_evaluated], kind="stable")]
+            self._evaluate_indices(xs, not_evaluated[: self.n_step])
             not_evaluated = not_evaluated[self.n_step :]
 
         self._update_n(num_iter)
+
+    def _evaluate_indices(self, xs: PointList, indices: np.ndarray) -> None:
+        """
+        Evaluate points of the population with given indices with the objective function.
+
+        Args:
+            xs: Solution candidates generated by the optimizer.
+            indices: Indices of the points to evaluate.
+        """
+        self.evaluate(PointList(points=[xs[index] for index in indices]))
@@ -3,20 +3,31 @@ Inter-extra-polation surrogate metamodel.
 It uses different surrogate functions for interpolation and extrapolation.
 """
 
-from scipy.spatial import ConvexHull
-from shapely.geometry import Point as ShapelyPoint
-from shapely.geometry import Polygon
+import numpy as np
+from scipy.optimize import linprog
+from scipy.spatial import ConvexHull, QhullError
 
-from ..data_classes import Point, PointList
+from ..data_classes import ColumnarPointList, Point, PointList
 from ..functions.surrogate.surrogate_objective_function import (
     SurrogateObjectiveFunction,
 )
 
+HULL_TOLERANCE = 1e-10
+"Max distance outside of the convex hull at which points are still considered inside."
+
 
 class IEPolationSurrogate(SurrogateObjectiveFunction):
     """
     Inter-extra-polation surrogate metamodel.
     It uses different surrogate functions for interpolation and extrapolation.
+
+    Points inside the convex hull of the training set are estimated with the interpolation
+    surrogate, other points with the extrapolation one. In low dimensions the hull is built
+    with Qhull, and a batch of points is checked against all its facets with a single matrix
+    product. The number of facets grows exponentially with the dimensionality, so in higher
+    dimensions, and for degenerate training sets, each point is checked by solving a linear
+    program instead: the point is inside if it's a convex combination of the training points.
+    Points on the boundary of the hull, up to HULL_TOLERANCE, count as inside.
     """
 
     def __init__(
@@ -24,6 +35,8 @@ class IEPolationSurrogate(SurrogateObjectiveFunction):
         interpolation_surrogate: SurrogateObjectiveFunction,
         extrapolation_surrogate: SurrogateObjectiveFunction,
         train_set: PointList | None = None,
+        *,
+        max_hull_dim: int = 8,
     ) -> None:
         """
         Class constructor.
@@ -32,31 +45,72 @@ class IEPolationSurrogate(SurrogateObjectiveFunction):
             interpolation_surrogate: Surrogate used for interpolation.
             extrapolation_surrogate: Surrogate used for extrapolation.
             train_set: Initial training set for the surrogates.
+            max_hull_dim: Max dimensionality in which the convex hull is built explicitly.
+                In higher dimensions linear programming is used. Default 8.
         """
-
-        super().__init__("iepolation", train_set)
-
         self.interpolation_surrogate = interpolation_surrogate
         self.extrapolation_surrogate = extrapolation_surrogate
+        self.max_hull_dim = max_hull_dim
 
-        self.convex_hull = None
+        self.hull_equations: np.ndarray | None = None
+        self.hull_points: np.ndarray | None = None
 
-        if train_set:
-            self.build_convex_hull(train_set)
+        super().__init__("iepolation", train_set, {"max_hull_dim": max_hull_dim})
 
-    def build_convex_hull(self, train_set: PointList) -> None:
+    def build_convex_hull(self, train_set: PointList | ColumnarPointList) -> None:
         """
         Builds a convex hull from the train set. This convex hull is then used to determine
-        wheather the point value should be interpolated or extrapolated.
+        wheather the point value should be interpolated or extrapolated. If the hull can't
+        be built explicitly, the training points are kept for linear programming.
 
         Args:
             train_set: Training set.
         """
-        hull = ConvexHull(train_set.x())
-        hull_points = hull.points[hull.vertices]
-        self.convex_hull = Polygon(hull_points)
+        xs = np.array(train_set.x(), dtype=np.float64)
+        self.hull_equations = None
+        self.hull_points = None
 
-    def train(self, train_set: PointList) -> None:
+        if xs.shape[1] <= self.max_hull_dim:
+            try:
+                self.hull_equations = ConvexHull(xs).equations
+                return
+            except (QhullError, ValueError):
+                pass
+
+        self.hull_points = xs
+
+    def points_in_convex_hull(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Check which points of a batch lie inside of the convex hull of training points.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Boolean array, true for points inside the convex hull or on its boundary.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+
+        if self.hull_equations is not None:
+            normals, offsets = self.hull_equations[:, :-1], self.hull_equations[:, -1]
+            return np.all(xs @ normals.T + offsets <= HULL_TOLERANCE, axis=1)
+
+        assert self.hull_points is not None
+        # find weights >= 0 of training points, summing to 1, that combine into the point
+        constraints = np.vstack([self.hull_points.T, np.ones(len(self.hull_points))])
+        costs = np.zeros(len(self.hull_points))
+        return np.array(
+            [
+                linprog(
+                    costs, A_eq=constraints, b_eq=np.append(x, 1), method="highs"
+                ).status
+                == 0
+                for x in xs
+            ],
+            dtype=bool,
+        )
+
+    def train(self, train_set: PointList | ColumnarPointList) -> None:
         """
         Train both surrogate functions with provided data.
 
@@ -78,8 +132,27 @@ class IEPolationSurrogate(SurrogateObjectiveFunction):
         Returns:
             True if the given point lies inside the convex hull, False otherwise.
         """
-        assert self.convex_hull is not None
-        return self.convex_hull.contains(ShapelyPoint(point.x))
+        assert point.x is not None
+        return bool(self.points_in_convex_hull(point.x[np.newaxis, :])[0])
+
+    def _predict(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate function values of a validated batch, each group of points with
+        its own surrogate.
+
+        Args:
+            xs: Batch of x values of shape (n, dim).
+
+        Returns:
+            Array of n estimated function values.
+        """
+        inside = self.points_in_convex_hull(xs)
+        ys = np.empty(len(xs), dtype=np.float64)
+        if np.any(inside):
+            ys[inside] = self.interpolation_surrogate.predict_batch(xs[inside])
+        if not np.all(inside):
+            ys[~inside] = self.extrapolation_surrogate.predict_batch(xs[~inside])
+        return ys
 
     def __call__(self, point: Point) -> Point:
         """
@@ -95,8 +168,28 @@ class IEPolationSurrogate(SurrogateObjectiveFunction):
             Point: Estimated point.
         """
         super().__call__(point)
+        assert point.x is not None
+
+        y_pred = self._predict(np.array([point.x], dtype=np.float64))[0]
+
+        return Point(
+            x=point.x,
+            y=float(y_pred),
+            is_evaluated=False,
+        )
+
+    def predict_batch(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Estimate values of a batch of points, using the interpolation surrogate for points
+        inside of the convex hull of training points and the extrapolation one otherwise.
 
-        if self.is_in_convex_hull(point):
-            return self.interpolation_surrogate(point)
+        Args:
+            xs: Batch of x values of shape (n, dim).
 
-        return self.extrapolation_surrogate(point)
+        Raises:
+            ValueError: If dimensionality of x doesn't match self.dim.
+
+        Returns:
+            Array of n estimated function values.
+        """
+        return self._predict(self._validate_batch(xs))
@@ -3,7 +3,7 @@ Top half metamodel. Estimates all points using the surrogate function, then
 evaluates the top mu (typically half) points with the objective function.
 """
 
-from ..data_classes import PointList
+from ..data_classes import ColumnarPointList, Point, PointList, PointRingBuffer
 from ..functions import ObjectiveFunction
 from ..functions.surrogate import SurrogateObjectiveFunction
 
@@ -47,6 +47,9 @@ class TopHalfMetamodel:
         self.surrogate_function = surrogate_function
 
         self.buffer_size = buffer_size
+        self.train_window: PointRingBuffer | ColumnarPointList = (
+            PointRingBuffer(buffer_size) if buffer_size else ColumnarPointList()
+        )
 
         self._adapted_results: PointList | None = None
 
@@ -69,7 +72,7 @@ class TopHalfMetamodel:
             result = self._adapted_results
             self._adapted_results = None
             return result
-        return PointList(points=[self.surrogate_function(x) for x in points])
+        return self.surrogate_function.evaluate_point_list(points)
 
     def adapt(self, xs: PointList) -> None:
         """
@@ -89,7 +92,7 @@ class TopHalfMetamodel:
             self._adapted_results = self.evaluate(xs)
             return
 
-        estimated = PointList(points=[self.surrogate_function(x) for x in xs])
+        estimated = self.surrogate_function.evaluate_point_list(xs)
         estimated.rank()
 
         evaluated = self.evaluate(estimated[: self.mu])
@@ -98,23 +101,30 @@ class TopHalfMetamodel:
         # penalize worst points
         assert evaluated[-1].y is not None
         penalty_y = evaluated[-1].y + 1
-        not_evaluated = estimated[self.mu :]
-
-        for point in not_evaluated:
-            point.y = penalty_y
+        not_evaluated = PointList(
+            points=[
+                Point(x=point.x, y=penalty_y, is_evaluated=point.is_evaluated)
+                for point in estimated[self.mu :]
+            ]
+        )
 
         evaluated.extend(not_evaluated)
 
         self._adapted_results = evaluated
 
-    def train_surrogate(self) -> None:
+    def train_surrogate(self, new_points: PointList | None = None) -> None:
         """
         Retrain the surrogate on the real evaluations.
+
+        Args:
+            new_points: Points appended to the training window since the last retrain.
+                If provided, the surrogate is updated with them incrementally instead
+                of being trained from scratch.
         """
-        if self.buffer_size:
-            self.surrogate_function.train(self.train_set[-self.buffer_size :])
+        if new_points is not None:
+            self.surrogate_function.update(new_points, self.train_window.view())
         else:
-            self.surrogate_function.train(self.train_set)
+            self.surrogate_function.train(self.train_window.view())
 
     def evaluate(self, xs: PointList) -> PointList:
         """
@@ -127,12 +137,11 @@ class TopHalfMetamodel:
         Returns:
             PointList of evaluated points.
         """
-        result = PointList(
-            points=[self.objective_function(point) for point in xs.points]
-        )
+        result = self.objective_function.evaluate_point_list(xs)
         self.train_set.extend(result)
+        self.train_window.extend(result)
 
-        self.train_surrogate()
+        self.train_surrogate(result)
 
         return result
 
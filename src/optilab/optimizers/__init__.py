@@ -2,15 +2,39 @@
 Submodule containing optimizers.
 """
 
-from .cma_es import CmaEs
-from .ipop_cma_es import IpopCmaEs
-from .knn_cma_es import KnnCmaEs
-from .knn_ipop_cma_es import KnnIpopCmaEs
-from .lmm_cma_es import LmmCmaEs
-from .lmm_ipop_cma_es import LmmIpopCmaEs
-from .optimizer import Optimizer
-from .top_half_knn_ipop_cma_es import TopHalfKnnIpopCmaEs
-from .top_half_polyreg_ipop_cma_es import TopHalfPolyregIpopCmaEs
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .checkpoint import RunCheckpoint
+    from .cma_es import CmaEs
+    from .executor import OptimizationExecutor
+    from .ipop_cma_es import IpopCmaEs
+    from .knn_cma_es import KnnCmaEs
+    from .knn_ipop_cma_es import KnnIpopCmaEs
+    from .lmm_cma_es import LmmCmaEs
+    from .lmm_ipop_cma_es import LmmIpopCmaEs
+    from .optimizer import Optimizer
+    from .top_half_knn_ipop_cma_es import TopHalfKnnIpopCmaEs
+    from .top_half_polyreg_ipop_cma_es import TopHalfPolyregIpopCmaEs
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "CmaEs": "cma_es",
+        "IpopCmaEs": "ipop_cma_es",
+        "KnnCmaEs": "knn_cma_es",
+        "KnnIpopCmaEs": "knn_ipop_cma_es",
+        "LmmCmaEs": "lmm_cma_es",
+        "LmmIpopCmaEs": "lmm_ipop_cma_es",
+        "OptimizationExecutor": "executor",
+        "Optimizer": "optimizer",
+        "RunCheckpoint": "checkpoint",
+        "TopHalfKnnIpopCmaEs": "top_half_knn_ipop_cma_es",
+        "TopHalfPolyregIpopCmaEs": "top_half_polyreg_ipop_cma_es",
+    },
+)
 
 __all__ = [
     "CmaEs",
@@ -19,7 +43,9 @@ __all__ = [
     "KnnIpopCmaEs",
     "LmmCmaEs",
     "LmmIpopCmaEs",
+    "OptimizationExecutor",
     "Optimizer",
+    "RunCheckpoint",
     "TopHalfKnnIpopCmaEs",
     "TopHalfPolyregIpopCmaEs",
 ]
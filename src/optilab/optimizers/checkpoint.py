@@ -0,0 +1,169 @@
+"""
+Checkpointing of optimization runs, allowing to resume interrupted optimization.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from typing import Any
+
+import numpy as np
+
+from ..functions import ObjectiveFunction
+
+
+def atomic_dump(obj: Any, path: str, pickler_class: type = pickle.Pickler) -> None:
+    """
+    Pickle an object to a file atomically. The object is written to a temporary file
+    first which then replaces the target, so an interrupted write never leaves
+    a corrupted file behind.
+
+    Args:
+        obj: The object to pickle.
+        path: Path of the target file.
+        pickler_class: Class of the pickler to use.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as tmp_file:
+        pickler_class(tmp_file, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    os.replace(tmp_path, path)
+
+
+def run_state_path(checkpoint_dir: str, run_index: int) -> str:
+    """
+    Get path of the in progress state of a run in a checkpoint directory.
+
+    Args:
+        checkpoint_dir: The checkpoint directory.
+        run_index: Index of the run.
+
+    Returns:
+        Path of the state file.
+    """
+    return os.path.join(checkpoint_dir, f"run_{run_index}.state.pkl")
+
+
+def run_log_path(checkpoint_dir: str, run_index: int) -> str:
+    """
+    Get path of the log of a finished run in a checkpoint directory.
+
+    Args:
+        checkpoint_dir: The checkpoint directory.
+        run_index: Index of the run.
+
+    Returns:
+        Path of the log file.
+    """
+    return os.path.join(checkpoint_dir, f"run_{run_index}.pkl")
+
+
+class RunCheckpoint:
+    """
+    Checkpoint of a single, in progress optimization run. Optimizers save their state
+    (for example CMA-ES instance, results log or metamodel and IPOP population size)
+    every given number of generations, together with the state of the global numpy
+    random generator. When the run is restarted with the same checkpoint, the optimizer
+    continues from the last saved generation.
+
+    The optimized function is not stored in the checkpoint. References to it are saved
+    as placeholders and replaced with the function provided on load, so heavy functions
+    are not pickled every few generations.
+    """
+
+    def __init__(
+        self, path: str, function: ObjectiveFunction, interval: int = 1
+    ) -> None:
+        """
+        Class constructor.
+
+        Args:
+            path: Path of the checkpoint file.
+            function: The optimized function.
+            interval: Number of generations between saves. Default 1, save every generation.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval < 1:
+            raise ValueError(f"Checkpoint interval must be positive, got {interval}.")
+
+        self.path = path
+        self.function = function
+        self.interval = interval
+        self._num_generations = 0
+
+    def _pickler_class(self) -> type:
+        """
+        Create pickler class that stores the optimized function as a placeholder.
+
+        Returns:
+            Subclass of pickle.Pickler.
+        """
+        function = self.function
+
+        class FunctionPickler(pickle.Pickler):
+            def persistent_id(self, obj: Any) -> str | None:
+                return "function" if obj is function else None
+
+        return FunctionPickler
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Load the saved state of the run and restore the global numpy random generator.
+
+        Returns:
+            Dictionary with the saved state of the optimizer, None if nothing was saved.
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        function = self.function
+
+        class FunctionUnpickler(pickle.Unpickler):
+            def persistent_load(self, pid: Any) -> Any:
+                if pid != "function":
+                    raise pickle.UnpicklingError(f"Unknown persistent id {pid}.")
+                return function
+
+        with open(self.path, "rb") as checkpoint_file:
+            checkpoint = FunctionUnpickler(checkpoint_file).load()
+
+        np.random.set_state(checkpoint["random_state"])
+        self.function.num_calls = checkpoint["num_calls"]
+        return checkpoint["state"]
+
+    def save(self, state: dict[str, Any]) -> None:
+        """
+        Save the state of the run immediately.
+
+        Args:
+            state: Dictionary with the state of the optimizer.
+        """
+        atomic_dump(
+            {
+                "state": state,
+                "random_state": np.random.get_state(),
+                "num_calls": self.function.num_calls,
+            },
+            self.path,
+            self._pickler_class(),
+        )
+
+    def step(self, state: dict[str, Any]) -> None:
+        """
+        Mark the end of a generation and save the state if the interval has passed.
+
+        Args:
+            state: Dictionary with the state of the optimizer.
+        """
+        self._num_generations += 1
+        if self._num_generations % self.interval == 0:
+            self.save(state)
+
+    def remove(self) -> None:
+        """
+        Remove the checkpoint file, for example when the run is finished.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -3,6 +3,7 @@ CMA-ES optimizer: Covariance Matrix Adaptation Evolution Strategy.
 """
 
 import cma
+import numpy as np
 
 from ..data_classes import Bounds, PointList
 from ..functions import ObjectiveFunction
@@ -56,24 +57,32 @@ class CmaEs(Optimizer):
         sigma0: float,
     ) -> cma.CMAEvolutionStrategy:
         """
-        Create a new instance of cma optimizer.
+        Create a new instance of cma optimizer. The starting point and the seed of cma
+        are drawn from the global numpy random generator, so seeding it makes
+        the optimizer deterministic.
 
         Args:
             bounds: The bounds of the search area.
             dim: The dimensionality of the search area.
+            population_size: Size of the population.
+            sigma0: Starting value of the sigma. For box bounds it's scaled in each
+                dimension proportionally to the width of the search space.
 
         Returns:
             A new cma optimizer instance.
         """
-        return cma.CMAEvolutionStrategy(
-            bounds.random_point(dim).x,
-            sigma0,
-            {
-                "popsize": population_size,
-                "bounds": bounds.to_list(),
-                "verbose": -9,
-            },
-        )
+        options = {
+            "popsize": population_size,
+            "bounds": bounds.to_list(),
+            "verbose": -9,
+            # cma reseeds the global generator with time unless given a seed,
+            # drawing it from the generator keeps seeded runs reproducible
+            "seed": np.random.randint(1, 2**31 - 1),
+        }
+        if bounds.dim() is not None:
+            options["CMA_stds"] = bounds.sigma_scaling(dim)
+
+        return cma.CMAEvolutionStrategy(bounds.random_point(dim).x, sigma0, options)
 
     def _stop(
         self,
@@ -136,6 +145,10 @@ class CmaEs(Optimizer):
 
         res_log = PointList(points=[])
 
+        state = self._load_state()
+        if state is not None:
+            es, res_log = state["es"], state["log"]
+
         while not self._stop(
             es,
             res_log,
@@ -145,9 +158,10 @@ class CmaEs(Optimizer):
             tolerance,
         ):
             solutions = PointList.from_list(es.ask())
-            results = PointList(points=[function(x) for x in solutions.points])
+            results = function.evaluate_point_list(solutions)
             res_log.extend(results)
             x, y = results.pairs()
             es.tell(x, y)
+            self._save_state(es=es, log=res_log)
 
         return res_log
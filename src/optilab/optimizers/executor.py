@@ -0,0 +1,208 @@
+"""
+Persistent pool of worker processes running optimizations.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from collections.abc import Iterable, Iterator
+from multiprocessing.pool import Pool
+from tempfile import TemporaryDirectory
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from ..data_classes import Bounds, PointList
+from ..functions import ObjectiveFunction
+from .checkpoint import RunCheckpoint, run_state_path
+
+if TYPE_CHECKING:
+    from .optimizer import Optimizer
+
+_MAX_CACHED_JOBS = 8
+"Maximum number of jobs kept in the memory of a single worker."
+
+_WORKER_JOBS: dict[str, bytes] = {}
+"Pickled jobs already read by this worker process, keyed by path of the job file."
+
+
+def _load_job(job_path: str) -> tuple:
+    """
+    Load a job in a worker process. The job file is read only on its first run in
+    the worker, but every run unpickles a fresh copy of its objects, so no state
+    of the optimizer or the function is carried over from previous runs.
+
+    Args:
+        job_path: Path to the pickled job.
+
+    Returns:
+        Tuple of optimizer, function, bounds, call budget, tolerance and target.
+    """
+    job = _WORKER_JOBS.get(job_path)
+    if job is None:
+        with open(job_path, "rb") as job_file:
+            job = job_file.read()
+        if len(_WORKER_JOBS) >= _MAX_CACHED_JOBS:
+            del _WORKER_JOBS[next(iter(_WORKER_JOBS))]
+        _WORKER_JOBS[job_path] = job
+    return pickle.loads(job)
+
+
+def _run_task(
+    task: tuple[str, int, int | None, str | None, int],
+) -> tuple[int, PointList]:
+    """
+    Perform a single optimization run of a job in a worker process.
+
+    Args:
+        task: Path to the pickled job, index of the run, its seed, checkpoint directory
+            and checkpoint interval.
+
+    Returns:
+        Index of the run and its results log.
+    """
+    job_path, run_index, run_seed, checkpoint_dir, checkpoint_interval = task
+    optimizer, function, bounds, call_budget, tolerance, target = _load_job(job_path)
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        checkpoint = RunCheckpoint(
+            run_state_path(checkpoint_dir, run_index), function, checkpoint_interval
+        )
+
+    return run_index, optimizer.seeded_optimize(
+        run_seed,
+        function,
+        bounds,
+        call_budget,
+        tolerance,
+        target,
+        checkpoint=checkpoint,
+    )
+
+
+class OptimizationExecutor:
+    """
+    Persistent pool of worker processes running optimizations. The workers are kept alive
+    across calls of Optimizer.run_optimization, so the pool is started only once
+    when sweeping many functions and optimizers.
+
+    Each submitted job (optimizer, function and optimization parameters) is pickled once
+    to a temporary file. The workers read it on their first run of the job and keep it
+    in memory, so only the path and the index of the run are sent with every task.
+    Every run unpickles its own copy of the job, so like in separate processes, runs
+    don't share any state of the optimizer or the function.
+    """
+
+    def __init__(self, num_processes: int = 1) -> None:
+        """
+        Class constructor, starts the worker processes.
+
+        Args:
+            num_processes: Number of worker processes. By default only one is used.
+        """
+        self.num_processes = num_processes
+        self._pool = Pool(num_processes)
+        self._job_dir = TemporaryDirectory(prefix="optilab_jobs_")
+        self._num_jobs = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def close(self) -> None:
+        """
+        Wait for the submitted runs to finish, stop the workers and remove job files.
+        """
+        self._pool.close()
+        self._pool.join()
+        self._job_dir.cleanup()
+
+    def terminate(self) -> None:
+        """
+        Stop the workers immediately and remove job files.
+        """
+        self._pool.terminate()
+        self._pool.join()
+        self._job_dir.cleanup()
+
+    def submit(
+        self,
+        optimizer: Optimizer,
+        function: ObjectiveFunction,
+        bounds: Bounds,
+        call_budget: int,
+        tolerance: float,
+        target: float = 0.0,
+    ) -> str:
+        """
+        Register a job to be run by the workers.
+
+        Args:
+            optimizer: Optimizer to run.
+            function: Objective function to optimize.
+            bounds: Search space of the function.
+            call_budget: Max number of calls to the objective function.
+            tolerance: Tolerance of y value to count a solution as acceptable.
+            target: Objective function value target, default 0.
+
+        Returns:
+            Identifier of the job, to be passed to run().
+        """
+        job_path = os.path.join(self._job_dir.name, f"job_{self._num_jobs}.pkl")
+        self._num_jobs += 1
+        with open(job_path, "wb") as job_file:
+            pickle.dump(
+                (optimizer, function, bounds, call_budget, tolerance, target),
+                job_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        return job_path
+
+    def run(
+        self,
+        job: str,
+        run_indices: Iterable[int],
+        run_seeds: Iterable[int | None] | None = None,
+        *,
+        ordered: bool = True,
+        checkpoint_dir: str | None = None,
+        checkpoint_interval: int = 10,
+    ) -> Iterator[tuple[int, PointList]]:
+        """
+        Perform optimization runs of a submitted job.
+
+        Args:
+            job: Identifier of the job returned by submit().
+            run_indices: Indices of the runs to perform.
+            run_seeds: Seeds of the global numpy random generator for each run.
+                If None, the generator is not reseeded.
+            ordered: If true, runs are returned in order of run_indices. Otherwise they
+                are returned as soon as they finish. Default True.
+            checkpoint_dir: Directory to save states of runs in progress to, and resume
+                them from. If None, no checkpoints are saved.
+            checkpoint_interval: Number of generations between saves. Default 10.
+
+        Returns:
+            Iterator of pairs of run index and results log.
+        """
+        run_indices = list(run_indices)
+        if run_seeds is None:
+            run_seeds = [None] * len(run_indices)
+        tasks = [
+            (job, index, seed, checkpoint_dir, checkpoint_interval)
+            for index, seed in zip(run_indices, run_seeds, strict=True)
+        ]
+        if ordered:
+            return self._pool.imap(_run_task, tasks)
+        return self._pool.imap_unordered(_run_task, tasks)
@@ -33,6 +33,15 @@ class IpopCmaEs(CmaEs):
         current_population_size = self.metadata.population_size
         res_log = PointList(points=[])
 
+        es = None
+        state = self._load_state()
+        if state is not None:
+            es, res_log, current_population_size = (
+                state["es"],
+                state["log"],
+                state["population_size"],
+            )
+
         while not self._stop_external(
             res_log,
             current_population_size,
@@ -40,12 +49,13 @@ class IpopCmaEs(CmaEs):
             target,
             tolerance,
         ):
-            es = self._spawn_cmaes(
-                bounds,
-                function.metadata.dim,
-                current_population_size,
-                len(bounds) / 2,
-            )
+            if es is None:
+                es = self._spawn_cmaes(
+                    bounds,
+                    function.metadata.dim,
+                    current_population_size,
+                    bounds.max_width() / 2,
+                )
 
             while not self._stop(
                 es,
@@ -56,11 +66,15 @@ class IpopCmaEs(CmaEs):
                 tolerance,
             ):
                 solutions = PointList.from_list(es.ask())
-                results = PointList(points=[function(x) for x in solutions.points])
+                results = function.evaluate_point_list(solutions)
                 res_log.extend(results)
                 x, y = results.pairs()
                 es.tell(x, y)
+                self._save_state(
+                    es=es, log=res_log, population_size=current_population_size
+                )
 
             current_population_size *= 2
+            es = None
 
         return res_log
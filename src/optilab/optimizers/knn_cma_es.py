@@ -85,6 +85,10 @@ class KnnCmaEs(CmaEs):
             self.metadata.hyperparameters["sigma0"],
         )
 
+        state = self._load_state()
+        if state is not None:
+            es, metamodel = state["es"], state["metamodel"]
+
         while not self._stop(
             es,
             metamodel.get_log(),
@@ -106,5 +110,6 @@ class KnnCmaEs(CmaEs):
 
             x, y = xy_pairs.pairs()
             es.tell(x, y)
+            self._save_state(es=es, metamodel=metamodel)
 
         return metamodel.get_log()
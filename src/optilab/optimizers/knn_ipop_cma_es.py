@@ -62,6 +62,15 @@ class KnnIpopCmaEs(CmaEs):
             buffer_size=self.metadata.hyperparameters["buffer_size"],
         )
 
+        es = None
+        state = self._load_state()
+        if state is not None:
+            es, metamodel, current_population_size = (
+                state["es"],
+                state["metamodel"],
+                state["population_size"],
+            )
+
         while not self._stop_external(
             metamodel.get_log(),
             current_population_size,
@@ -69,12 +78,13 @@ class KnnIpopCmaEs(CmaEs):
             target,
             tolerance,
         ):
-            es = self._spawn_cmaes(
-                bounds,
-                function.metadata.dim,
-                current_population_size,
-                len(bounds) / 2,
-            )
+            if es is None:
+                es = self._spawn_cmaes(
+                    bounds,
+                    function.metadata.dim,
+                    current_population_size,
+                    bounds.max_width() / 2,
+                )
 
             while not self._stop(
                 es,
@@ -97,8 +107,12 @@ class KnnIpopCmaEs(CmaEs):
 
                 x, y = xy_pairs.pairs()
                 es.tell(x, y)
+                self._save_state(
+                    es=es, metamodel=metamodel, population_size=current_population_size
+                )
 
             current_population_size *= 2
+            es = None
             metamodel.population_size *= 2
             metamodel.mu *= 2
             metamodel.init_n()
@@ -79,6 +79,10 @@ class LmmCmaEs(CmaEs):
             self.metadata.hyperparameters["sigma0"],
         )
 
+        state = self._load_state()
+        if state is not None:
+            es, metamodel = state["es"], state["metamodel"]
+
         while not self._stop(
             es,
             metamodel.get_log(),
@@ -96,5 +100,6 @@ class LmmCmaEs(CmaEs):
             xy_pairs = metamodel(solutions)
             x, y = xy_pairs.pairs()
             es.tell(x, y)
+            self._save_state(es=es, metamodel=metamodel)
 
         return metamodel.get_log()
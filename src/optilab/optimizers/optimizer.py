@@ -2,13 +2,18 @@
 Base class for optimizers.
 """
 
-from multiprocessing.pool import Pool
+import os
+import pickle
+from collections.abc import Generator
 from typing import Any
 
+import numpy as np
 from tqdm import tqdm
 
 from ..data_classes import Bounds, OptimizationRun, OptimizerMetadata, PointList
 from ..functions import ObjectiveFunction
+from .checkpoint import RunCheckpoint, atomic_dump, run_log_path, run_state_path
+from .executor import OptimizationExecutor
 
 
 class Optimizer:
@@ -16,6 +21,9 @@ class Optimizer:
     Base class for optimizers.
     """
 
+    checkpoint: RunCheckpoint | None = None
+    "Checkpoint of the run in progress, set only while a checkpointed run is performed."
+
     def __init__(
         self, name: str, population_size: int, hyperparameters: dict[str, Any]
     ) -> None:
@@ -105,6 +113,29 @@ class Optimizer:
             tolerance,
         )
 
+    # Checkpointing methods
+    def _load_state(self) -> dict[str, Any] | None:
+        """
+        Load the state of the run in progress from the checkpoint, if there is one.
+
+        Returns:
+            Dictionary with the saved state, None if the run should start from scratch.
+        """
+        if self.checkpoint is None:
+            return None
+        return self.checkpoint.load()
+
+    def _save_state(self, **state: Any) -> None:
+        """
+        Mark the end of a generation, saving the state of the run to the checkpoint
+        if checkpointing is enabled and the checkpoint interval has passed.
+
+        Args:
+            state: State of the run needed to resume it, passed as keyword arguments.
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.step(state)
+
     # Optimization methods
     def optimize(
         self,
@@ -129,6 +160,221 @@ class Optimizer:
         """
         raise NotImplementedError
 
+    def seeded_optimize(
+        self,
+        seed: int | None,
+        function: ObjectiveFunction,
+        bounds: Bounds,
+        call_budget: int,
+        tolerance: float,
+        target: float = 0.0,
+        *,
+        checkpoint: RunCheckpoint | None = None,
+    ) -> PointList:
+        """
+        Run a single optimization with the global numpy random generator seeded first.
+        The generator drives sampling from bounds, noise of noisy functions and the seed
+        of cma, so passing a seed from OptimizationRun.run_seeds reproduces that run.
+
+        Args:
+            seed: Seed of the global numpy random generator. If None, it's not reseeded.
+            function: Objective function to optimize.
+            bounds: Search space of the function.
+            call_budget: Max number of calls to the objective function.
+            tolerance: Tolerance of y value to count a solution as acceptable.
+            target: Objective function value target, default 0.
+            checkpoint: Checkpoint to periodically save the state of the run to. If it
+                already holds a saved state, the run is resumed from it.
+
+        Returns:
+            Results log from the optimization.
+        """
+        if seed is not None:
+            np.random.seed(seed)
+
+        self.checkpoint = checkpoint
+        try:
+            return self.optimize(function, bounds, call_budget, tolerance, target)
+        finally:
+            self.checkpoint = None
+
+    @staticmethod
+    def spawn_run_seeds(seed: int | None, num_runs: int) -> tuple[int, list[int]]:
+        """
+        Spawn independent seeds for optimization runs from a root seed.
+
+        Args:
+            seed: Root seed. If None, fresh entropy is drawn from the operating system.
+            num_runs: Number of runs to spawn seeds for.
+
+        Returns:
+            Entropy of the root seed sequence and a list of 32 bit seeds of the runs.
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        run_seeds = [
+            int(child.generate_state(1)[0]) for child in seed_sequence.spawn(num_runs)
+        ]
+        assert isinstance(seed_sequence.entropy, int)
+        return seed_sequence.entropy, run_seeds
+
+    def _open_checkpoint_dir(
+        self,
+        checkpoint_dir: str,
+        num_runs: int,
+        function: ObjectiveFunction,
+        seed: int | None,
+        resume: bool,
+    ) -> int:
+        """
+        Create a checkpoint directory of a campaign of runs, or validate an existing one.
+
+        Args:
+            checkpoint_dir: Path to the checkpoint directory.
+            num_runs: Number of optimization runs.
+            function: The optimized function.
+            seed: Root seed of the runs.
+            resume: If true, the directory must hold a checkpoint of the same campaign.
+
+        Raises:
+            FileNotFoundError: If resuming from a directory without a checkpoint.
+            FileExistsError: If starting a new campaign in a directory with a checkpoint.
+            ValueError: If the checkpoint belongs to a different campaign.
+
+        Returns:
+            Root seed of the runs, read from the checkpoint when resuming.
+        """
+        campaign_path = os.path.join(checkpoint_dir, "campaign.pkl")
+
+        if resume:
+            if not os.path.exists(campaign_path):
+                raise FileNotFoundError(f"No checkpoint found in {checkpoint_dir}.")
+            with open(campaign_path, "rb") as campaign_file:
+                campaign = pickle.load(campaign_file)
+            if (
+                campaign["model_metadata"] != self.metadata
+                or campaign["function_metadata"] != function.metadata
+                or campaign["num_runs"] != num_runs
+            ):
+                raise ValueError(
+                    f"Checkpoint in {checkpoint_dir} is of a different optimization."
+                )
+            return campaign["seed"]
+
+        if os.path.exists(campaign_path):
+            raise FileExistsError(
+                f"Checkpoint already exists in {checkpoint_dir}, use resume to continue it."
+            )
+
+        if seed is None:
+            seed, _ = self.spawn_run_seeds(None, 0)
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        atomic_dump(
+            {
+                "model_metadata": self.metadata,
+                "function_metadata": function.metadata,
+                "num_runs": num_runs,
+                "seed": seed,
+            },
+            campaign_path,
+        )
+        return seed
+
+    def iter_optimization(
+        self,
+        num_runs: int,
+        function: ObjectiveFunction,
+        bounds: Bounds,
+        call_budget: int,
+        tolerance: float,
+        target: float = 0.0,
+        *,
+        num_processes: int = 1,
+        executor: OptimizationExecutor | None = None,
+        seed: int | None = None,
+        checkpoint_dir: str | None = None,
+        checkpoint_interval: int = 10,
+        resume: str | None = None,
+    ) -> Generator[tuple[int, int, PointList], None, None]:
+        """
+        Optimize a provided objective function, yielding the log of each run as soon as
+        it's finished. Runs are yielded in order of completion, so the caller can save,
+        reduce or drop each log before the next one arrives instead of holding all of them.
+
+        Args:
+            num_runs: Number of optimization runs to perform.
+            function: Objective function to optimize.
+            bounds: Search space of the function.
+            call_budget: Max number of calls to the objective function.
+            tolerance: Tolerance of y value to count a solution as acceptable.
+            target: Objective function value target, default 0.
+            num_processes(int): Number of concurrent processes to use to speed up the
+                optimization. By default only one is used. Ignored if executor is provided.
+            executor: Pool of worker processes to run the optimization in. If None,
+                a new pool with num_processes workers is created for this call.
+            seed: Root seed of the runs, see run_optimization.
+            checkpoint_dir: Directory to save logs of finished runs and states
+                of runs in progress to. If None, no checkpoints are saved.
+            checkpoint_interval: Number of generations between saves of the state
+                of runs in progress. Default 10.
+            resume: Checkpoint directory of an interrupted call to continue. Finished
+                runs are loaded instead of performed, runs in progress are continued
+                from their last saved state. Checkpoints are saved to this directory.
+
+        Yields:
+            Tuples of index of the run, seed of the run and its results log.
+        """
+        if executor is None:
+            with OptimizationExecutor(num_processes) as own_executor:
+                yield from self.iter_optimization(
+                    num_runs,
+                    function,
+                    bounds,
+                    call_budget,
+                    tolerance,
+                    target,
+                    executor=own_executor,
+                    seed=seed,
+                    checkpoint_dir=checkpoint_dir,
+                    checkpoint_interval=checkpoint_interval,
+                    resume=resume,
+                )
+            return
+
+        if resume is not None:
+            checkpoint_dir = resume
+        if checkpoint_dir is not None:
+            seed = self._open_checkpoint_dir(
+                checkpoint_dir, num_runs, function, seed, resume is not None
+            )
+
+        _, run_seeds = self.spawn_run_seeds(seed, num_runs)
+        pending_runs = []
+
+        for run_index in range(num_runs):
+            if checkpoint_dir is None or not os.path.exists(
+                run_log_path(checkpoint_dir, run_index)
+            ):
+                pending_runs.append(run_index)
+                continue
+            with open(run_log_path(checkpoint_dir, run_index), "rb") as log_file:
+                yield run_index, run_seeds[run_index], pickle.load(log_file)
+
+        job = executor.submit(self, function, bounds, call_budget, tolerance, target)
+        for run_index, log in executor.run(
+            job,
+            pending_runs,
+            [run_seeds[run_index] for run_index in pending_runs],
+            ordered=False,
+            checkpoint_dir=checkpoint_dir,
+            checkpoint_interval=checkpoint_interval,
+        ):
+            if checkpoint_dir is not None:
+                atomic_dump(log, run_log_path(checkpoint_dir, run_index))
+                state_path = run_state_path(checkpoint_dir, run_index)
+                if os.path.exists(state_path):
+                    os.remove(state_path)
+            yield run_index, run_seeds[run_index], log
+
     def run_optimization(
         self,
         num_runs: int,
@@ -139,6 +385,11 @@ class Optimizer:
         target: float = 0.0,
         *,
         num_processes: int = 1,
+        executor: OptimizationExecutor | None = None,
+        seed: int | None = None,
+        checkpoint_dir: str | None = None,
+        checkpoint_interval: int = 10,
+        resume: str | None = None,
     ) -> OptimizationRun:
         """
         Optimize a provided objective function.
@@ -151,27 +402,59 @@ class Optimizer:
             tolerance: Tolerance of y value to count a solution as acceptable.
             target: Objective function value target, default 0.
             num_processes(int): Number of concurrent processes to use to speed up the
-                optimization. By default only one is used.
+                optimization. By default only one is used. Ignored if executor is provided.
+            executor: Pool of worker processes to run the optimization in. Passing the same
+                executor to many calls keeps the workers alive between them. If None,
+                a new pool with num_processes workers is created for this call.
+            seed: Root seed of the runs. Each run gets an independent seed spawned
+                from it with numpy SeedSequence, which is recorded in the result.
+                If None, fresh entropy is used, which is recorded as well.
+            checkpoint_dir: Directory to save logs of finished runs and states
+                of runs in progress to. If None, no checkpoints are saved.
+            checkpoint_interval: Number of generations between saves of the state
+                of runs in progress. Default 10.
+            resume: Checkpoint directory of an interrupted call to continue. The seed
+                is read from the checkpoint, finished runs are not repeated.
 
         Returns:
             Metadata of optimization run.
         """
-        with Pool(num_processes) as pool:
-            tasks = [
-                pool.apply_async(
-                    self.optimize, (function, bounds, call_budget, tolerance, target)
-                )
-                for _ in range(num_runs)
-            ]
+        if resume is not None:
+            seed = self._open_checkpoint_dir(resume, num_runs, function, None, True)
+        elif seed is None:
+            seed, _ = self.spawn_run_seeds(None, 0)
+
+        logs: list[PointList | None] = [None] * num_runs
+        run_seeds = [0] * num_runs
 
-            logs = [
-                task.get() for task in tqdm(tasks, desc="Optimizing...", unit="run")
-            ]
+        for run_index, run_seed, log in tqdm(
+            self.iter_optimization(
+                num_runs,
+                function,
+                bounds,
+                call_budget,
+                tolerance,
+                target,
+                num_processes=num_processes,
+                executor=executor,
+                seed=seed,
+                checkpoint_dir=checkpoint_dir,
+                checkpoint_interval=checkpoint_interval,
+                resume=resume,
+            ),
+            total=num_runs,
+            desc="Optimizing...",
+            unit="run",
+        ):
+            logs[run_index] = log
+            run_seeds[run_index] = run_seed
 
         return OptimizationRun(
             model_metadata=self.metadata,
             function_metadata=function.metadata,
             bounds=bounds,
             tolerance=tolerance,
-            logs=logs,
+            logs=[log for log in logs if log is not None],
+            seed=seed,
+            run_seeds=run_seeds,
         )
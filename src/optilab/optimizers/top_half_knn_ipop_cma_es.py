@@ -82,6 +82,15 @@ class TopHalfKnnIpopCmaEs(CmaEs):
             buffer_size=self.metadata.hyperparameters["buffer_size"],
         )
 
+        es = None
+        state = self._load_state()
+        if state is not None:
+            es, metamodel, current_population_size = (
+                state["es"],
+                state["metamodel"],
+                state["population_size"],
+            )
+
         while not self._stop_external(
             metamodel.get_log(),
             current_population_size,
@@ -89,12 +98,13 @@ class TopHalfKnnIpopCmaEs(CmaEs):
             target,
             tolerance,
         ):
-            es = self._spawn_cmaes(
-                bounds,
-                function.metadata.dim,
-                current_population_size,
-                len(bounds) / 2,
-            )
+            if es is None:
+                es = self._spawn_cmaes(
+                    bounds,
+                    function.metadata.dim,
+                    current_population_size,
+                    bounds.max_width() / 2,
+                )
 
             while not self._stop(
                 es,
@@ -117,8 +127,12 @@ class TopHalfKnnIpopCmaEs(CmaEs):
 
                 x, y = xy_pairs.pairs()
                 es.tell(x, y)
+                self._save_state(
+                    es=es, metamodel=metamodel, population_size=current_population_size
+                )
 
             current_population_size *= 2
+            es = None
             metamodel.population_size *= 2
             metamodel.mu *= 2
 
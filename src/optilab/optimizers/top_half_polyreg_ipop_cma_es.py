@@ -79,6 +79,15 @@ class TopHalfPolyregIpopCmaEs(CmaEs):
         dim = function.metadata.dim
         min_train = (dim + 1) * (dim + 2) // 2
 
+        es = None
+        state = self._load_state()
+        if state is not None:
+            es, metamodel, current_population_size = (
+                state["es"],
+                state["metamodel"],
+                state["population_size"],
+            )
+
         while not self._stop_external(
             metamodel.get_log(),
             current_population_size,
@@ -86,12 +95,13 @@ class TopHalfPolyregIpopCmaEs(CmaEs):
             target,
             tolerance,
         ):
-            es = self._spawn_cmaes(
-                bounds,
-                function.metadata.dim,
-                current_population_size,
-                len(bounds) / 2,
-            )
+            if es is None:
+                es = self._spawn_cmaes(
+                    bounds,
+                    function.metadata.dim,
+                    current_population_size,
+                    bounds.max_width() / 2,
+                )
 
             while not self._stop(
                 es,
@@ -111,8 +121,12 @@ class TopHalfPolyregIpopCmaEs(CmaEs):
 
                 x, y = xy_pairs.pairs()
                 es.tell(x, y)
+                self._save_state(
+                    es=es, metamodel=metamodel, population_size=current_population_size
+                )
 
             current_population_size *= 2
+            es = None
             metamodel.population_size *= 2
             metamodel.mu *= 2
 
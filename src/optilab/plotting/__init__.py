@@ -2,13 +2,37 @@
 Module optilab.plotting . Contains functions to plot results.
 """
 
-from .box_plot import plot_box_plot
-from .convergence_curve import convergence_curve, plot_convergence_curve
-from .ecdf_curve import ecdf_curve, plot_ecdf_curves
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .box_plot import plot_box_plot
+    from .convergence_curve import (
+        convergence_curve,
+        convergence_curves,
+        plot_convergence_curve,
+    )
+    from .ecdf_curve import ecdf_curve, ecdf_thresholding, plot_ecdf_curves
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "convergence_curve": "convergence_curve",
+        "convergence_curves": "convergence_curve",
+        "ecdf_curve": "ecdf_curve",
+        "ecdf_thresholding": "ecdf_curve",
+        "plot_box_plot": "box_plot",
+        "plot_convergence_curve": "convergence_curve",
+        "plot_ecdf_curves": "ecdf_curve",
+    },
+)
 
 __all__ = [
     "convergence_curve",
+    "convergence_curves",
     "ecdf_curve",
+    "ecdf_thresholding",
     "plot_box_plot",
     "plot_convergence_curve",
     "plot_ecdf_curves",
@@ -2,14 +2,49 @@
 Calculating and plotting the convergence curve.
 """
 
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 
+import numpy as np
 from matplotlib import pyplot as plt
 
-from ..data_classes import PointList
+from ..data_classes import ColumnarPointList, PointList
 
 
-def convergence_curve(log: PointList) -> list[float]:
+def convergence_curves(
+    logs: Sequence[PointList | ColumnarPointList],
+    length: int | None = None,
+) -> np.ndarray:
+    """
+    For given logs return a matrix of convergence curves - the lowest values achieved so far.
+    Curves shorter than the longest one are padded with their last value.
+
+    Args:
+        logs: Results logs - the values of errors of the optimized function.
+        length: Length to pad the curves to. If None, the length of the longest log is used.
+
+    Returns:
+        Matrix of shape (len(logs), length) with a convergence curve in each row.
+        Values before the first evaluated point are infinite.
+    """
+    lengths = np.array([len(log) for log in logs], dtype=np.int64)
+    if length is None:
+        length = int(lengths.max(initial=0))
+    elif length < lengths.max(initial=0):
+        raise ValueError("length parameter is lower than length of the longest log.")
+
+    curves = np.full((len(logs), length), np.inf)
+    for row, log in zip(curves, logs, strict=True):
+        row[: len(log)] = log.y()
+
+    # missing values and padding are infinite, so the running minimum
+    # skips them and pads each curve with its last value
+    np.nan_to_num(curves, copy=False, nan=np.inf)
+    np.minimum.accumulate(curves, axis=1, out=curves)
+    return curves
+
+
+def convergence_curve(log: PointList | ColumnarPointList) -> list[float]:
     """
     For a given log return a convergence curve - the lowest value achieved so far.
 
@@ -19,19 +54,11 @@ def convergence_curve(log: PointList) -> list[float]:
     Returns:
         y values of the convergence curve.
     """
-    min_so_far = float("inf")
-    new_log = []
-
-    for value in log.points:
-        if value.y is not None:
-            min_so_far = min(min_so_far, value.y)
-        new_log.append(min_so_far)
-
-    return new_log
+    return convergence_curves([log])[0].tolist()
 
 
 def plot_convergence_curve(
-    data: dict[str, list[PointList]],
+    data: Mapping[str, Sequence[PointList | ColumnarPointList]],
     savepath: str | Path | None = None,
     *,
     show: bool = True,
@@ -50,14 +77,7 @@ def plot_convergence_curve(
     plt.clf()
 
     for name, loglist in data.items():
-        ys = [convergence_curve(log) for log in loglist]
-        max_len = max((len(log) for log in ys))
-
-        for log in ys:
-            log.extend([log[-1]] * (max_len - len(log)))
-
-        averaged_y = [sum(values) / len(values) for values in zip(*ys)]
-        plt.plot(averaged_y, label=name)
+        plt.plot(np.mean(convergence_curves(loglist), axis=0), label=name)
 
     plt.yscale("log")
     plt.xlabel("evaluations")
@@ -3,53 +3,38 @@ Plotting and calculating ECDF curves.
 """
 
 import math
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 
-from ..data_classes import PointList
-from .convergence_curve import convergence_curve
+from ..data_classes import ColumnarPointList, PointList
+from .convergence_curve import convergence_curves
 
 
-def _ecdf_thresholding(
-    log: list[float],
-    thresholds: np.ndarray,
-    n_dimensions: int,
-    extend_to_len: int | None = None,
-) -> tuple[list[float], list[float]]:
+def ecdf_thresholding(curves: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
     """
-    Perform thresholding of a log with a given list of thresholds.
-    The resulting y is the number of thresholds achieved by the log items.
+    Perform thresholding of convergence curves with a given array of thresholds.
+    The resulting values are fractions of thresholds achieved by the curve items.
 
     Args:
-        log: Error log of a optimization function.
-        thresholds: ECDF value thresholds.
-        n_dimensions: Dimensionality of optimized function.
+        curves: Array of convergence curves of any shape, for example (runs, length).
+        thresholds: ECDF value thresholds, sorted in ascending order.
 
     Returns:
-        x and y values for the curve.
+        Array of the same shape as curves with fractions of achieved thresholds.
     """
-    y = [float(np.sum(thresholds >= item)) / len(thresholds) for item in log]
-
-    if extend_to_len:
-        if extend_to_len < len(y):
-            raise ValueError(
-                "extend_to_len parameter is lower than lenght of the provided log"
-            )
-        y.extend([y[-1]] * (extend_to_len - len(y)))
-
-    x = [(i + 1) / n_dimensions for i in range(len(y))]
-
-    return x, y
+    num_achieved = len(thresholds) - np.searchsorted(thresholds, curves, side="left")
+    return num_achieved / len(thresholds)
 
 
 def ecdf_curve(
-    data: dict[str, list[PointList]],
+    data: Mapping[str, Sequence[PointList | ColumnarPointList]],
     n_dimensions: int,
     allowed_error: float,
     n_thresholds: int = 100,
-) -> dict[str, tuple[list[float], list[float]]]:
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
     """
     Calculate ECDF curves.
 
@@ -62,46 +47,27 @@ def ecdf_curve(
     Returns:
         x, y plot points for each method.
     """
-    processed_logs = {}
-    log_lengths = {}
-    all_last_items = []
-
-    for method, logs in data.items():
-        processed_logs[method] = []
-        max_len = 0
-        for log in logs:
-            new_log = convergence_curve(log)
-            max_len = max(max_len, len(new_log))
-            processed_log = [math.log10(max(v, allowed_error)) for v in new_log]
-            processed_logs[method].append(processed_log)
-            all_last_items.append(processed_log[-1])
-            log_lengths[method] = max_len
+    processed_curves = {
+        method: np.log10(np.maximum(convergence_curves(logs), allowed_error))
+        for method, logs in data.items()
+    }
 
     low_value = math.log10(allowed_error)
-    high_value = max(all_last_items)
+    high_value = max(np.max(curves[:, -1]) for curves in processed_curves.values())
 
     thresholds = np.linspace(low_value, high_value, n_thresholds + 1)[1:]
 
     ecdf_data = {}
-    for method, logs in processed_logs.items():
-        ecdf_ys = []
-        ecdf_x = []
-
-        for log in logs:
-            x, y = _ecdf_thresholding(
-                log, thresholds, n_dimensions, log_lengths[method]
-            )
-            ecdf_x = x
-            ecdf_ys.append(y)
-
-        ecdf_avg = np.mean(ecdf_ys, axis=0)
+    for method, curves in processed_curves.items():
+        ecdf_x = np.arange(1, curves.shape[1] + 1) / n_dimensions
+        ecdf_avg = np.mean(ecdf_thresholding(curves, thresholds), axis=0)
         ecdf_data[method] = (ecdf_x, ecdf_avg)
 
     return ecdf_data
 
 
 def plot_ecdf_curves(
-    data: dict[str, list[PointList]],
+    data: Mapping[str, Sequence[PointList | ColumnarPointList]],
     n_dimensions: int,
     allowed_error: float,
     n_thresholds: int = 100,
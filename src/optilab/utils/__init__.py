@@ -2,9 +2,13 @@
 Submodule with various utilities.
 """
 
+from .npz_utils import convert_to_npz, dump_to_npz, load_from_npz
 from .pickle_utils import dump_to_pickle, load_from_pickle
 
 __all__ = [
+    "convert_to_npz",
+    "dump_to_npz",
     "dump_to_pickle",
+    "load_from_npz",
     "load_from_pickle",
 ]
@@ -0,0 +1,264 @@
+"""
+Persistent cache of analyses of result files made by the optilab CLI.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+ANALYSIS_CACHE_FILENAME = "optilab_cache.sqlite"
+"Name of the cache file created in the directory with artifacts."
+
+_SCHEMA_VERSION = 3
+"Version of the layout of the cache database, older databases are cleared."
+
+_HASH_CHUNK_SIZE = 1 << 20
+"Size of chunks in which files are read when computing their hashes."
+
+
+class FileStat(NamedTuple):
+    """Size and modification time of a file, used to detect its changes cheaply."""
+
+    size: int
+    "Size of the file in bytes."
+
+    mtime_ns: int
+    "Modification time of the file in nanoseconds."
+
+
+def file_stat(path: Path) -> FileStat:
+    """
+    Get size and modification time of a file, without reading it.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Size and modification time of the file.
+    """
+    stat = os.stat(path)
+    return FileStat(stat.st_size, stat.st_mtime_ns)
+
+
+def file_hash(path: Path) -> str:
+    """
+    Compute SHA-256 hash of the content of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hexadecimal digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        while chunk := file_handle.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _unchanged_stat(path: Path, stat: FileStat, checksum: str) -> FileStat | None:
+    """
+    Check if a file is unchanged since its size, modification time and checksum were
+    recorded. The file is hashed only if its size or modification time changed.
+
+    Args:
+        path: Path to the file.
+        stat: Recorded size and modification time of the file.
+        checksum: Recorded hash of the content of the file.
+
+    Returns:
+        Current size and modification time of the file if its content is unchanged,
+        None if it changed or the file doesn't exist.
+    """
+    if not path.exists():
+        return None
+    current = file_stat(path)
+    if current == stat or file_hash(path) == checksum:
+        return current
+    return None
+
+
+class AnalysisCache:
+    """
+    Cache of analyses of result files, stored in a SQLite database. An analysis is keyed by
+    the name of the analyzed file and analysis options. It holds the printed report, tables
+    to aggregate, size and modification time of the file and checksums of the saved artifacts,
+    such as plots and csv files, so the analysis can be reused without loading the file.
+
+    Hashes of the analyzed file and the artifacts are computed once, when the analysis is
+    stored. A file with unchanged size and modification time is treated as unchanged without
+    reading it. Otherwise its content is hashed and compared with the stored hash, so files
+    that were only touched or copied don't invalidate the analysis. Artifacts are not stored
+    in the cache, an analysis is reused only if they are still present and unchanged
+    in the artifact directory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Class constructor, opens or creates the cache database.
+
+        Args:
+            path: Path to the cache database file.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, timeout=60)
+        with self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS analyses")
+                self._connection.execute("DROP TABLE IF EXISTS artifacts")
+                self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS analyses (key TEXT PRIMARY KEY, "
+                "size INTEGER, mtime_ns INTEGER, content_hash TEXT, "
+                "report TEXT, tables BLOB)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts (key TEXT, name TEXT, "
+                "size INTEGER, mtime_ns INTEGER, checksum TEXT, PRIMARY KEY (key, name))"
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the cache database.
+        """
+        self._connection.close()
+
+    @staticmethod
+    def make_key(file_path: Path, options: dict[str, Any]) -> str:
+        """
+        Make the cache key of an analysis of a file. The file is not read.
+
+        Args:
+            file_path: Path to the analyzed file.
+            options: Analysis options affecting its results, must be JSON serializable.
+
+        Returns:
+            The cache key.
+        """
+        key_data = {"name": file_path.name, "options": options}
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+    def get(
+        self, key: str, file_path: Path, artifact_dir: Path
+    ) -> tuple[str, Any] | None:
+        """
+        Get a cached analysis of a file, if the file and the saved artifacts
+        haven't changed since it was stored.
+
+        Args:
+            key: The cache key of the analysis.
+            file_path: Path to the analyzed file.
+            artifact_dir: Directory the artifacts of the analysis were saved to.
+
+        Returns:
+            Printed report and tables to aggregate, or None if the analysis is not cached
+            or is out of date.
+        """
+        row = self._connection.execute(
+            "SELECT size, mtime_ns, content_hash, report, tables "
+            "FROM analyses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        size, mtime_ns, content_hash, report, tables = row
+        current_stat = _unchanged_stat(
+            file_path, FileStat(size, mtime_ns), content_hash
+        )
+        if current_stat is None:
+            return None
+        file_touched = current_stat != (size, mtime_ns)
+
+        touched_artifacts = []
+        for name, size, mtime_ns, checksum in self._connection.execute(
+            "SELECT name, size, mtime_ns, checksum FROM artifacts WHERE key = ?", (key,)
+        ).fetchall():
+            artifact_stat = _unchanged_stat(
+                artifact_dir / name, FileStat(size, mtime_ns), checksum
+            )
+            if artifact_stat is None:
+                return None
+            if artifact_stat != (size, mtime_ns):
+                touched_artifacts.append((*artifact_stat, key, name))
+
+        # record new stats of files with unchanged content, so they're not hashed again
+        if file_touched or touched_artifacts:
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE analyses SET size = ?, mtime_ns = ? WHERE key = ?",
+                    (*current_stat, key),
+                )
+                self._connection.executemany(
+                    "UPDATE artifacts SET size = ?, mtime_ns = ? "
+                    "WHERE key = ? AND name = ?",
+                    touched_artifacts,
+                )
+
+        return report, pickle.loads(tables)
+
+    def put(
+        self,
+        key: str,
+        file_path: Path,
+        stat: FileStat,
+        report: str,
+        tables: Any,
+        artifact_paths: list[Path],
+    ) -> None:
+        """
+        Store an analysis, replacing the previous one with the same key. Hashes of the file
+        and the artifacts are computed here. The analysis is not stored if the file changed
+        since it was analyzed.
+
+        Args:
+            key: The cache key of the analysis.
+            file_path: Path to the analyzed file.
+            stat: Size and modification time of the file before it was analyzed.
+            report: Printed report of the analysis.
+            tables: Picklable tables to aggregate.
+            artifact_paths: Paths to the saved artifacts, only their sizes, modification
+                times and checksums are stored.
+        """
+        if file_stat(file_path) != stat:
+            return
+        content_hash = file_hash(file_path)
+        artifacts = [
+            (key, path.name, *file_stat(path), file_hash(path))
+            for path in artifact_paths
+        ]
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    stat.size,
+                    stat.mtime_ns,
+                    content_hash,
+                    report,
+                    pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+            self._connection.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+            self._connection.executemany(
+                "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?)", artifacts
+            )
@@ -0,0 +1,63 @@
+"""
+Lazy loading of package attributes (PEP 562), used to keep importing optilab cheap.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+
+def lazy_attributes(
+    package: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Make module level __getattr__ and __dir__ functions of a package, which import
+    its attributes from submodules on first access. This way heavy dependencies of
+    a submodule (such as faiss, sklearn or matplotlib) are imported only when
+    the submodule is actually used.
+
+    Importing a submodule binds it as an attribute of the package, which would hide
+    an attribute with the same name, such as a function convergence_curve defined in
+    the submodule convergence_curve. To keep such attributes pointing to the functions,
+    no matter how the submodule was imported, the class of the package module is
+    replaced with one that binds the attribute instead of the submodule.
+
+    Args:
+        package: Name of the package, __name__ of its __init__ module.
+        attributes: Dictionary of attribute names and names of submodules defining them,
+            relative to the package.
+
+    Returns:
+        The __getattr__ and __dir__ functions of the package.
+    """
+
+    class LazyModule(ModuleType):
+        """
+        Package module binding attributes in place of submodules with the same name.
+        """
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            if (
+                isinstance(value, ModuleType)
+                and attributes.get(name) == name
+                and value.__name__ == f"{package}.{name}"
+            ):
+                value = getattr(value, name)
+            super().__setattr__(name, value)
+
+    sys.modules[package].__class__ = LazyModule
+
+    def __getattr__(name: str) -> Any:
+        submodule_name = attributes.get(name)
+        if submodule_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        submodule = importlib.import_module(f"{package}.{submodule_name}")
+        return getattr(submodule, name)
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,430 @@
+"""
+Functions related to loading and dumping optimization results to columnar npz files.
+"""
+
+import json
+import math
+import os
+import struct
+import zipfile
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..data_classes import (
+    Bounds,
+    ColumnarPointList,
+    FunctionMetadata,
+    OptimizationRun,
+    OptimizerMetadata,
+    PointList,
+)
+from .pickle_utils import load_from_pickle
+
+NPZ_FORMAT_VERSION = 1
+"Version of the npz result format, stored in the metadata of every file."
+
+
+def _log_columns(
+    log: PointList | ColumnarPointList, with_x: bool
+) -> tuple[np.ndarray | None, np.ndarray, np.ndarray]:
+    """
+    Convert a log to columns of x values, y values and is_evaluated flags.
+
+    Args:
+        log: The log to convert.
+        with_x: If true, x values are returned as well.
+
+    Returns:
+        Matrix of x values (None if with_x is false), array of y values with missing
+            values as NaN and array of is_evaluated flags.
+    """
+    if isinstance(log, ColumnarPointList):
+        return (log.x() if with_x else None), log.y(), log.is_evaluated()
+
+    ys = np.array(
+        [np.nan if point.y is None else point.y for point in log], dtype=np.float64
+    )
+    is_evaluated = np.array([point.is_evaluated for point in log], dtype=bool)
+    return (log.x() if with_x else None), ys, is_evaluated
+
+
+def _to_json(value: Any) -> Any:
+    """
+    Convert a numpy value in metadata to a type JSON can represent. Used as the default
+    of json.dumps, so it's called only for values JSON can't represent.
+
+    Args:
+        value: The value to convert.
+
+    Raises:
+        TypeError: If the value is not a numpy scalar or array.
+
+    Returns:
+        Python scalar or list with the same value.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(
+        f"Metadata value of type {type(value).__name__} can't be saved to npz."
+    )
+
+
+def _has_x(run: OptimizationRun) -> bool:
+    """
+    Check if all points in all logs of a run have x values.
+
+    Args:
+        run: The optimization run to check.
+
+    Returns:
+        True if x values can be saved for the run.
+    """
+    for log in run.logs:
+        if isinstance(log, ColumnarPointList):
+            if len(log) > 0 and log.x().shape[1] == 0:
+                return False
+        elif any(point.x is None for point in log):
+            return False
+    return True
+
+
+def dump_to_npz(
+    data: list[OptimizationRun], npz_path: Path, include_x: bool = True
+) -> None:
+    """
+    Dump a list of optimization runs to an uncompressed columnar npz file. For each entry
+    the y values and is_evaluated flags of all logs are stored in contiguous arrays,
+    together with offsets of the logs. Metadata of the entries, lengths and best values
+    of the logs are stored as JSON, so they can be read without reading the logs.
+    Numpy scalars and arrays in metadata are stored as Python scalars and lists.
+
+    Args:
+        data: List of optimization runs to save.
+        npz_path: Path to file to save the data, should have *.npz extension.
+        include_x: If true, x values are saved as well. They are skipped for runs
+            with removed x values.
+
+    Raises:
+        TypeError: If metadata contains a value that can't be stored as JSON.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    entries_metadata = []
+
+    for index, run in enumerate(data):
+        with_x = include_x and _has_x(run)
+        columns = [_log_columns(log, with_x) for log in run.logs]
+        lengths = [len(ys) for _, ys, _ in columns]
+
+        arrays[f"entry_{index}_offsets"] = np.concatenate(
+            [[0], np.cumsum(lengths, dtype=np.int64)]
+        ).astype(np.int64)
+        arrays[f"entry_{index}_y"] = np.concatenate(
+            [ys for _, ys, _ in columns] or [np.empty(0)]
+        ).astype(np.float64)
+        arrays[f"entry_{index}_is_evaluated"] = np.concatenate(
+            [is_evaluated for _, _, is_evaluated in columns]
+            or [np.empty(0, dtype=bool)]
+        ).astype(bool)
+        if with_x:
+            arrays[f"entry_{index}_x"] = np.concatenate(
+                [
+                    xs.reshape(len(xs), run.function_metadata.dim)
+                    for xs, _, _ in columns
+                    if xs is not None
+                ]
+                or [np.empty((0, run.function_metadata.dim))]
+            ).astype(np.float64)
+
+        entries_metadata.append(
+            {
+                "model_metadata": run.model_metadata.model_dump(),
+                "function_metadata": run.function_metadata.model_dump(),
+                "bounds": run.bounds.model_dump(),
+                "tolerance": run.tolerance,
+                "seed": run.seed,
+                "run_seeds": run.run_seeds,
+                "has_x": with_x,
+                "log_lengths": lengths,
+                "bests_y": [float(log.best_y()) for log in run.logs],
+            }
+        )
+
+    metadata = {
+        "format_version": NPZ_FORMAT_VERSION,
+        "entries": entries_metadata,
+    }
+    arrays["metadata"] = np.frombuffer(
+        json.dumps(metadata, default=_to_json).encode(), dtype=np.uint8
+    )
+
+    with open(npz_path, "wb") as npz_handle:
+        np.savez(npz_handle, allow_pickle=False, **arrays)
+
+
+def _read_npz_member(
+    npz_path: Path, zip_file: zipfile.ZipFile, name: str, mmap: bool
+) -> np.ndarray:
+    """
+    Read an array stored in an npz file. Arrays stored without compression can be
+    memory-mapped, so their values are paged in from disk only when accessed.
+
+    Args:
+        npz_path: Path to the npz file.
+        zip_file: The npz file opened as a zip archive.
+        name: Name of the array.
+        mmap: If true, the array is memory-mapped if possible, else it's read to memory.
+
+    Returns:
+        The array, memory-mapped read only or read to memory.
+    """
+    info = zip_file.getinfo(f"{name}.npy")
+
+    if not mmap or info.compress_type != zipfile.ZIP_STORED:
+        with zip_file.open(info) as member:
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+    with open(npz_path, "rb") as raw_file:
+        raw_file.seek(info.header_offset)
+        name_length, extra_length = struct.unpack("<26xHH", raw_file.read(30))
+        raw_file.seek(name_length + extra_length, os.SEEK_CUR)
+        version = np.lib.format.read_magic(raw_file)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(raw_file)
+        else:
+            header = np.lib.format.read_array_header_2_0(raw_file)
+        shape, fortran_order, dtype = header
+        offset = raw_file.tell()
+
+    if math.prod(shape) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(
+        npz_path,
+        dtype=dtype,
+        mode="r",
+        shape=shape,
+        order="F" if fortran_order else "C",
+        offset=offset,
+    )
+
+
+def _parse_metadata(zip_file: zipfile.ZipFile) -> dict[str, Any]:
+    """
+    Read and validate the metadata of an npz result file.
+
+    Args:
+        zip_file: The npz file opened as a zip archive.
+
+    Raises:
+        ValueError: If the file is not an optilab npz result file or the format version
+            is not supported.
+
+    Returns:
+        Dictionary with the metadata.
+    """
+    if "metadata.npy" not in zip_file.namelist():
+        raise ValueError("Provided file is not an optilab npz result file.")
+
+    with zip_file.open("metadata.npy") as member:
+        metadata_array = np.lib.format.read_array(member, allow_pickle=False)
+
+    metadata = json.loads(metadata_array.tobytes().decode())
+    if metadata.get("format_version") != NPZ_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported npz result format version {metadata.get('format_version')}."
+        )
+    return metadata
+
+
+def read_npz_metadata(npz_path: Path) -> dict[str, Any]:
+    """
+    Read the metadata of an npz result file without reading any logs. For each entry
+    it contains metadata of the run, lengths of the logs and their best y values.
+
+    Args:
+        npz_path: Path to the npz file to read from.
+
+    Raises:
+        ValueError: If the file is not an optilab npz result file or the format version
+            is not supported.
+
+    Returns:
+        Dictionary with the metadata.
+    """
+    with zipfile.ZipFile(npz_path) as zip_file:
+        return _parse_metadata(zip_file)
+
+
+def run_from_metadata(
+    entry_metadata: dict[str, Any], logs: list[PointList | ColumnarPointList]
+) -> OptimizationRun:
+    """
+    Build an optimization run from metadata of an npz entry and its logs.
+
+    Args:
+        entry_metadata: Metadata of the entry read from an npz result file.
+        logs: Logs of the entry.
+
+    Returns:
+        The optimization run.
+    """
+    return OptimizationRun(
+        model_metadata=OptimizerMetadata(**entry_metadata["model_metadata"]),
+        function_metadata=FunctionMetadata(**entry_metadata["function_metadata"]),
+        bounds=Bounds(**entry_metadata["bounds"]),
+        tolerance=entry_metadata["tolerance"],
+        logs=logs,
+        seed=entry_metadata["seed"],
+        run_seeds=entry_metadata["run_seeds"],
+    )
+
+
+def load_from_npz(
+    npz_path: Path,
+    load_x: bool = True,
+    entries: list[int] | None = None,
+    mmap: bool = False,
+) -> list[OptimizationRun]:
+    """
+    Load a list of optimization runs from an npz result file. Logs are returned
+    as ColumnarPointList objects sharing the arrays read from the file.
+
+    With memory mapping the logs are views of the file, so only metadata is read when
+    loading and values of the logs are paged in when they are first accessed, for example
+    by a plot. Together with selecting entries and skipping x values this allows
+    analyzing a part of a huge result file quickly.
+
+    Args:
+        npz_path: Path to the npz file to read from.
+        load_x: If false, x values are not read even if they are present in the file.
+        entries: Indices of entries to load, out of range indices are skipped.
+            If None, all entries are loaded.
+        mmap: If true, the arrays are memory-mapped read only instead of read to memory.
+
+    Returns:
+        List of optimization runs read from the file.
+    """
+    data = []
+
+    with zipfile.ZipFile(npz_path) as zip_file:
+        metadata = _parse_metadata(zip_file)
+        num_entries = len(metadata["entries"])
+        if entries is None:
+            entries = list(range(num_entries))
+
+        for index in entries:
+            if not 0 <= index < num_entries:
+                continue
+            entry_metadata = metadata["entries"][index]
+
+            offsets = _read_npz_member(
+                npz_path, zip_file, f"entry_{index}_offsets", mmap=False
+            )
+            ys = _read_npz_member(npz_path, zip_file, f"entry_{index}_y", mmap)
+            is_evaluated = _read_npz_member(
+                npz_path, zip_file, f"entry_{index}_is_evaluated", mmap
+            )
+            xs = (
+                _read_npz_member(npz_path, zip_file, f"entry_{index}_x", mmap)
+                if load_x and entry_metadata["has_x"]
+                else None
+            )
+
+            logs: list[PointList | ColumnarPointList] = [
+                ColumnarPointList.from_arrays(
+                    xs[start:end] if xs is not None else None,
+                    ys[start:end],
+                    is_evaluated[start:end],
+                    copy=False,
+                )
+                for start, end in pairwise(offsets)
+            ]
+            data.append(run_from_metadata(entry_metadata, logs))
+
+    return data
+
+
+def convert_to_npz(
+    pickle_path: Path, npz_path: Path | None = None, include_x: bool = True
+) -> Path:
+    """
+    Convert an existing pickle result file (*.pkl or *.zstd.pkl) to the npz format.
+
+    Args:
+        pickle_path: Path to the pickle file to convert.
+        npz_path: Path of the npz file to create. If None, the pickle path with
+            *.npz extension is used.
+        include_x: If true, x values are saved as well.
+
+    Returns:
+        Path to the created npz file.
+    """
+    if npz_path is None:
+        npz_path = pickle_path.with_name(f"{pickle_path.name.split('.')[0]}.npz")
+
+    data = load_from_pickle(pickle_path)
+    assert isinstance(data, list)
+    dump_to_npz(data, npz_path, include_x)
+    return npz_path
+
+
+def list_all_results(path: Path) -> list[Path]:
+    """
+    Given a path to either a file or directory return a list of all result files
+    (pickles and npz files) present there.
+
+    Args:
+        path: Either a path to a result file or path to directory containing result files.
+
+    Returns:
+        List of paths to found result files.
+
+    Raises:
+        ValueError: If the path is a file and not a result file, or when the path is
+            a directory and contains no result files.
+    """
+    file_path_list = []
+
+    if path.is_file():
+        if path.suffix in (".pkl", ".npz"):
+            file_path_list.append(path)
+        else:
+            raise ValueError("Provided file path is not a pickle or npz file.")
+    elif path.is_dir():
+        for file_path in sorted(path.iterdir()):
+            if file_path.is_file() and file_path.suffix in (".pkl", ".npz"):
+                file_path_list.append(file_path)
+        if len(file_path_list) == 0:
+            raise ValueError("No pickle or npz file found in the provided directory.")
+
+    return file_path_list
+
+
+def load_results(
+    path: Path, entries: list[int] | None = None, lazy: bool = False
+) -> list[OptimizationRun]:
+    """
+    Load a list of optimization runs from a result file, either a pickle or an npz file.
+    The format is detected from the file extension.
+
+    Args:
+        path: Path to the result file.
+        entries: Indices of entries to load, out of range indices are skipped.
+            If None, all entries are loaded.
+        lazy: If true, npz files are memory-mapped and x values are not loaded.
+            Pickles are always loaded whole.
+
+    Returns:
+        List of optimization runs read from the file.
+    """
+    if path.suffix == ".npz":
+        return load_from_npz(path, load_x=not lazy, entries=entries, mmap=lazy)
+
+    data = load_from_pickle(path)
+    if entries is not None:
+        data = [data[i] for i in entries if 0 <= i < len(data)]
+    return data
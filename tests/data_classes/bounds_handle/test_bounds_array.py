@@ -0,0 +1,75 @@
+"""
+Unit tests for vectorized bounds handling methods of Bounds.
+"""
+
+import numpy as np
+import pytest
+
+EXPECTED = {
+    "reflect": [14, 10, 20, 18, 17, 16, 12],
+    "wrap": [14, 10, 20, 12, 13, 16, 12],
+    "project": [14, 10, 20, 10, 20, 10, 20],
+}
+
+
+class TestBoundsArray:
+    """
+    Unit tests for vectorized bounds handling methods of Bounds.
+    """
+
+    @pytest.mark.parametrize("mode", ["reflect", "wrap", "project"])
+    def test_population_matrix(self, example_bounds, point_multidimensional, mode):
+        """
+        Test if all rows of a population matrix are handled like single points.
+        """
+        xs = np.tile(point_multidimensional.x, (5, 1))
+        handled = example_bounds.handle_bounds_array(xs, mode)
+        assert handled.shape == (5, 7)
+        assert np.array_equal(handled, np.tile(EXPECTED[mode], (5, 1)))
+        assert np.array_equal(xs[0], point_multidimensional.x)
+
+    @pytest.mark.parametrize("mode", ["reflect", "wrap", "project"])
+    def test_in_place(self, example_bounds, point_multidimensional, mode):
+        """
+        Test if in place handling modifies the given array.
+        """
+        xs = np.tile(point_multidimensional.x, (3, 1))
+        handled = example_bounds.handle_bounds_array(xs, mode, in_place=True)
+        assert handled is xs
+        assert np.array_equal(xs, np.tile(EXPECTED[mode], (3, 1)))
+
+    def test_in_place_requires_float_array(self, example_bounds):
+        """
+        Test if in place handling of a non float64 array raises TypeError.
+        """
+        with pytest.raises(TypeError):
+            example_bounds.reflect_array(np.array([[1, 2]]), in_place=True)
+
+    def test_invalid_mode(self, example_bounds):
+        """
+        Test if an invalid mode raises ValueError.
+        """
+        with pytest.raises(ValueError, match="Invalid mode"):
+            example_bounds.handle_bounds_array(np.zeros((2, 2)), "invalid")
+
+    @pytest.mark.parametrize("mode", ["reflect", "wrap", "project"])
+    def test_point_in_place(self, example_bounds, evaluated_point, mode):
+        """
+        Test if in place handling of a point returns the same point object.
+        """
+        handled_point = example_bounds.handle_bounds(
+            evaluated_point, mode, in_place=True
+        )
+        assert handled_point is evaluated_point
+        assert handled_point.x[-1] == EXPECTED[mode][5]
+        assert handled_point.y == 10.1
+        assert handled_point.is_evaluated
+
+    def test_random_point_list(self, example_bounds):
+        """
+        Test if random points are sampled within bounds with correct shape.
+        """
+        points = example_bounds.random_point_list(50, 3)
+        assert points.x().shape == (50, 3)
+        assert all(point in example_bounds for point in points)
+        assert not any(point.is_evaluated for point in points)
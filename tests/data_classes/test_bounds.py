@@ -98,3 +98,66 @@ class TestBounds:
         sampled_point_list = bounds_object.random_point_list(1000, dim=10)
         for sampled_point in sampled_point_list:
             assert sampled_point in bounds_object
+
+    # box bounds
+    def test_box_bounds_from_array(self):
+        """
+        Check if per dimension bounds given as arrays are stored as lists.
+        """
+        bounds_object = Bounds(lower=np.array([0, -1]), upper=np.array([10, 1]))
+        assert bounds_object.to_list() == [[0, -1], [10, 1]]
+        assert bounds_object.dim() == 2
+        assert Bounds(lower=-1, upper=1).dim() is None
+
+    def test_box_bounds_valid(self):
+        """
+        Check validity of box bounds.
+        """
+        assert Bounds(lower=[0, -1], upper=[10, 1]).is_valid()
+        assert Bounds(lower=0, upper=[10, 1]).is_valid()
+        assert not Bounds(lower=[0, 2], upper=[10, 1]).is_valid()
+        assert not Bounds(lower=[0, -1, 0], upper=[10, 1]).is_valid()
+
+    def test_box_bounds_width(self):
+        """
+        Check if width and sigma scaling are computed per dimension.
+        """
+        bounds_object = Bounds(lower=[0, -1], upper=[10, 1])
+        assert np.array_equal(bounds_object.width(), [10, 2])
+        assert bounds_object.max_width() == 10
+        assert len(bounds_object) == 10
+        assert np.array_equal(bounds_object.sigma_scaling(2), [1, 0.2])
+        assert np.array_equal(Bounds(lower=-1, upper=1).sigma_scaling(3), [1, 1, 1])
+
+    def test_point_in_box_bounds(self):
+        """
+        Check if containment is checked per dimension.
+        """
+        bounds_object = Bounds(lower=[0, -1], upper=[10, 1])
+        assert Point(x=np.array([5, 0])) in bounds_object
+        assert Point(x=np.array([0.5, 5])) not in bounds_object
+
+    def test_random_point_list_in_box_bounds(self):
+        """
+        Check if points randomly sampled from box bounds lie in the bounds.
+        """
+        bounds_object = Bounds(lower=[0, -1, 100], upper=[10, 1, 101])
+        sampled_point_list = bounds_object.random_point_list(1000, dim=3)
+        for sampled_point in sampled_point_list:
+            assert sampled_point in bounds_object
+
+    def test_handle_box_bounds(self):
+        """
+        Check if all bound handling modes use per dimension bounds.
+        """
+        bounds_object = Bounds(lower=[0, 10], upper=[1, 20])
+        xs = np.array([[1.25, 23], [-0.25, 4]])
+        assert np.allclose(
+            bounds_object.handle_bounds_array(xs, "reflect"), [[0.75, 17], [0.25, 16]]
+        )
+        assert np.allclose(
+            bounds_object.handle_bounds_array(xs, "wrap"), [[0.25, 13], [0.75, 14]]
+        )
+        assert np.allclose(
+            bounds_object.handle_bounds_array(xs, "project"), [[1, 20], [0, 10]]
+        )
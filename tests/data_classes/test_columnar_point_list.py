@@ -0,0 +1,226 @@
+"""
+Unit tests for ColumnarPointList class.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import ColumnarPointList, Point, PointList
+
+
+@pytest.fixture(name="example_2d_pointlist")
+def fixture_example_2d_pointlist():
+    """
+    An example PointList containing 2d points.
+    """
+    return PointList(
+        points=[
+            Point(x=np.array([0, 0]), y=10, is_evaluated=True),
+            Point(x=np.array([1, 0]), y=8, is_evaluated=True),
+            Point(x=np.array([0, 1]), y=5, is_evaluated=False),
+            Point(x=np.array([-1, 0]), y=1, is_evaluated=False),
+            Point(x=np.array([1, -1]), y=2, is_evaluated=True),
+        ]
+    )
+
+
+@pytest.fixture(name="example_columnar")
+def fixture_example_columnar(example_2d_pointlist):
+    """
+    ColumnarPointList with the same contents as example_2d_pointlist.
+    """
+    return ColumnarPointList.from_point_list(example_2d_pointlist)
+
+
+class TestColumnarPointList:
+    """
+    Unit tests for ColumnarPointList class.
+    """
+
+    def test_from_point_list(self, example_columnar, example_2d_pointlist):
+        """
+        Test if values are the same as in the source PointList.
+        """
+        assert len(example_columnar) == len(example_2d_pointlist)
+        assert np.array_equal(example_columnar.x(), example_2d_pointlist.x())
+        assert np.array_equal(example_columnar.y(), example_2d_pointlist.y())
+        assert example_columnar.points == example_2d_pointlist.points
+        assert example_columnar.to_point_list() == example_2d_pointlist
+
+    def test_append(self):
+        """
+        Test if appending points grows the list past its initial capacity.
+        """
+        points = ColumnarPointList(capacity=2)
+        for i in range(100):
+            points.append(Point(x=np.array([i, -i]), y=i, is_evaluated=True))
+        assert len(points) == 100
+        assert points.x().shape == (100, 2)
+        assert np.array_equal(points.y(), np.arange(100))
+        assert points[-1] == Point(x=np.array([99, -99]), y=99, is_evaluated=True)
+
+    def test_append_missing_y(self):
+        """
+        Test if a point without y value is stored as NaN and read back as None.
+        """
+        points = ColumnarPointList()
+        points.append(Point(x=np.array([1, 2])))
+        assert np.isnan(points.y()[0])
+        assert points[0].y is None
+        assert not points[0].is_evaluated
+
+    def test_append_wrong_dim(self, example_columnar):
+        """
+        Test if appending a point of different dimensionality raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            example_columnar.append(Point(x=np.array([1, 2, 3])))
+
+    def test_extend(self, example_columnar, example_2d_pointlist):
+        """
+        Test if a list can be extended with both PointList and ColumnarPointList.
+        """
+        example_columnar.extend(example_2d_pointlist)
+        example_columnar.extend(ColumnarPointList.from_point_list(example_2d_pointlist))
+        example_columnar.extend(PointList(points=[]))
+        assert len(example_columnar) == 15
+        assert np.array_equal(
+            example_columnar.y(), np.tile(example_2d_pointlist.y(), 3)
+        )
+
+    def test_from_arrays_different_lengths(self):
+        """
+        Test if passing columns of different lengths raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            ColumnarPointList.from_arrays(np.zeros((3, 2)), np.zeros(2))
+
+    def test_only_evaluated(self, example_columnar):
+        """
+        Test if only evaluated points are returned.
+        """
+        evaluated = example_columnar.only_evaluated()
+        assert np.array_equal(evaluated.y(), [10, 8, 2])
+        assert np.all(evaluated.is_evaluated())
+
+    def test_getitem(self, example_columnar):
+        """
+        Test indexing with positive and negative indices.
+        """
+        assert example_columnar[1] == Point(x=np.array([1, 0]), y=8, is_evaluated=True)
+        assert example_columnar[-1] == example_columnar[4]
+        with pytest.raises(IndexError):
+            _ = example_columnar[5]
+
+    def test_materialized_point_is_a_copy(self, example_columnar):
+        """
+        Test if modifying a materialized point doesn't change the list.
+        """
+        point = example_columnar[0]
+        point.x[0] = 100
+        assert example_columnar.x()[0, 0] == 0
+
+    def test_slice_is_a_view(self, example_columnar):
+        """
+        Test if slicing returns a list sharing memory with the original buffers.
+        """
+        sliced = example_columnar[1:3]
+        assert len(sliced) == 2
+        assert np.array_equal(sliced.y(), [8, 5])
+        assert np.shares_memory(sliced.x(), example_columnar.x())
+        assert np.shares_memory(sliced.y(), example_columnar.y())
+
+    def test_appending_to_slice_copies(self, example_columnar):
+        """
+        Test if appending to a sliced view does not overwrite the original list.
+        """
+        sliced = example_columnar[:2]
+        sliced.append(Point(x=np.array([7, 7]), y=7))
+        assert len(sliced) == 3
+        assert example_columnar[2] == Point(x=np.array([0, 1]), y=5)
+
+    def test_view_ignores_later_appends(self, example_columnar):
+        """
+        Test if a view shares memory with the list and doesn't see points appended later.
+        """
+        view = example_columnar.view()
+        example_columnar.append(Point(x=np.array([7, 7]), y=7))
+        assert len(view) == 5
+        assert np.shares_memory(view.y(), example_columnar.y())
+
+    def test_contains(self, example_columnar):
+        """
+        Test if membership is determined by x values.
+        """
+        assert Point(x=np.array([0, 1]), y=100) in example_columnar
+        assert Point(x=np.array([5, 5])) not in example_columnar
+        assert Point(x=np.array([0, 1, 0])) not in example_columnar
+
+    def test_rank(self, example_columnar):
+        """
+        Test if ranking sorts points by y ascending and descending.
+        """
+        example_columnar.rank()
+        assert np.array_equal(example_columnar.y(), [1, 2, 5, 8, 10])
+        assert np.array_equal(example_columnar.x()[0], [-1, 0])
+        example_columnar.rank(reverse=True)
+        assert np.array_equal(example_columnar.y(), [10, 8, 5, 2, 1])
+
+    def test_x_difference(self, example_columnar):
+        """
+        Test if x_difference returns only points with x not present in the other list.
+        """
+        other = PointList.from_list([np.array([0, 0]), np.array([1, -1])])
+        difference = example_columnar.x_difference(other)
+        assert np.array_equal(difference.y(), [8, 5, 1])
+        difference = example_columnar.x_difference(
+            ColumnarPointList.from_point_list(other)
+        )
+        assert np.array_equal(difference.y(), [8, 5, 1])
+
+    def test_best(self, example_columnar):
+        """
+        Test best value getters.
+        """
+        assert example_columnar.best() == Point(x=np.array([-1, 0]), y=1)
+        assert example_columnar.best_index() == 3
+        assert example_columnar.best_y() == 1
+        assert np.array_equal(example_columnar.slice_to_best().y(), [10, 8, 5, 1])
+
+    def test_best_empty(self):
+        """
+        Test best value getters on an empty list.
+        """
+        assert ColumnarPointList().best_y() == np.inf
+        with pytest.raises(ValueError):
+            ColumnarPointList().best()
+
+    def test_remove_x(self, example_columnar):
+        """
+        Test if y values are preserved after removing x values.
+        """
+        example_columnar.remove_x()
+        assert example_columnar.x().shape == (5, 0)
+        assert example_columnar[0].x is None
+        assert example_columnar.best_y() == 1
+
+    def test_pickle(self, example_columnar):
+        """
+        Test if pickling trims the buffers and preserves the contents.
+        """
+        unpickled = pickle.loads(pickle.dumps(example_columnar))
+        assert len(unpickled._ys) == 5
+        assert unpickled.points == example_columnar.points
+
+    def test_best_after_append_and_rank(self, example_columnar):
+        """
+        Test if the running best point is updated after appending and ranking.
+        """
+        assert example_columnar.best_index() == 3
+        example_columnar.append(Point(x=np.array([3, 3]), y=-1))
+        assert example_columnar.best_index() == 5
+        example_columnar.rank(reverse=True)
+        assert example_columnar.best_index() == 5
+        assert example_columnar.best_y() == -1
@@ -0,0 +1,100 @@
+"""
+Unit tests for PointIndex class.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import ColumnarPointList, Point, PointIndex, PointList
+
+
+@pytest.fixture(name="example_pointlist")
+def fixture_example_pointlist():
+    """
+    An example PointList with a duplicated point.
+    """
+    return PointList.from_list(
+        [
+            np.array([0.0, 0.0]),
+            np.array([1.0, 0.5]),
+            np.array([1.0, 0.5]),
+            np.array([-2.0, 3.0]),
+        ]
+    )
+
+
+class TestPointIndex:
+    """
+    Unit tests for PointIndex class.
+    """
+
+    def test_contains(self, example_pointlist):
+        """
+        Test if indexed points are found and other points are not.
+        """
+        index = example_pointlist.index()
+        assert len(index) == 4
+        assert Point(x=np.array([-2, 3]), y=5) in index
+        assert Point(x=np.array([-2, 3.0000001])) not in index
+        assert Point(x=np.array([-2, 3, 0])) not in index
+
+    def test_index_of_returns_first_position(self, example_pointlist):
+        """
+        Test if index_of returns the position of the first matching point.
+        """
+        index = example_pointlist.index()
+        assert index.index_of(Point(x=np.array([1.0, 0.5]))) == 1
+        assert index.index_of(Point(x=np.array([9.0, 9.0]))) is None
+
+    def test_negative_zero(self):
+        """
+        Test if -0.0 and 0.0 are treated as equal, like in Point.__eq__.
+        """
+        index = PointIndex.from_points([Point(x=np.array([-0.0, 1.0]))])
+        assert Point(x=np.array([0.0, 1.0])) in index
+
+    def test_tolerance(self, example_pointlist):
+        """
+        Test if points falling in the same cell of the quantization grid match.
+        """
+        index = example_pointlist.index(tolerance=1e-3)
+        assert Point(x=np.array([-2, 3.0000001])) in index
+        assert Point(x=np.array([-2, 3.01])) not in index
+
+    def test_invalid_tolerance(self):
+        """
+        Test if a non-positive tolerance raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            PointIndex(tolerance=0)
+
+    def test_add(self):
+        """
+        Test if points can be added to the index incrementally.
+        """
+        index = PointIndex()
+        index.add(Point(x=np.array([1, 2])))
+        index.add_array(np.array([[3, 4], [5, 6]]))
+        assert len(index) == 3
+        assert index.index_of(Point(x=np.array([5, 6]))) == 2
+
+    def test_contains_array(self, example_pointlist):
+        """
+        Test if contains_array returns a mask of indexed rows.
+        """
+        index = PointIndex.from_array(example_pointlist.x())
+        mask = index.contains_array(np.array([[0, 0], [1, 1], [-2, 3]]))
+        assert np.array_equal(mask, [True, False, True])
+        assert len(index.contains_array(np.zeros((0, 2)))) == 0
+
+    def test_x_difference_tolerance(self, example_pointlist):
+        """
+        Test if x_difference of both list classes respects tolerance.
+        """
+        other = PointList.from_list([np.array([1.0001, 0.5]), np.array([0, 0])])
+        assert len(example_pointlist.x_difference(other)) == 3
+        assert len(example_pointlist.x_difference(other, tolerance=1e-2)) == 1
+
+        columnar = ColumnarPointList.from_point_list(example_pointlist)
+        assert len(columnar.x_difference(other)) == 3
+        assert len(columnar.x_difference(other, tolerance=1e-2)) == 1
@@ -2,6 +2,8 @@
 Unit tests for PointList dataclass.
 """
 
+import pickle
+
 import numpy as np
 import pytest
 
@@ -326,3 +328,133 @@ class TestPointList:
         """
         with pytest.raises(ValueError):
             PointList(points=[]).slice_to_best()
+
+    # running best-so-far state
+    def test_best_after_append(self, example_2d_pointlist):
+        """
+        Test if the best point is updated after appending and extending the list.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist.append(Point(x=np.array([3, 3]), y=0))
+        assert example_2d_pointlist.best_index() == 5
+        example_2d_pointlist.extend(
+            PointList(
+                points=[
+                    Point(x=np.array([4, 4]), y=-1),
+                    Point(x=np.array([5, 5]), y=-1),
+                ]
+            )
+        )
+        assert example_2d_pointlist.best_index() == 6
+        assert example_2d_pointlist.best_y() == -1
+
+    def test_best_after_rank(self, example_2d_pointlist):
+        """
+        Test if the best point is found after re-ranking the list.
+        """
+        assert example_2d_pointlist.best_index() == 3
+        example_2d_pointlist.rank(reverse=True)
+        assert example_2d_pointlist.best_index() == 4
+        assert example_2d_pointlist.best_y() == 1
+
+    def test_best_after_modifying_best_point(self, example_2d_pointlist):
+        """
+        Test if the list is rescanned when the best point is modified.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist[3].y = 20
+        assert example_2d_pointlist.best_index() == 4
+        assert example_2d_pointlist.best_y() == 2
+
+    def test_best_after_invalidate(self, example_2d_pointlist):
+        """
+        Test if invalidate_best() makes changes to other points visible.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist[0].y = -10
+        example_2d_pointlist.invalidate_best()
+        assert example_2d_pointlist.best_index() == 0
+
+    def test_best_after_removing_points(self, example_2d_pointlist):
+        """
+        Test if the best point is found after points are removed from the list.
+        """
+        assert example_2d_pointlist.best_index() == 3
+        del example_2d_pointlist.points[3:]
+        assert example_2d_pointlist.best_y() == 5
+
+    def test_best_after_pop_and_append(self, example_2d_pointlist):
+        """
+        Test if the best point is found after popping and appending points in place
+        and invalidating the best-so-far state.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist.points.pop()
+        example_2d_pointlist.points.append(Point(x=np.array([3, 3]), y=-5))
+        example_2d_pointlist.invalidate_best()
+        assert example_2d_pointlist.best_index() == 4
+        assert example_2d_pointlist.best_y() == -5
+
+    def test_best_after_appending_to_points(self, example_2d_pointlist):
+        """
+        Test if points appended directly to the points list are scanned on lookup.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist.points.append(Point(x=np.array([3, 3]), y=-5))
+        assert example_2d_pointlist.best_index() == 5
+
+    def test_best_after_assigning_points(self, example_2d_pointlist):
+        """
+        Test if the best point is found after a list is assigned to points.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist.points = [Point(x=np.array([3, 3]), y=7)]
+        assert example_2d_pointlist.best_index() == 0
+        assert example_2d_pointlist.best_y() == 7
+
+    def test_best_after_unpickling(self, example_2d_pointlist):
+        """
+        Test if the best-so-far state is not pickled, so modifications of points made
+        before pickling are visible after unpickling.
+        """
+        assert example_2d_pointlist.best_y() == 1
+        example_2d_pointlist.points[1].y = -5.0
+        restored = pickle.loads(pickle.dumps(example_2d_pointlist))
+        assert restored.best_y() == -5
+        assert restored.points[1].y == -5
+
+    def test_pickled_state(self, example_2d_pointlist):
+        """
+        Test if pickled state holds a plain list of points and no private attributes.
+        """
+        example_2d_pointlist.best_y()
+        state = example_2d_pointlist.__getstate__()
+        assert type(state["__dict__"]["points"]) is list
+        assert state["__pydantic_private__"] is None
+
+    def test_best_skips_missing_y(self):
+        """
+        Test if points with no y value are skipped.
+        """
+        points = PointList.from_list([np.array([0, 0]), np.array([1, 1])])
+        assert points.best_y() == np.inf
+        points.append(Point(x=np.array([2, 2]), y=3))
+        assert points.best_index() == 2
+
+    def test_equality_ignores_best_state(self, example_2d_pointlist):
+        """
+        Test if lists with the same points are equal regardless of best-so-far state.
+        """
+        other = PointList(points=list(example_2d_pointlist.points))
+        example_2d_pointlist.best_y()
+        assert example_2d_pointlist == other
+
+    def test_unpickle_without_best_state(self, example_2d_pointlist):
+        """
+        Test if lists pickled without private attributes can be unpickled.
+        """
+        state = example_2d_pointlist.__getstate__()
+        state["__pydantic_private__"] = None
+        restored = PointList.__new__(PointList)
+        restored.__setstate__(state)
+        assert restored.best_y() == 1
@@ -0,0 +1,86 @@
+"""
+Unit tests for PointRingBuffer class.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import ColumnarPointList, Point, PointList, PointRingBuffer
+
+
+@pytest.fixture(name="example_points")
+def fixture_example_points() -> PointList:
+    """
+    PointList of 10 evaluated 2D points, the y value of a point is its index.
+    """
+    return PointList(
+        points=[Point(x=np.array([i, -i]), y=i, is_evaluated=True) for i in range(10)]
+    )
+
+
+class TestPointRingBuffer:
+    """
+    Unit tests for PointRingBuffer class.
+    """
+
+    def test_invalid_capacity(self):
+        """
+        Test if a buffer with no capacity raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            PointRingBuffer(0)
+
+    def test_empty(self):
+        """
+        Test if a new buffer is empty.
+        """
+        buffer = PointRingBuffer(4, 2)
+        assert len(buffer) == 0
+        assert buffer.x().shape == (0, 2)
+        assert len(buffer.view()) == 0
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4, 10])
+    def test_keeps_last_points(self, example_points, chunk_size):
+        """
+        Test if the buffer holds the last points in order, whatever the chunks they were
+        added in.
+        """
+        buffer = PointRingBuffer(4)
+        for start in range(0, 10, chunk_size):
+            buffer.extend(example_points[start : start + chunk_size])
+            end = min(start + chunk_size, 10)
+
+            assert len(buffer) == min(end, 4)
+            assert np.array_equal(buffer.y(), np.arange(max(0, end - 4), end))
+            assert np.array_equal(buffer.x(), example_points[max(0, end - 4) : end].x())
+
+    def test_view_shares_arrays(self, example_points):
+        """
+        Test if the view of the buffer is a ColumnarPointList sharing its arrays.
+        """
+        buffer = PointRingBuffer(4)
+        buffer.extend(example_points[:7])
+        view = buffer.view()
+
+        assert isinstance(view, ColumnarPointList)
+        assert view.to_point_list() == example_points[3:7]
+        assert all(point.is_evaluated for point in view)
+        assert np.shares_memory(view.x(), buffer.x())
+        assert np.shares_memory(view.y(), buffer.y())
+
+    def test_extend_with_columnar(self, example_points):
+        """
+        Test if points can be added from a ColumnarPointList.
+        """
+        buffer = PointRingBuffer(4)
+        buffer.extend(ColumnarPointList.from_point_list(example_points))
+        assert buffer.view().to_point_list() == example_points[6:]
+
+    def test_dimensionality_mismatch(self, example_points):
+        """
+        Test if adding points of different dimensionality raises ValueError.
+        """
+        buffer = PointRingBuffer(4)
+        buffer.extend(example_points)
+        with pytest.raises(ValueError):
+            buffer.extend(PointList(points=[Point(x=np.zeros(3), y=0)]))
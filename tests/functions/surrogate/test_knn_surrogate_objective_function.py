@@ -2,6 +2,7 @@
 Unit tests for KNNSurrogateObjectiveFunction.
 """
 
+import faiss
 import numpy as np
 import pytest
 
@@ -179,3 +180,94 @@ class TestKNNSurrogateObjectiveFunction:
         knn_sof.train(train_set_2d_square)
         assert knn_sof(Point(x=np.array([0, 0]))).y == 0
         assert len(knn_sof.train_set) == len(train_set_2d_square)
+
+    @pytest.mark.parametrize("kwargs", [{"index_type": "annoy"}, {"metric": "cosine"}])
+    def test_invalid_index(self, kwargs):
+        """
+        Test if an invalid index type or metric raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            KNNSurrogateObjectiveFunction(3, **kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"index_type": "hnsw"},
+            {"index_type": "ivf", "ivf_nlist": 5, "ivf_nprobe": 5},
+        ],
+    )
+    def test_approximate_index_matches_exact(self, kwargs):
+        """
+        Test if approximate indexes in exhaustive settings give the same estimates as exact
+        search, and if the index parameters are recorded in metadata.
+        """
+        rng = np.random.default_rng(0)
+        train_set = PointList(
+            points=[
+                Point(x=x, y=float(np.sum(x**2)), is_evaluated=True)
+                for x in rng.normal(size=(100, 4))
+            ]
+        )
+        xs = rng.normal(size=(10, 4))
+
+        exact = KNNSurrogateObjectiveFunction(5, train_set)
+        approximate = KNNSurrogateObjectiveFunction(5, train_set, **kwargs)
+
+        assert np.allclose(approximate.predict_batch(xs), exact.predict_batch(xs))
+        assert (
+            approximate.metadata.hyperparameters["index_type"] == kwargs["index_type"]
+        )
+
+    @pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf"])
+    def test_inner_product_of_normalized_points(self, index_type):
+        """
+        Test if search by inner product gives the same estimates as euclidean search
+        for points normalized to unit length.
+        """
+        rng = np.random.default_rng(0)
+        xs_train = rng.normal(size=(100, 4))
+        xs_train /= np.linalg.norm(xs_train, axis=1, keepdims=True)
+        train_set = PointList(
+            points=[Point(x=x, y=float(x[0]), is_evaluated=True) for x in xs_train]
+        )
+        xs = rng.normal(size=(10, 4))
+        xs /= np.linalg.norm(xs, axis=1, keepdims=True)
+
+        exact = KNNSurrogateObjectiveFunction(5, train_set)
+        inner_product = KNNSurrogateObjectiveFunction(
+            5,
+            train_set,
+            index_type=index_type,
+            metric="inner_product",
+            ivf_nlist=5,
+            ivf_nprobe=5,
+        )
+        assert np.allclose(
+            inner_product.predict_batch(xs), exact.predict_batch(xs), atol=1e-5
+        )
+
+    @pytest.mark.parametrize("metric", ["l2", "inner_product"])
+    def test_no_neighbors_found(self, metric):
+        """
+        Test if points for which the index finds no neighbors are estimated
+        with exact search.
+        """
+        rng = np.random.default_rng(0)
+        train_set = PointList(
+            points=[
+                Point(x=x, y=float(np.sum(x**2)), is_evaluated=True)
+                for x in rng.normal(size=(50, 3))
+            ]
+        )
+        xs = rng.normal(size=(10, 3))
+
+        exact = KNNSurrogateObjectiveFunction(5, train_set, metric=metric)
+        approximate = KNNSurrogateObjectiveFunction(
+            5, train_set, index_type="ivf", metric=metric
+        )
+        assert approximate.faiss_index is not None
+        approximate.faiss_index.remove_ids(faiss.IDSelectorRange(0, 50))
+
+        ys = approximate.predict_batch(xs)
+        assert not np.any(np.isnan(ys))
+        assert np.allclose(ys, exact.predict_batch(xs))
@@ -0,0 +1,93 @@
+"""
+Unit tests for LocallyWeightedPolynomialRegression.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Point, PointList
+from optilab.functions.surrogate.locally_weighted_polynomial_regression import (
+    LocallyWeightedPolynomialRegression,
+    biquadratic_kernel_function,
+)
+
+
+@pytest.fixture(name="quadratic_train_set")
+def fixture_quadratic_train_set() -> PointList:
+    """
+    Train set of 40 random points in 2D evaluated with a quadratic function.
+    """
+    rng = np.random.default_rng(0)
+    return PointList(
+        points=[
+            Point(
+                x=x, y=float(x[0] ** 2 + 3 * x[0] * x[1] - x[1] + 2), is_evaluated=True
+            )
+            for x in rng.uniform(-3, 3, (40, 2))
+        ]
+    )
+
+
+class TestLocallyWeightedPolynomialRegression:
+    """
+    Unit tests for LocallyWeightedPolynomialRegression.
+    """
+
+    def test_biquadratic_kernel(self):
+        """
+        Test if the kernel is applied elementwise and vanishes outside of the unit interval.
+        """
+        weights = biquadratic_kernel_function(np.array([[0.0, 0.5], [1.0, -2.0]]))
+        assert np.allclose(weights, [[1.0, 0.5625], [0.0, 0.0]])
+        assert biquadratic_kernel_function(0.5) == 0.5625
+
+    def test_quadratic_function_is_exact(self, quadratic_train_set):
+        """
+        Test if a quadratic function is reproduced by a local model of degree 2.
+        """
+        surrogate = LocallyWeightedPolynomialRegression(2, 12, quadratic_train_set)
+        xs = np.array([[0.0, 0.0], [1.0, -1.0], [2.0, 0.5]])
+
+        assert np.allclose(surrogate.predict_batch(xs), [2.0, 1.0, 8.5])
+        assert surrogate.metadata.dim == 2
+
+    def test_covariance_matrix(self, quadratic_train_set):
+        """
+        Test if neighbors chosen with a mahalanobis distance still give an exact fit.
+        """
+        surrogate = LocallyWeightedPolynomialRegression(
+            2, 12, covariance_matrix=np.array([[4.0, 1.0], [1.0, 1.0]])
+        )
+        surrogate.train(quadratic_train_set)
+        y = surrogate(Point(x=np.array([1.0, 1.0]))).y
+        assert y is not None
+        assert np.isclose(y, 5.0)
+
+    def test_scalar_kernel_function(self, quadratic_train_set):
+        """
+        Test if a kernel function taking a single value gives the same estimates
+        as the vectorized one.
+        """
+        surrogate = LocallyWeightedPolynomialRegression(
+            2,
+            12,
+            kernel_function=lambda x: 0 if np.abs(x) >= 1 else (1 - x**2) ** 2,
+        )
+        surrogate.train(quadratic_train_set)
+        reference = LocallyWeightedPolynomialRegression(2, 12)
+        reference.train(quadratic_train_set)
+        xs = np.array([[0.5, -0.5], [1.5, 2.0]])
+        assert np.allclose(surrogate.predict_batch(xs), reference.predict_batch(xs))
+
+    def test_neighbors_at_same_location(self):
+        """
+        Test if neighbors at a single location get equal weights.
+        """
+        train_set = PointList(
+            points=[
+                Point(x=np.array([1.0, 1.0]), y=4.0, is_evaluated=True)
+                for _ in range(6)
+            ]
+        )
+        surrogate = LocallyWeightedPolynomialRegression(1, 6, train_set)
+        assert np.allclose(surrogate.predict_batch(np.ones((2, 2))), 4.0)
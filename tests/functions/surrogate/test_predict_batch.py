@@ -0,0 +1,92 @@
+"""
+Unit tests for batched prediction of surrogate objective functions.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Point, PointList
+from optilab.functions.surrogate import (
+    KNNSurrogateObjectiveFunction,
+    LocallyWeightedPolynomialRegression,
+    MLPSurrogateObjectiveFunction,
+    NormalizedMLPSurrogateObjectiveFunction,
+    PolynomialRegression,
+    XGBoostSurrogateObjectiveFunction,
+)
+
+SURROGATES = {
+    "knn": lambda: KNNSurrogateObjectiveFunction(5),
+    "polynomial": lambda: PolynomialRegression(2),
+    "lwpr": lambda: LocallyWeightedPolynomialRegression(
+        2, 20, covariance_matrix=np.eye(3)
+    ),
+    "mlp": lambda: MLPSurrogateObjectiveFunction((8,), max_iter=50, random_seed=0),
+    "normalized_mlp": lambda: NormalizedMLPSurrogateObjectiveFunction(
+        (8,), max_iter=50, random_seed=0
+    ),
+    "xgboost": lambda: XGBoostSurrogateObjectiveFunction(n_estimators=10),
+}
+
+
+@pytest.fixture(name="sphere_train_set")
+def fixture_sphere_train_set() -> PointList:
+    """
+    Train set of 50 random points in 3D evaluated with the sphere function.
+    """
+    rng = np.random.default_rng(0)
+    return PointList(
+        points=[
+            Point(x=x, y=float(np.sum(x**2)), is_evaluated=True)
+            for x in rng.uniform(-5, 5, (50, 3))
+        ]
+    )
+
+
+class TestPredictBatch:
+    """
+    Unit tests for batched prediction of surrogate objective functions.
+    """
+
+    @pytest.mark.parametrize("name", SURROGATES)
+    def test_matches_single_predictions(self, name, sphere_train_set):
+        """
+        Test if batched predictions are equal to predictions of single points.
+        """
+        surrogate = SURROGATES[name]()
+        surrogate.train(sphere_train_set)
+        xs = np.random.default_rng(1).uniform(-4, 4, (7, 3))
+
+        ys = surrogate.predict_batch(xs)
+        assert ys.shape == (7,)
+        assert ys.dtype == np.float64
+        assert np.allclose(ys, [surrogate(Point(x=x)).y for x in xs])
+        assert surrogate.num_calls == 14
+
+    @pytest.mark.parametrize("name", SURROGATES)
+    def test_evaluate_point_list(self, name, sphere_train_set):
+        """
+        Test if points are estimated with predict_batch and not marked as evaluated.
+        """
+        surrogate = SURROGATES[name]()
+        surrogate.train(sphere_train_set)
+        points = PointList.from_list(list(np.zeros((3, 3))))
+
+        estimated = surrogate.evaluate_point_list(points)
+        assert np.allclose(estimated.y(), surrogate.predict_batch(points.x()))
+        assert not any(point.is_evaluated for point in estimated)
+
+    def test_not_trained(self):
+        """
+        Test if predicting with an untrained surrogate raises NotImplementedError.
+        """
+        with pytest.raises(NotImplementedError):
+            KNNSurrogateObjectiveFunction(3).predict_batch(np.zeros((2, 3)))
+
+    def test_wrong_dimensionality(self, sphere_train_set):
+        """
+        Test if a batch with wrong dimensionality raises ValueError.
+        """
+        surrogate = PolynomialRegression(2, sphere_train_set)
+        with pytest.raises(ValueError):
+            surrogate.predict_batch(np.zeros((2, 4)))
@@ -0,0 +1,164 @@
+"""
+Unit tests for incremental updates of surrogate objective functions.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import ColumnarPointList, Point, PointList, PointRingBuffer
+from optilab.functions.surrogate import (
+    KNNSurrogateObjectiveFunction,
+    LocallyWeightedPolynomialRegression,
+    PolynomialRegression,
+)
+
+SURROGATES = {
+    "knn": lambda: KNNSurrogateObjectiveFunction(5),
+    "knn_hnsw": lambda: KNNSurrogateObjectiveFunction(5, index_type="hnsw"),
+    "knn_ivf": lambda: KNNSurrogateObjectiveFunction(
+        5, index_type="ivf", ivf_nlist=4, ivf_nprobe=4
+    ),
+    "polynomial": lambda: PolynomialRegression(2),
+    "lwpr": lambda: LocallyWeightedPolynomialRegression(2, 20),
+}
+
+
+@pytest.fixture(name="sphere_points")
+def fixture_sphere_points() -> PointList:
+    """
+    List of 60 random points in 3D evaluated with the sphere function.
+    """
+    rng = np.random.default_rng(0)
+    return PointList(
+        points=[
+            Point(x=x, y=float(np.sum(x**2)), is_evaluated=True)
+            for x in rng.uniform(-5, 5, (60, 3))
+        ]
+    )
+
+
+class TestUpdate:
+    """
+    Unit tests for incremental updates of surrogate objective functions.
+    """
+
+    @pytest.mark.parametrize("name", SURROGATES)
+    @pytest.mark.parametrize("buffer_size", [None, 30])
+    def test_matches_training_from_scratch(self, name, buffer_size, sphere_points):
+        """
+        Test if a surrogate updated in steps is equal to one trained on the whole window.
+        """
+        window = PointRingBuffer(buffer_size) if buffer_size else ColumnarPointList()
+        updated = SURROGATES[name]()
+        for start in range(0, 60, 7):
+            new_points = sphere_points[start : start + 7]
+            window.extend(new_points)
+            updated.update(new_points, window.view())
+
+        trained = SURROGATES[name]()
+        trained.train(sphere_points[-(buffer_size or 60) :])
+
+        assert np.array_equal(updated.train_set.x(), trained.train_set.x())
+        xs = np.random.default_rng(1).uniform(-4, 4, (10, 3))
+        assert np.allclose(updated.predict_batch(xs), trained.predict_batch(xs))
+
+    @pytest.mark.parametrize("name", SURROGATES)
+    def test_update_larger_than_window(self, name, sphere_points):
+        """
+        Test if only the points of an update larger than the window that fit in it are kept.
+        """
+        surrogate = SURROGATES[name]()
+        surrogate.train(sphere_points[:30])
+        surrogate.update(sphere_points[30:], sphere_points[-25:])
+
+        assert surrogate.train_set == sphere_points[-25:]
+
+    @pytest.mark.parametrize("name", SURROGATES)
+    def test_empty_update(self, name, sphere_points):
+        """
+        Test if an update with no points keeps the model unchanged.
+        """
+        surrogate = SURROGATES[name]()
+        surrogate.train(sphere_points)
+        xs = np.random.default_rng(1).uniform(-4, 4, (10, 3))
+        ys = surrogate.predict_batch(xs)
+
+        surrogate.update(PointList(points=[]), sphere_points)
+        assert np.allclose(surrogate.predict_batch(xs), ys)
+
+    @pytest.mark.parametrize("name", ["knn", "lwpr"])
+    def test_window_longer_than_update(self, name, sphere_points):
+        """
+        Test if updating with a training set longer than the old set with new points
+        raises ValueError.
+        """
+        surrogate = SURROGATES[name]()
+        surrogate.train(sphere_points[:30])
+
+        with pytest.raises(ValueError):
+            surrogate.update(sphere_points[30:35], sphere_points)
+
+    @pytest.mark.parametrize("name", ["knn", "lwpr"])
+    def test_dimensionality_mismatch(self, name, sphere_points):
+        """
+        Test if updating with points of different dimensionality raises ValueError.
+        """
+        surrogate = SURROGATES[name]()
+        surrogate.train(sphere_points)
+
+        with pytest.raises(ValueError):
+            new_points = PointList(
+                points=[Point(x=np.zeros(2), y=0.0, is_evaluated=True)]
+            )
+            surrogate.update(
+                new_points,
+                PointList(points=sphere_points.points[1:] + new_points.points),
+            )
+
+    def test_ivf_rebuilt_after_turnover(self, sphere_points):
+        """
+        Test if the IVF index is rebuilt on the current window once all points
+        it was built from were dropped.
+        """
+        surrogate = KNNSurrogateObjectiveFunction(
+            5, index_type="ivf", ivf_nlist=4, ivf_nprobe=1
+        )
+        surrogate.train(sphere_points[:20])
+        index = surrogate.faiss_index
+
+        surrogate.update(sphere_points[20:30], sphere_points[10:30])
+        assert surrogate.faiss_index is index
+
+        xs_new, ys_new = sphere_points[30:40].pairs()
+        shifted = PointList(
+            points=[
+                Point(x=x, y=float(y), is_evaluated=True)
+                for x, y in zip(xs_new + 100, ys_new, strict=True)
+            ]
+        )
+        surrogate.update(
+            shifted, PointList(points=sphere_points.points[20:30] + shifted.points)
+        )
+        assert surrogate.faiss_index is not index
+
+        trained = KNNSurrogateObjectiveFunction(
+            5, index_type="ivf", ivf_nlist=4, ivf_nprobe=1
+        )
+        trained.train(surrogate.train_set)
+        xs = np.random.default_rng(1).uniform(96, 104, (10, 3))
+        assert np.allclose(surrogate.predict_batch(xs), trained.predict_batch(xs))
+
+    def test_covariance_change_rebuilds_index(self, sphere_points):
+        """
+        Test if setting a new covariance matrix of a trained LWPR surrogate gives the same
+        estimates as training it with that matrix.
+        """
+        covariance_matrix = np.diag([4.0, 1.0, 0.25])
+        changed = LocallyWeightedPolynomialRegression(2, 20, sphere_points)
+        changed.set_covariance_matrix(covariance_matrix)
+        trained = LocallyWeightedPolynomialRegression(
+            2, 20, sphere_points, covariance_matrix
+        )
+
+        xs = np.random.default_rng(1).uniform(-4, 4, (10, 3))
+        assert np.allclose(changed.predict_batch(xs), trained.predict_batch(xs))
@@ -0,0 +1,165 @@
+"""
+Unit tests for warm started retraining of MLP and XGBoost surrogate objective functions.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Point, PointList
+from optilab.functions.surrogate import (
+    MLPSurrogateObjectiveFunction,
+    NormalizedMLPSurrogateObjectiveFunction,
+    XGBoostSurrogateObjectiveFunction,
+)
+
+
+@pytest.fixture(name="sphere_points")
+def fixture_sphere_points() -> PointList:
+    """
+    List of 100 random points in 3D evaluated with the sphere function.
+    """
+    rng = np.random.default_rng(0)
+    return PointList(
+        points=[
+            Point(x=x, y=float(np.sum(x**2)), is_evaluated=True)
+            for x in rng.uniform(-5, 5, (100, 3))
+        ]
+    )
+
+
+class TestMLPWarmStart:
+    """
+    Unit tests for warm started retraining of MLP surrogate objective functions.
+    """
+
+    @pytest.mark.parametrize(
+        "surrogate_class",
+        [MLPSurrogateObjectiveFunction, NormalizedMLPSurrogateObjectiveFunction],
+    )
+    def test_warm_start_reuses_network(self, surrogate_class, sphere_points):
+        """
+        Test if retraining continues fitting the same network for a capped number of epochs.
+        """
+        surrogate = surrogate_class(
+            (8,), random_seed=0, warm_start=True, warm_start_max_iter=5
+        )
+        surrogate.train(sphere_points[:80])
+        model = surrogate.model
+        num_samples = model.t_
+
+        surrogate.train(sphere_points[20:])
+        assert surrogate.model is model
+        assert num_samples < surrogate.model.t_ <= num_samples + 5 * 80
+        assert surrogate.predict_batch(np.zeros((2, 3))).shape == (2,)
+
+    def test_cold_start_replaces_network(self, sphere_points):
+        """
+        Test if without warm start a new network is fitted on every training.
+        """
+        surrogate = MLPSurrogateObjectiveFunction((8,), random_seed=0, max_iter=20)
+        surrogate.train(sphere_points[:80])
+        model = surrogate.model
+        surrogate.train(sphere_points[20:])
+        assert surrogate.model is not model
+
+    def test_lbfgs_warm_start(self, sphere_points):
+        """
+        Test if a network with lbfgs solver is warm started too.
+        """
+        surrogate = MLPSurrogateObjectiveFunction(
+            (8,), solver="lbfgs", max_iter=20, warm_start=True, warm_start_max_iter=5
+        )
+        surrogate.train(sphere_points[:80])
+        model = surrogate.model
+        surrogate.train(sphere_points[20:])
+        assert surrogate.model is model
+        assert model is not None
+        assert model.n_iter_ <= 5
+
+    def test_normalized_warm_start_keeps_accuracy(self):
+        """
+        Test if the normalized MLP stays accurate after a warm start on a training set
+        with a different distribution, as it keeps the scalers the network was fitted with.
+        """
+        rng = np.random.default_rng(0)
+        xs_train = np.vstack([rng.uniform(-5, 5, (80, 3)), rng.uniform(-2, 8, (40, 3))])
+        train_set = PointList(
+            points=[
+                Point(x=x, y=float(np.sum(x**2)), is_evaluated=True) for x in xs_train
+            ]
+        )
+        xs = rng.uniform(-2, 5, (50, 3))
+        ys = np.sum(xs**2, axis=1)
+
+        surrogate = NormalizedMLPSurrogateObjectiveFunction(
+            (32,),
+            max_iter=2000,
+            early_stopping=False,
+            random_seed=0,
+            warm_start=True,
+            warm_start_max_iter=1,
+        )
+        surrogate.train(train_set[:80])
+        error = np.sqrt(np.mean((surrogate.predict_batch(xs) - ys) ** 2))
+
+        surrogate.train(train_set[40:])
+        warm_error = np.sqrt(np.mean((surrogate.predict_batch(xs) - ys) ** 2))
+        assert warm_error < 1.5 * error
+
+    def test_hyperparameters(self):
+        """
+        Test if warm start settings are stored in function metadata.
+        """
+        surrogate = MLPSurrogateObjectiveFunction(warm_start=True)
+        assert surrogate.metadata.hyperparameters["warm_start"] is True
+        assert surrogate.metadata.hyperparameters["warm_start_max_iter"] == 10
+
+
+class TestXGBoostWarmStart:
+    """
+    Unit tests for warm started retraining of XGBoost surrogate objective function.
+    """
+
+    def test_boosting_continues_until_refit(self, sphere_points):
+        """
+        Test if retraining adds boosting rounds and every refit_interval trainings
+        the model is fitted from scratch.
+        """
+        surrogate = XGBoostSurrogateObjectiveFunction(
+            n_estimators=20, warm_start=True, warm_start_rounds=5, refit_interval=3
+        )
+        num_rounds = []
+        for start in range(0, 20, 5):
+            surrogate.train(sphere_points[start : start + 80])
+            assert surrogate.model is not None
+            num_rounds.append(surrogate.model.get_booster().num_boosted_rounds())
+        assert num_rounds == [20, 25, 30, 20]
+        assert surrogate.predict_batch(np.zeros((2, 3))).shape == (2,)
+
+    def test_cold_start(self, sphere_points):
+        """
+        Test if without warm start the number of boosting rounds doesn't grow.
+        """
+        surrogate = XGBoostSurrogateObjectiveFunction(n_estimators=20)
+        surrogate.train(sphere_points[:80])
+        surrogate.train(sphere_points[20:])
+        assert surrogate.model is not None
+        assert surrogate.model.get_booster().num_boosted_rounds() == 20
+
+    def test_dimensionality_change_refits(self, sphere_points):
+        """
+        Test if a model trained on points of different dimensionality is not warm started.
+        """
+        surrogate = XGBoostSurrogateObjectiveFunction(n_estimators=20, warm_start=True)
+        surrogate.train(sphere_points)
+        surrogate.train(
+            PointList(
+                points=[
+                    Point(x=point.x[:2], y=point.y, is_evaluated=True)
+                    for point in sphere_points.points
+                ]
+            )
+        )
+        assert surrogate.model is not None
+        assert surrogate.model.get_booster().num_boosted_rounds() == 20
+        assert surrogate.predict_batch(np.zeros((1, 2))).shape == (1,)
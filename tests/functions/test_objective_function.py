@@ -0,0 +1,109 @@
+"""
+Unit tests for batch evaluation API of ObjectiveFunction.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Point, PointList
+from optilab.functions import ObjectiveFunction
+from optilab.functions.unimodal import SphereFunction
+
+
+class PointByPointFunction(ObjectiveFunction):
+    """
+    Objective function that only implements __call__, like most user defined functions.
+    """
+
+    def __init__(self, dim: int):
+        super().__init__("point_by_point", dim)
+
+    def __call__(self, point: Point) -> Point:
+        super().__call__(point)
+        assert point.x is not None
+        return Point(x=point.x, y=float(np.sum(point.x)), is_evaluated=True)
+
+
+class KernelFunction(ObjectiveFunction):
+    """
+    Objective function that only implements the vectorized kernel.
+    """
+
+    def __init__(self, dim: int):
+        super().__init__("kernel", dim)
+
+    def _kernel(self, xs: np.ndarray) -> np.ndarray:
+        return np.sum(xs, axis=1)
+
+
+class TestObjectiveFunctionBatch:
+    """
+    Unit tests for batch evaluation API of ObjectiveFunction.
+    """
+
+    def test_fallback_evaluate_batch(self):
+        """
+        Test if a function without a vectorized kernel is evaluated point by point.
+        """
+        function = PointByPointFunction(3)
+        ys = function.evaluate_batch(np.array([[1, 2, 3], [0, 0, 0], [-1, 1, 5]]))
+        assert np.array_equal(ys, [6, 0, 5])
+        assert function.num_calls == 3
+
+    def test_evaluate_batch_counts_calls(self):
+        """
+        Test if evaluate_batch increments the call counter by the size of the batch.
+        """
+        function = SphereFunction(2)
+        function.evaluate_batch(np.zeros((10, 2)))
+        function(Point(x=np.zeros(2)))
+        assert function.num_calls == 11
+
+    def test_evaluate_batch_wrong_dim(self):
+        """
+        Test if evaluate_batch raises ValueError when dimensionality doesn't match.
+        """
+        with pytest.raises(ValueError):
+            SphereFunction(2).evaluate_batch(np.zeros((10, 3)))
+        with pytest.raises(ValueError):
+            PointByPointFunction(2).evaluate_batch(np.zeros((10, 3)))
+
+    def test_evaluate_batch_empty(self):
+        """
+        Test if evaluating an empty batch returns an empty array.
+        """
+        function = SphereFunction(2)
+        ys = function.evaluate_batch(np.zeros((0, 2)))
+        assert len(ys) == 0
+        assert function.num_calls == 0
+
+    def test_evaluate_point_list(self):
+        """
+        Test if evaluate_point_list returns evaluated points matching single point calls.
+        """
+        function = PointByPointFunction(2)
+        points = PointList.from_list([np.array([1, 2]), np.array([3, 4])])
+        evaluated = function.evaluate_point_list(points)
+        assert len(evaluated) == 2
+        assert all(point.is_evaluated for point in evaluated)
+        assert np.array_equal(evaluated.y(), [3, 7])
+        assert np.array_equal(evaluated.x(), points.x())
+
+    def test_evaluate_point_list_empty(self):
+        """
+        Test if evaluate_point_list works on an empty PointList.
+        """
+        assert len(SphereFunction(2).evaluate_point_list(PointList(points=[]))) == 0
+
+    def test_kernel_dispatch(self):
+        """
+        Test if a function implementing only the kernel is evaluated with it,
+        both point by point and in batches.
+        """
+        function = KernelFunction(3)
+        point = function(Point(x=np.array([1, 2, 3])))
+        assert point.y == 6
+        assert point.is_evaluated
+        ys = function.evaluate_batch(np.array([[0, 0, 0], [-1, 1, 5]]))
+        assert np.array_equal(ys, [0, 5])
+        assert function.num_calls == 3
@@ -0,0 +1,92 @@
+"""
+Parity tests of vectorized kernels of unimodal and multimodal functions against
+reference scalar implementations.
+"""
+
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Point
+from optilab.functions.multimodal import (
+    AckleyFunction,
+    RastriginFunction,
+    RosenbrockFunction,
+)
+from optilab.functions.unimodal import (
+    BentCigarFunction,
+    CumulativeSquaredSums,
+    IncreasingWeightCigar,
+    LinearFunction,
+    SphereFunction,
+)
+
+
+def ackley(x: np.ndarray) -> float:
+    """Reference scalar implementation of the Ackley function."""
+    return (
+        20
+        - 20 * np.exp(-0.2 * np.sqrt(sum(x_i**2 for x_i in x) / len(x)))
+        + np.e
+        - np.exp(sum(np.cos(2 * np.pi * x_i) for x_i in x) / len(x))
+    )
+
+
+def rastrigin(x: np.ndarray) -> float:
+    """Reference scalar implementation of the Rastrigin function."""
+    return sum(x_i**2 - 10 * np.cos(2 * np.pi * x_i) + 10 for x_i in x)
+
+
+def rosenbrock(x: np.ndarray) -> float:
+    """Reference scalar implementation of the Rosenbrock function."""
+    return sum(
+        100 * (x_i**2 - x_i_next) ** 2 + (x_i - 1) ** 2 for x_i, x_i_next in pairwise(x)
+    )
+
+
+def bent_cigar(x: np.ndarray) -> float:
+    """Reference scalar implementation of the Bent Cigar function."""
+    return x[0] ** 2 + sum(x[1:] ** 2) * (10**6)
+
+
+def cumulative_squared_sums(x: np.ndarray) -> float:
+    """Reference scalar implementation of the cumulative squared sums function."""
+    return sum(sum(x[:i]) ** 2 for i in range(len(x)))
+
+
+def increasing_weight_cigar(x: np.ndarray) -> float:
+    """Reference scalar implementation of the Increasing Weight Cigar function."""
+    return sum(10**i * x_i**2 for i, x_i in enumerate(x))
+
+
+REFERENCE_FUNCTIONS = [
+    (AckleyFunction, ackley),
+    (RastriginFunction, rastrigin),
+    (RosenbrockFunction, rosenbrock),
+    (BentCigarFunction, bent_cigar),
+    (CumulativeSquaredSums, cumulative_squared_sums),
+    (IncreasingWeightCigar, increasing_weight_cigar),
+    (LinearFunction, np.sum),
+    (SphereFunction, lambda x: np.sum(x**2)),
+]
+
+
+@pytest.mark.parametrize("function_class,reference", REFERENCE_FUNCTIONS)
+@pytest.mark.parametrize("dim", [1, 2, 10, 50])
+def test_kernel_parity(function_class, reference, dim):
+    """
+    Check if evaluate_batch and __call__ give the same results as the reference
+    scalar implementation.
+    """
+    xs = np.random.default_rng(dim).uniform(-5, 5, size=(20, dim))
+    function = function_class(dim)
+    expected = np.array([reference(x) for x in xs], dtype=np.float64)
+
+    batch_ys = function.evaluate_batch(xs)
+    point_ys = np.array([function(Point(x=x)).y for x in xs], dtype=np.float64)
+
+    assert batch_ys.shape == (20,)
+    assert np.allclose(batch_ys, expected, rtol=1e-10, atol=1e-10)
+    assert np.allclose(point_ys, expected, rtol=1e-10, atol=1e-10)
+    assert function.num_calls == 40
@@ -0,0 +1,90 @@
+"""
+Unit tests for ApproximateRankingMetamodel.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import PointList
+from optilab.functions.surrogate import KNNSurrogateObjectiveFunction
+from optilab.functions.unimodal import SphereFunction
+from optilab.metamodels import ApproximateRankingMetamodel
+
+
+@pytest.fixture(name="metamodel")
+def fixture_metamodel() -> ApproximateRankingMetamodel:
+    """
+    Metamodel of a 3D sphere function with a KNN surrogate, trained on one population.
+    """
+    metamodel = ApproximateRankingMetamodel(
+        20, 10, SphereFunction(3), KNNSurrogateObjectiveFunction(5)
+    )
+    metamodel.adapt(
+        PointList.from_list(list(np.random.default_rng(0).normal(size=(20, 3))))
+    )
+    return metamodel
+
+
+@pytest.fixture(name="population")
+def fixture_population() -> PointList:
+    """
+    Population of 20 points in 3D.
+    """
+    return PointList.from_list(list(np.random.default_rng(1).normal(size=(20, 3))))
+
+
+class TestApproximateRankingMetamodel:
+    """
+    Unit tests for ApproximateRankingMetamodel.
+    """
+
+    def test_adapt(self, metamodel, population):
+        """
+        Test if adapt evaluates between n_init and all points of the population.
+        """
+        n_init = metamodel.n_init
+        metamodel.adapt(population)
+
+        num_evaluated = len(metamodel.get_log()) - 20
+        assert n_init <= num_evaluated <= 20
+        assert metamodel.objective_function.num_calls == 20 + num_evaluated
+        assert all(point in population.points for point in metamodel.get_log()[20:])
+
+    def test_population_estimated_once_per_retrain(self, metamodel, population):
+        """
+        Test if the surrogate estimates the population once after each retrain.
+        """
+        surrogate = metamodel.surrogate_function
+        surrogate.num_calls = 0
+        metamodel.adapt(population)
+
+        num_retrains = len(metamodel.get_log()) - 20 - metamodel.n_init + 1
+        assert surrogate.num_calls <= 20 * (num_retrains + 1)
+
+    def test_call_reuses_predictions(self, metamodel, population):
+        """
+        Test if the population is estimated by the surrogate only once between retrains.
+        """
+        metamodel.surrogate_function.num_calls = 0
+        metamodel(population)
+        estimated = metamodel(population)
+
+        assert metamodel.surrogate_function.num_calls == 20
+        assert estimated == population
+        assert not any(point.is_evaluated for point in estimated)
+        assert np.allclose(
+            estimated.y(), metamodel.surrogate_function.predict_batch(population.x())
+        )
+
+    def test_retrain_invalidates_predictions(self, metamodel, population):
+        """
+        Test if predictions are recomputed after the surrogate is retrained.
+        """
+        before = metamodel(population).y()
+        metamodel.evaluate(population)
+        after = metamodel(population).y()
+
+        assert not np.allclose(before, after)
+        assert np.allclose(
+            after, metamodel.objective_function.evaluate_batch(population.x())
+        )
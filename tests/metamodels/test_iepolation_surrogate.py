@@ -0,0 +1,126 @@
+"""
+Unit tests for IEPolationSurrogate.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Point, PointList
+from optilab.functions.surrogate import (
+    KNNSurrogateObjectiveFunction,
+    PolynomialRegression,
+)
+from optilab.metamodels import IEPolationSurrogate
+
+
+def make_train_set(xs: np.ndarray) -> PointList:
+    """
+    Make a train set of points evaluated with the sphere function.
+
+    Args:
+        xs: Matrix of x values of the points.
+
+    Returns:
+        List of evaluated points.
+    """
+    return PointList(
+        points=[Point(x=x, y=float(np.sum(x**2)), is_evaluated=True) for x in xs]
+    )
+
+
+@pytest.fixture(name="cube_train_set")
+def fixture_cube_train_set() -> PointList:
+    """
+    Train set made of vertices of a 3D cube [-1, 1]^3.
+    """
+    vertices = np.array(np.meshgrid(*[[-1.0, 1.0]] * 3)).reshape(3, -1).T
+    return make_train_set(vertices)
+
+
+class TestIEPolationSurrogate:
+    """
+    Unit tests for IEPolationSurrogate.
+    """
+
+    @pytest.mark.parametrize("max_hull_dim", [8, 0])
+    def test_points_in_convex_hull(self, cube_train_set, max_hull_dim):
+        """
+        Test if points inside and on the boundary of a cube are inside of the hull,
+        with both the explicit hull and linear programming.
+        """
+        surrogate = IEPolationSurrogate(
+            KNNSurrogateObjectiveFunction(2),
+            PolynomialRegression(1),
+            cube_train_set,
+            max_hull_dim=max_hull_dim,
+        )
+        xs = np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [0.9, -0.9, 0.5],
+                [1.0, 1.0, 1.0],
+                [1.0, 0.0, 0.0],
+                [1.1, 0.0, 0.0],
+                [0.0, 0.0, -2.0],
+            ]
+        )
+        assert np.array_equal(
+            surrogate.points_in_convex_hull(xs),
+            [True, True, True, True, False, False],
+        )
+        assert (surrogate.hull_equations is None) == (max_hull_dim == 0)
+
+    def test_high_dimensional_matches_explicit_hull(self):
+        """
+        Test if linear programming agrees with the explicit hull on random points.
+        """
+        rng = np.random.default_rng(0)
+        train_set = make_train_set(rng.normal(size=(40, 4)))
+        xs = rng.normal(size=(50, 4))
+
+        explicit = IEPolationSurrogate(
+            KNNSurrogateObjectiveFunction(2), PolynomialRegression(1), train_set
+        )
+        linprog = IEPolationSurrogate(
+            KNNSurrogateObjectiveFunction(2),
+            PolynomialRegression(1),
+            train_set,
+            max_hull_dim=3,
+        )
+        inside = explicit.points_in_convex_hull(xs)
+        assert 0 < inside.sum() < len(xs)
+        assert np.array_equal(linprog.points_in_convex_hull(xs), inside)
+
+    def test_degenerate_train_set(self):
+        """
+        Test if a train set lying on a plane falls back to linear programming.
+        """
+        rng = np.random.default_rng(0)
+        xs = np.hstack([rng.uniform(-1, 1, (20, 2)), np.zeros((20, 1))])
+        surrogate = IEPolationSurrogate(
+            KNNSurrogateObjectiveFunction(2),
+            PolynomialRegression(1),
+            make_train_set(xs),
+        )
+
+        assert surrogate.hull_equations is None
+        assert np.array_equal(
+            surrogate.points_in_convex_hull(np.array([[0, 0, 0], [0, 0, 0.1]])),
+            [True, False],
+        )
+
+    def test_predict_batch(self, cube_train_set):
+        """
+        Test if points are estimated by the surrogate matching their location.
+        """
+        interpolation = KNNSurrogateObjectiveFunction(2)
+        extrapolation = PolynomialRegression(1)
+        surrogate = IEPolationSurrogate(interpolation, extrapolation, cube_train_set)
+        xs = np.array([[0.5, 0.5, 0.5], [3.0, 0.0, 0.0], [0.0, -0.2, 0.1]])
+
+        ys = surrogate.predict_batch(xs)
+        assert np.allclose(ys[[0, 2]], interpolation.predict_batch(xs[[0, 2]]))
+        assert np.isclose(ys[1], extrapolation.predict_batch(xs[[1]])[0])
+        estimate = surrogate(Point(x=xs[1])).y
+        assert estimate is not None
+        assert np.isclose(estimate, ys[1])
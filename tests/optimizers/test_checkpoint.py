@@ -0,0 +1,143 @@
+"""
+Unit tests for checkpointing and resuming optimization runs.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Bounds
+from optilab.functions.unimodal import SphereFunction
+from optilab.optimizers import CmaEs, IpopCmaEs, KnnCmaEs, LmmIpopCmaEs, RunCheckpoint
+
+BOUNDS = Bounds(lower=-5, upper=5)
+
+
+class RunInterruptedError(Exception):
+    """
+    Exception simulating a killed optimization job.
+    """
+
+
+class InterruptedSphere(SphereFunction):
+    """
+    Sphere function that fails after a given number of calls.
+    """
+
+    def __init__(self, dim: int, max_calls: int):
+        super().__init__(dim)
+        self.max_calls = max_calls
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        if self.num_calls + len(xs) > self.max_calls:
+            raise RunInterruptedError
+        return super().evaluate_batch(xs)
+
+
+OPTIMIZERS = [
+    CmaEs(6, 1.0),
+    IpopCmaEs(6),
+    KnnCmaEs(6, 1.0, 5, 30),
+    LmmIpopCmaEs(6, 2),
+]
+
+
+class TestCheckpoint:
+    """
+    Unit tests for checkpointing and resuming optimization runs.
+    """
+
+    @pytest.mark.parametrize("optimizer", OPTIMIZERS)
+    def test_resume_single_run(self, tmp_path, optimizer):
+        """
+        Test if an interrupted run resumed from its checkpoint gives the same log
+        as an uninterrupted run with the same seed.
+        """
+        expected = optimizer.seeded_optimize(5, SphereFunction(2), BOUNDS, 300, 1e-12)
+
+        path = str(tmp_path / "run.state.pkl")
+        interrupted_function = InterruptedSphere(2, 50)
+        with pytest.raises(RunInterruptedError):
+            optimizer.seeded_optimize(
+                5,
+                interrupted_function,
+                BOUNDS,
+                300,
+                1e-12,
+                checkpoint=RunCheckpoint(path, interrupted_function, interval=2),
+            )
+        assert os.path.exists(path)
+        assert optimizer.checkpoint is None
+
+        function = SphereFunction(2)
+        resumed = optimizer.seeded_optimize(
+            5,
+            function,
+            BOUNDS,
+            300,
+            1e-12,
+            checkpoint=RunCheckpoint(path, function, interval=2),
+        )
+        assert np.array_equal(resumed.x(), expected.x())
+        assert np.array_equal(resumed.y(), expected.y())
+
+    def test_invalid_interval(self, tmp_path):
+        """
+        Test if a non-positive checkpoint interval raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            RunCheckpoint(str(tmp_path / "state.pkl"), SphereFunction(2), interval=0)
+
+    def test_resume_campaign(self, tmp_path):
+        """
+        Test if resuming a campaign skips finished runs and gives the same results
+        as an uninterrupted campaign.
+        """
+        optimizer = CmaEs(6, 1.0)
+        expected = optimizer.run_optimization(
+            4, SphereFunction(2), BOUNDS, 120, 1e-12, seed=9
+        )
+
+        checkpoint_dir = str(tmp_path / "checkpoint")
+        optimizer.run_optimization(
+            4,
+            SphereFunction(2),
+            BOUNDS,
+            120,
+            1e-12,
+            seed=9,
+            checkpoint_dir=checkpoint_dir,
+        )
+        os.remove(os.path.join(checkpoint_dir, "run_1.pkl"))
+        os.remove(os.path.join(checkpoint_dir, "run_3.pkl"))
+
+        resumed = optimizer.run_optimization(
+            4, SphereFunction(2), BOUNDS, 120, 1e-12, resume=checkpoint_dir
+        )
+        assert resumed.seed == 9
+        assert resumed.run_seeds == expected.run_seeds
+        for log_resumed, log_expected in zip(resumed.logs, expected.logs, strict=True):
+            assert np.array_equal(log_resumed.x(), log_expected.x())
+
+    def test_checkpoint_dir_exists(self, tmp_path):
+        """
+        Test if starting a new campaign in a used checkpoint directory raises an error.
+        """
+        checkpoint_dir = str(tmp_path / "checkpoint")
+        optimizer = CmaEs(6, 1.0)
+        optimizer.run_optimization(
+            1, SphereFunction(2), BOUNDS, 12, 1e-12, checkpoint_dir=checkpoint_dir
+        )
+        with pytest.raises(FileExistsError):
+            optimizer.run_optimization(
+                1, SphereFunction(2), BOUNDS, 12, 1e-12, checkpoint_dir=checkpoint_dir
+            )
+        with pytest.raises(ValueError):
+            optimizer.run_optimization(
+                1, SphereFunction(3), BOUNDS, 12, 1e-12, resume=checkpoint_dir
+            )
+        with pytest.raises(FileNotFoundError):
+            optimizer.run_optimization(
+                1, SphereFunction(2), BOUNDS, 12, 1e-12, resume=str(tmp_path / "none")
+            )
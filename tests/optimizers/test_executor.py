@@ -0,0 +1,85 @@
+"""
+Unit tests for OptimizationExecutor class.
+"""
+
+import pytest
+
+from optilab.data_classes import Bounds, Point
+from optilab.functions import NoisyFunction, ObjectiveFunction
+from optilab.functions.unimodal import SphereFunction
+from optilab.optimizers import CmaEs, IpopCmaEs, OptimizationExecutor
+
+
+class CallCountingFunction(ObjectiveFunction):
+    """
+    Stateful function, whose value is the number of its calls so far.
+    """
+
+    def __init__(self, dim: int) -> None:
+        super().__init__("call_counting", dim)
+
+    def __call__(self, point: Point) -> Point:
+        super().__call__(point)
+        return Point(x=point.x, y=self.num_calls, is_evaluated=True)
+
+
+@pytest.fixture(name="executor")
+def fixture_executor():
+    """
+    Executor with two worker processes.
+    """
+    with OptimizationExecutor(2) as executor:
+        yield executor
+
+
+class TestOptimizationExecutor:
+    """
+    Unit tests for OptimizationExecutor class.
+    """
+
+    def test_executor_reused_across_calls(self, executor):
+        """
+        Test if one executor can run many optimizations of different optimizers.
+        """
+        bounds = Bounds(lower=-5, upper=5)
+        for optimizer in [CmaEs(8, 1.0), IpopCmaEs(8)]:
+            for dim in [2, 3]:
+                results = optimizer.run_optimization(
+                    3, SphereFunction(dim), bounds, 200, 1e-8, executor=executor
+                )
+                assert len(results.logs) == 3
+                assert all(0 < len(log) <= 200 for log in results.logs)
+                assert all(log[0].dim() == dim for log in results.logs)
+                assert results.model_metadata == optimizer.metadata
+
+    def test_run_order(self, executor):
+        """
+        Test if runs are returned in order of their indices.
+        """
+        job = executor.submit(
+            CmaEs(4, 1.0), SphereFunction(2), Bounds(lower=-1, upper=1), 40, 1e-8
+        )
+        indices = [index for index, _ in executor.run(job, [3, 1, 2])]
+        assert indices == [3, 1, 2]
+
+    def test_run_optimization_without_executor(self):
+        """
+        Test if run_optimization creates its own pool when no executor is provided.
+        """
+        results = CmaEs(4, 1.0).run_optimization(
+            2, SphereFunction(2), Bounds(lower=-1, upper=1), 40, 1e-8
+        )
+        assert len(results.logs) == 2
+
+    def test_runs_dont_share_function_state(self):
+        """
+        Test if runs in the same worker don't share the state of the function,
+        including call counters of wrapped functions.
+        """
+        function = NoisyFunction(CallCountingFunction(2), 0.0)
+        with OptimizationExecutor(1) as executor:
+            job = executor.submit(
+                CmaEs(4, 1.0), function, Bounds(lower=-1, upper=1), 20, 1e-8
+            )
+            logs = [log for _, log in executor.run(job, [0, 1, 2])]
+        assert all(log[0].y == 1 for log in logs)
@@ -0,0 +1,59 @@
+"""
+Unit tests for streaming optimization results with Optimizer.iter_optimization.
+"""
+
+import numpy as np
+
+from optilab.data_classes import Bounds
+from optilab.functions.unimodal import SphereFunction
+from optilab.optimizers import CmaEs, OptimizationExecutor
+
+BOUNDS = Bounds(lower=-5, upper=5)
+
+
+class TestIterOptimization:
+    """
+    Unit tests for streaming optimization results with Optimizer.iter_optimization.
+    """
+
+    def test_yields_every_run(self):
+        """
+        Test if every run is yielded exactly once with its seed.
+        """
+        with OptimizationExecutor(2) as executor:
+            results = list(
+                CmaEs(6, 1.0).iter_optimization(
+                    5, SphereFunction(2), BOUNDS, 60, 1e-8, executor=executor, seed=3
+                )
+            )
+        _, run_seeds = CmaEs.spawn_run_seeds(3, 5)
+        assert sorted(index for index, _, _ in results) == list(range(5))
+        assert all(seed == run_seeds[index] for index, seed, _ in results)
+        assert all(len(log) == 60 for _, _, log in results)
+
+    def test_matches_run_optimization(self):
+        """
+        Test if streamed logs are the same as logs collected by run_optimization.
+        """
+        optimizer = CmaEs(6, 1.0)
+        streamed = {
+            index: log
+            for index, _, log in optimizer.iter_optimization(
+                3, SphereFunction(2), BOUNDS, 60, 1e-8, num_processes=2, seed=11
+            )
+        }
+        collected = optimizer.run_optimization(
+            3, SphereFunction(2), BOUNDS, 60, 1e-8, num_processes=2, seed=11
+        )
+        for index, log in enumerate(collected.logs):
+            assert np.array_equal(streamed[index].x(), log.x())
+
+    def test_early_stop(self):
+        """
+        Test if the generator can be closed before all runs are finished.
+        """
+        generator = CmaEs(6, 1.0).iter_optimization(
+            4, SphereFunction(2), BOUNDS, 60, 1e-8, num_processes=2
+        )
+        next(generator)
+        generator.close()
@@ -0,0 +1,92 @@
+"""
+Unit tests for deterministic seeding of optimization runs.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import Bounds
+from optilab.functions import NoisyFunction
+from optilab.functions.unimodal import SphereFunction
+from optilab.optimizers import CmaEs, IpopCmaEs, OptimizationExecutor, Optimizer
+
+BOUNDS = Bounds(lower=-5, upper=5)
+
+
+@pytest.fixture(name="executor", scope="module")
+def fixture_executor():
+    """
+    Executor with two worker processes shared by tests in this module.
+    """
+    with OptimizationExecutor(2) as executor:
+        yield executor
+
+
+class TestSeeding:
+    """
+    Unit tests for deterministic seeding of optimization runs.
+    """
+
+    def test_spawn_run_seeds(self):
+        """
+        Test if spawned seeds are reproducible and differ between runs.
+        """
+        entropy, run_seeds = Optimizer.spawn_run_seeds(42, 5)
+        assert entropy == 42
+        assert run_seeds == Optimizer.spawn_run_seeds(42, 5)[1]
+        assert len(set(run_seeds)) == 5
+        assert (
+            Optimizer.spawn_run_seeds(None, 5)[0]
+            != Optimizer.spawn_run_seeds(None, 5)[0]
+        )
+
+    @pytest.mark.parametrize("optimizer", [CmaEs(6, 1.0), IpopCmaEs(6)])
+    def test_runs_reproducible(self, executor, optimizer):
+        """
+        Test if runs with the same root seed give the same logs, and different runs differ.
+        """
+        function = NoisyFunction(SphereFunction(3), 0.1)
+        first = optimizer.run_optimization(
+            4, function, BOUNDS, 120, 1e-8, executor=executor, seed=7
+        )
+        second = optimizer.run_optimization(
+            4, function, BOUNDS, 120, 1e-8, executor=executor, seed=7
+        )
+        assert first.seed == 7
+        assert first.run_seeds == second.run_seeds
+        for log_first, log_second in zip(first.logs, second.logs, strict=True):
+            assert np.array_equal(log_first.x(), log_second.x())
+            assert np.array_equal(log_first.y(), log_second.y())
+        assert not np.array_equal(first.logs[0].x(), first.logs[1].x())
+
+    def test_rerun_single_run(self, executor):
+        """
+        Test if a single run can be reproduced from its recorded seed.
+        """
+        optimizer = CmaEs(6, 1.0)
+        results = optimizer.run_optimization(
+            3, SphereFunction(2), BOUNDS, 60, 1e-8, executor=executor, seed=123
+        )
+        assert results.run_seeds is not None
+        rerun = optimizer.seeded_optimize(
+            results.run_seeds[2], SphereFunction(2), BOUNDS, 60, 1e-8
+        )
+        assert np.array_equal(rerun.x(), results.logs[2].x())
+
+    def test_unpickle_run_without_seeds(self, executor):
+        """
+        Test if runs pickled before seeds were recorded get None seeds.
+        """
+        results = CmaEs(4, 1.0).run_optimization(
+            1, SphereFunction(2), BOUNDS, 20, 1e-8, executor=executor
+        )
+        state = results.__getstate__()
+        del state["__dict__"]["seed"]
+        del state["__dict__"]["run_seeds"]
+        restored = type(results).__new__(type(results))
+        restored.__setstate__(state)
+        assert restored.seed is None
+        assert restored.run_seeds is None
+        assert pickle.loads(pickle.dumps(results)).seed == results.seed
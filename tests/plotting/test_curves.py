@@ -0,0 +1,86 @@
+"""
+Unit tests for computation of convergence and ECDF curves.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import ColumnarPointList, Point, PointList
+from optilab.plotting import (
+    convergence_curve,
+    convergence_curves,
+    ecdf_curve,
+    ecdf_thresholding,
+)
+
+
+@pytest.fixture(name="example_logs")
+def fixture_example_logs():
+    """
+    Two logs of different lengths, one with a missing y value.
+    """
+    return [
+        PointList(
+            points=[
+                Point(x=np.zeros(2), y=None),
+                Point(x=np.zeros(2), y=5.0),
+                Point(x=np.zeros(2), y=7.0),
+                Point(x=np.zeros(2), y=2.0),
+            ]
+        ),
+        PointList(points=[Point(x=np.zeros(2), y=3.0), Point(x=np.zeros(2), y=1.0)]),
+    ]
+
+
+class TestCurves:
+    """
+    Unit tests for computation of convergence and ECDF curves.
+    """
+
+    def test_convergence_curve(self, example_logs):
+        """
+        Test if the convergence curve is the running minimum skipping missing values.
+        """
+        assert convergence_curve(example_logs[0]) == [np.inf, 5.0, 5.0, 2.0]
+
+    def test_convergence_curves_padding(self, example_logs):
+        """
+        Test if shorter curves are padded with their last value.
+        """
+        curves = convergence_curves(example_logs, length=5)
+        assert np.array_equal(
+            curves, [[np.inf, 5.0, 5.0, 2.0, 2.0], [3.0, 1.0, 1.0, 1.0, 1.0]]
+        )
+        with pytest.raises(ValueError):
+            convergence_curves(example_logs, length=3)
+
+    def test_columnar_logs(self, example_logs):
+        """
+        Test if columnar logs give the same curves.
+        """
+        columnar_logs = [ColumnarPointList.from_point_list(log) for log in example_logs]
+        assert np.array_equal(
+            convergence_curves(columnar_logs), convergence_curves(example_logs)
+        )
+
+    def test_ecdf_thresholding(self):
+        """
+        Test if thresholding counts thresholds greater or equal to each value.
+        """
+        thresholds = np.array([1.0, 2.0, 3.0, 4.0])
+        curves = np.array([[5.0, 4.0, 2.5], [2.0, 1.0, 0.0]])
+        assert np.array_equal(
+            ecdf_thresholding(curves, thresholds),
+            [[0.0, 0.25, 0.5], [0.75, 1.0, 1.0]],
+        )
+
+    def test_ecdf_curve(self, example_logs):
+        """
+        Test if ECDF curves reach all thresholds when all runs reach the allowed error.
+        """
+        ecdf_data = ecdf_curve({"method": example_logs}, 2, allowed_error=2.0)
+        x, y = ecdf_data["method"]
+
+        assert np.allclose(x, [0.5, 1.0, 1.5, 2.0])
+        assert y[0] < y[-1]
+        assert y[-1] == 1.0
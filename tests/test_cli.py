@@ -0,0 +1,214 @@
+"""
+Unit tests for the optilab CLI runner.
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pytest
+
+from optilab.cli import OptilabCLI
+from optilab.data_classes import (
+    Bounds,
+    FunctionMetadata,
+    OptimizationRun,
+    OptimizerMetadata,
+    PointList,
+)
+from optilab.utils import analysis_cache, dump_to_npz, dump_to_pickle
+
+
+def make_args(pickle_path, save_path, **kwargs) -> argparse.Namespace:
+    """
+    Make CLI arguments with defaults of the optilab command.
+    """
+    args = {
+        "pickle_path": pickle_path,
+        "aggregate_pvalues": True,
+        "aggregate_stats": True,
+        "entries": None,
+        "hide_outliers": False,
+        "hide_plots": True,
+        "jobs": 1,
+        "no_cache": False,
+        "no_save": False,
+        "raw_values": False,
+        "save_path": save_path,
+        "significance": 0.05,
+        "test_evals": True,
+        "test_y": True,
+        "to_npz": False,
+    }
+    args.update(kwargs)
+    return argparse.Namespace(**args)
+
+
+def record_analyzed_files(cli: OptilabCLI, monkeypatch) -> list:
+    """
+    Patch the CLI to record paths of the files it analyzes instead of restoring them
+    from the cache.
+    """
+    analyzed = []
+    analyze_file = cli._analyze_file
+    monkeypatch.setattr(
+        cli, "_analyze_file", lambda path: analyzed.append(path) or analyze_file(path)
+    )
+    return analyzed
+
+
+@pytest.fixture(name="results_dir")
+def fixture_results_dir(tmp_path):
+    """
+    Directory with result files of three functions, each optimized by two models.
+    """
+    rng = np.random.default_rng(0)
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+
+    for function_name in ["sphere", "rosenbrock", "rastrigin"]:
+        runs = [
+            OptimizationRun(
+                model_metadata=OptimizerMetadata(
+                    name=model_name, population_size=4, hyperparameters={}
+                ),
+                function_metadata=FunctionMetadata(
+                    name=function_name, dim=2, hyperparameters={}
+                ),
+                bounds=Bounds(lower=-5, upper=5),
+                tolerance=1e-8,
+                logs=[
+                    PointList.from_list(list(rng.uniform(-5, 5, (30, 2))))
+                    for _ in range(5)
+                ],
+            )
+            for model_name in ["cmaes", "lmm-cmaes"]
+        ]
+        for run in runs:
+            for log in run.logs:
+                for point in log:
+                    assert point.x is not None
+                    point.y = float(np.sum(point.x**2))
+        if function_name == "sphere":
+            dump_to_npz(runs, results_dir / f"{function_name}.npz")
+        else:
+            dump_to_pickle(runs, results_dir / f"{function_name}.zstd.pkl")
+
+    return results_dir
+
+
+class TestOptilabCLI:
+    """
+    Unit tests for the optilab CLI runner.
+    """
+
+    def test_parallel_matches_serial(self, results_dir, tmp_path, capsys):
+        """
+        Test if analysis with a process pool gives the same reports, artifacts
+        and aggregated tables as serial analysis.
+        """
+        serial_dir = tmp_path / "serial"
+        parallel_dir = tmp_path / "parallel"
+        serial_dir.mkdir()
+        parallel_dir.mkdir()
+
+        serial = OptilabCLI(make_args(results_dir, serial_dir))
+        serial.run()
+        serial_output = capsys.readouterr().out
+
+        parallel = OptilabCLI(make_args(results_dir, parallel_dir, jobs=2))
+        parallel.run()
+        parallel_output = capsys.readouterr().out
+
+        assert parallel_output == serial_output
+        assert parallel.stats_to_aggregate_df.equals(serial.stats_to_aggregate_df)
+        assert parallel.y_pvalues_to_aggregate_df.equals(
+            serial.y_pvalues_to_aggregate_df
+        )
+        assert sorted(path.name for path in parallel_dir.iterdir()) == sorted(
+            path.name for path in serial_dir.iterdir()
+        )
+        assert (parallel_dir / "rastrigin.convergence.png").exists()
+
+    def test_cache(self, results_dir, tmp_path, capsys, monkeypatch):
+        """
+        Test if a rerun restores unchanged files from the cache and analyzes
+        only modified ones.
+        """
+        save_dir = tmp_path / "artifacts"
+        save_dir.mkdir()
+
+        first = OptilabCLI(make_args(results_dir, save_dir))
+        first.run()
+        first_output = capsys.readouterr().out
+        assert (save_dir / "optilab_cache.sqlite").exists()
+
+        (results_dir / "rastrigin.zstd.pkl").rename(results_dir / "ackley.zstd.pkl")
+
+        second = OptilabCLI(make_args(results_dir, save_dir))
+        analyzed = record_analyzed_files(second, monkeypatch)
+        second.run()
+        second_output = capsys.readouterr().out
+
+        assert analyzed == [results_dir / "ackley.zstd.pkl"]
+        sphere_report = first_output[first_output.index("sphere.npz") :]
+        assert second_output.endswith(sphere_report)
+        assert len(second.stats_to_aggregate_df) == len(first.stats_to_aggregate_df)
+
+    def test_cache_removed_artifact(self, results_dir, tmp_path, monkeypatch):
+        """
+        Test if a file is analyzed again when one of its saved artifacts is removed.
+        """
+        OptilabCLI(make_args(results_dir, tmp_path)).run()
+        (tmp_path / "sphere.stats.csv").unlink()
+
+        rerun = OptilabCLI(make_args(results_dir, tmp_path))
+        analyzed = record_analyzed_files(rerun, monkeypatch)
+        rerun.run()
+
+        assert analyzed == [results_dir / "sphere.npz"]
+        assert (tmp_path / "sphere.stats.csv").exists()
+
+    def test_cache_hashes_files_once(self, results_dir, tmp_path, monkeypatch):
+        """
+        Test if result files are hashed once when their analyses are stored, and later
+        only when their size or modification time changed.
+        """
+        hashed = []
+        file_hash = analysis_cache.file_hash
+        monkeypatch.setattr(
+            analysis_cache,
+            "file_hash",
+            lambda path: hashed.append(path) or file_hash(path),
+        )
+        result_files = sorted(results_dir.iterdir())
+
+        OptilabCLI(make_args(results_dir, tmp_path)).run()
+        assert sorted(path for path in hashed if path.parent == results_dir) == (
+            result_files
+        )
+
+        hashed.clear()
+        OptilabCLI(make_args(results_dir, tmp_path)).run()
+        assert not hashed
+
+        sphere_path = results_dir / "sphere.npz"
+        os.utime(sphere_path, ns=(0, 0))
+        rerun = OptilabCLI(make_args(results_dir, tmp_path))
+        analyzed = record_analyzed_files(rerun, monkeypatch)
+        rerun.run()
+
+        assert not analyzed
+        assert hashed == [sphere_path]
+
+    def test_cache_keyed_on_options(self, results_dir, tmp_path, monkeypatch):
+        """
+        Test if changing analysis options invalidates cached analyses.
+        """
+        OptilabCLI(make_args(results_dir, tmp_path)).run()
+
+        rerun = OptilabCLI(make_args(results_dir, tmp_path, raw_values=True))
+        analyzed = record_analyzed_files(rerun, monkeypatch)
+        rerun.run()
+
+        assert len(analyzed) == 3
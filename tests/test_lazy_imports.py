@@ -0,0 +1,99 @@
+"""
+Guard tests for lazy imports, keeping import of optilab and its CLI cheap.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["faiss", "xgboost", "sklearn", "opfunu", "matplotlib"]
+
+
+def imported_modules(code: str) -> set[str]:
+    """
+    Run code in a fresh interpreter and get top level names of imported modules.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport sys\nprint(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+class TestLazyImports:
+    """
+    Guard tests for lazy imports, keeping import of optilab and its CLI cheap.
+    """
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import optilab.functions.surrogate, optilab.metamodels, optilab.plotting",
+            "from optilab.functions.unimodal import SphereFunction",
+            "from optilab.data_classes import OptimizationRun, PointList",
+        ],
+    )
+    def test_no_heavy_imports(self, code):
+        """
+        Test if importing packages does not import heavy dependencies.
+        """
+        modules = imported_modules(code)
+        assert modules.isdisjoint(HEAVY_MODULES + ["pandas", "cma"])
+
+    def test_cma_es(self):
+        """
+        Test if importing CmaEs does not import surrogate dependencies.
+        """
+        modules = imported_modules("from optilab.optimizers import CmaEs")
+        assert modules.isdisjoint(["faiss", "xgboost", "sklearn", "pandas"])
+
+    def test_cli(self):
+        """
+        Test if the CLI imports plotting and optimization dependencies only when needed.
+        """
+        modules = imported_modules("import optilab.cli")
+        assert modules.isdisjoint(HEAVY_MODULES + ["cma"])
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "from optilab.plotting.ecdf_curve import plot_ecdf_curves",
+            "import optilab.plotting.convergence_curve",
+            "import optilab.plotting.ecdf_curve, optilab.plotting.convergence_curve",
+        ],
+    )
+    def test_submodule_imported_first(self, code):
+        """
+        Test if attributes sharing the name with their submodule are functions,
+        when the submodule was imported directly before.
+        """
+        imports = "from optilab.plotting import convergence_curve, ecdf_curve"
+        check = "print(type(convergence_curve).__name__, type(ecdf_curve).__name__)"
+        result = subprocess.run(
+            [sys.executable, "-c", f"{code}\n{imports}\n{check}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.split() == ["function", "function"]
+
+    def test_attribute_access(self):
+        """
+        Test if lazy attributes are loaded on access, including attributes sharing
+        the name with their submodule.
+        """
+        import optilab.plotting
+
+        assert callable(optilab.plotting.plot_ecdf_curves)
+        assert callable(optilab.plotting.convergence_curve)
+        assert callable(optilab.plotting.ecdf_curve)
+        assert "plot_box_plot" in dir(optilab.plotting)
+        with pytest.raises(AttributeError):
+            _ = optilab.plotting.missing_function
@@ -0,0 +1,163 @@
+"""
+Unit tests for AnalysisCache class.
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from optilab.utils import analysis_cache
+from optilab.utils.analysis_cache import AnalysisCache, file_stat
+
+
+@pytest.fixture(name="result_file")
+def fixture_result_file(tmp_path):
+    """
+    Result file to cache the analysis of.
+    """
+    path = tmp_path / "sphere.npz"
+    path.write_bytes(b"results")
+    return path
+
+
+@pytest.fixture(name="artifact")
+def fixture_artifact(tmp_path):
+    """
+    Artifact saved by the analysis.
+    """
+    path = tmp_path / "sphere.stats.csv"
+    path.write_text("stats")
+    return path
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path, result_file, artifact):
+    """
+    Cache holding an analysis of the result file.
+    """
+    with AnalysisCache(tmp_path / "cache.sqlite") as cache:
+        key = AnalysisCache.make_key(result_file, {"raw_values": False})
+        cache.put(
+            key, result_file, file_stat(result_file), "report", [1, 2], [artifact]
+        )
+        yield cache
+
+
+class TestAnalysisCache:
+    """
+    Unit tests for AnalysisCache class.
+    """
+
+    def get(self, cache, result_file):
+        """
+        Get the analysis of the result file from the cache.
+        """
+        key = AnalysisCache.make_key(result_file, {"raw_values": False})
+        return cache.get(key, result_file, result_file.parent)
+
+    def test_get(self, cache, result_file):
+        """
+        Test if the stored analysis is returned for an unchanged file.
+        """
+        assert self.get(cache, result_file) == ("report", [1, 2])
+        assert self.get(cache, result_file) == ("report", [1, 2])
+
+    def test_key_depends_on_options(self, result_file):
+        """
+        Test if different analysis options give different keys.
+        """
+        assert AnalysisCache.make_key(
+            result_file, {"raw_values": False}
+        ) != AnalysisCache.make_key(result_file, {"raw_values": True})
+
+    def test_changed_size(self, cache, result_file):
+        """
+        Test if a file with a different size is treated as modified.
+        """
+        stat = os.stat(result_file)
+        result_file.write_bytes(b"more results")
+        os.utime(result_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert self.get(cache, result_file) is None
+
+    def test_unchanged_file_is_not_hashed(self, cache, result_file, monkeypatch):
+        """
+        Test if files with unchanged size and modification time are not read on reuse.
+        """
+
+        def fail_hash(path):
+            raise AssertionError(f"{path} was hashed")
+
+        monkeypatch.setattr(analysis_cache, "file_hash", fail_hash)
+        assert self.get(cache, result_file) == ("report", [1, 2])
+
+    def test_touched_file(self, cache, result_file, monkeypatch):
+        """
+        Test if a file with unchanged content and a new modification time is reused,
+        and is hashed only once.
+        """
+        stat = os.stat(result_file)
+        os.utime(result_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        hashed = []
+        file_hash = analysis_cache.file_hash
+
+        def record_hash(path):
+            hashed.append(path)
+            return file_hash(path)
+
+        monkeypatch.setattr(analysis_cache, "file_hash", record_hash)
+        assert self.get(cache, result_file) == ("report", [1, 2])
+        assert self.get(cache, result_file) == ("report", [1, 2])
+        assert hashed == [result_file]
+
+    def test_changed_content(self, cache, result_file):
+        """
+        Test if a file with the same size and changed content is treated as modified.
+        """
+        stat = os.stat(result_file)
+        result_file.write_bytes(b"RESULTS")
+        os.utime(result_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert self.get(cache, result_file) is None
+
+    def test_changed_during_analysis(self, tmp_path, result_file):
+        """
+        Test if an analysis is not stored if the file changed since it was analyzed.
+        """
+        stat = file_stat(result_file)
+        result_file.write_bytes(b"more results")
+        with AnalysisCache(tmp_path / "changed.sqlite") as cache:
+            key = AnalysisCache.make_key(result_file, {})
+            cache.put(key, result_file, stat, "report", None, [])
+            assert cache.get(key, result_file, tmp_path) is None
+
+    def test_modified_artifact(self, cache, result_file, artifact):
+        """
+        Test if the analysis is not reused when its artifact was modified.
+        """
+        artifact.write_text("other stats")
+        assert self.get(cache, result_file) is None
+
+    def test_artifacts_not_stored(self, cache):
+        """
+        Test if only names and checksums of artifacts are stored.
+        """
+        columns = [
+            row[1] for row in cache._connection.execute("PRAGMA table_info(artifacts)")
+        ]
+        assert columns == ["key", "name", "size", "mtime_ns", "checksum"]
+
+    def test_old_schema_is_cleared(self, tmp_path, result_file):
+        """
+        Test if a cache created by an older version is cleared on opening.
+        """
+        path = tmp_path / "old.sqlite"
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE analyses (key TEXT PRIMARY KEY, report TEXT, tables BLOB)"
+            )
+        connection.close()
+
+        with AnalysisCache(path) as cache:
+            key = AnalysisCache.make_key(result_file, {})
+            cache.put(key, result_file, file_stat(result_file), "report", None, [])
+            assert cache.get(key, result_file, tmp_path) == ("report", None)
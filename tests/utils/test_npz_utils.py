@@ -0,0 +1,221 @@
+"""
+Unit tests for the columnar npz result format.
+"""
+
+import numpy as np
+import pytest
+
+from optilab.data_classes import (
+    Bounds,
+    ColumnarPointList,
+    FunctionMetadata,
+    OptimizationRun,
+    OptimizerMetadata,
+    Point,
+    PointList,
+)
+from optilab.utils import (
+    convert_to_npz,
+    dump_to_npz,
+    dump_to_pickle,
+    load_from_npz,
+)
+from optilab.utils.npz_utils import (
+    list_all_results,
+    load_results,
+    read_npz_metadata,
+)
+
+
+@pytest.fixture(name="example_runs")
+def fixture_example_runs():
+    """
+    Two example optimization runs, the second one with removed x values.
+    """
+    runs = []
+    for name in ["cmaes", "lmm-cmaes"]:
+        logs = [
+            PointList(
+                points=[
+                    Point(x=np.array([1.0, 2.0]), y=5.0, is_evaluated=True),
+                    Point(x=np.array([0.5, -1.0]), y=1.5, is_evaluated=True),
+                    Point(x=np.array([0.1, 0.0]), y=0.7, is_evaluated=False),
+                ]
+            ),
+            PointList(
+                points=[Point(x=np.array([3.0, 3.0]), y=18.0, is_evaluated=True)]
+            ),
+        ]
+        runs.append(
+            OptimizationRun(
+                model_metadata=OptimizerMetadata(
+                    name=name, population_size=4, hyperparameters={"sigma0": 1}
+                ),
+                function_metadata=FunctionMetadata(
+                    name="sphere", dim=2, hyperparameters={}
+                ),
+                bounds=Bounds(lower=[-5, -3], upper=[5, 3]),
+                tolerance=1e-8,
+                logs=logs,
+                seed=42,
+                run_seeds=[1, 2],
+            )
+        )
+    runs[1].remove_x()
+    return runs
+
+
+class TestNpzUtils:
+    """
+    Unit tests for the columnar npz result format.
+    """
+
+    def test_round_trip(self, example_runs, tmp_path):
+        """
+        Test if runs read from an npz file are equal to the saved ones.
+        """
+        npz_path = tmp_path / "results.npz"
+        dump_to_npz(example_runs, npz_path)
+        loaded = load_from_npz(npz_path)
+
+        assert len(loaded) == 2
+        for run, loaded_run in zip(example_runs, loaded, strict=True):
+            assert loaded_run.model_metadata == run.model_metadata
+            assert loaded_run.function_metadata == run.function_metadata
+            assert loaded_run.bounds == run.bounds
+            assert loaded_run.seed == 42
+            assert loaded_run.run_seeds == [1, 2]
+            assert loaded_run.log_lengths() == run.log_lengths()
+            assert loaded_run.bests_y() == run.bests_y()
+            assert all(isinstance(log, ColumnarPointList) for log in loaded_run.logs)
+            first_log = loaded_run.logs[0]
+            assert isinstance(first_log, ColumnarPointList)
+            assert np.array_equal(first_log.is_evaluated(), [True, True, False])
+
+        assert np.array_equal(loaded[0].logs[0].x(), example_runs[0].logs[0].x())
+        assert loaded[1].logs[0].x().shape == (3, 0)
+
+    def test_round_trip_numpy_metadata(self, example_runs, tmp_path):
+        """
+        Test if numpy scalars and arrays in metadata are saved with their values.
+        """
+        run = example_runs[0]
+        run.model_metadata.hyperparameters = {
+            "sigma0": np.float64(0.5),
+            "num_restarts": np.int64(3),
+            "weights": np.array([0.75, 0.25]),
+            "active": np.bool_(True),
+        }
+        run.seed = np.int64(7)
+        npz_path = tmp_path / "results.npz"
+        dump_to_npz([run], npz_path)
+        loaded = load_from_npz(npz_path)[0]
+
+        assert loaded.model_metadata.hyperparameters == {
+            "sigma0": 0.5,
+            "num_restarts": 3,
+            "weights": [0.75, 0.25],
+            "active": True,
+        }
+        assert loaded.seed == 7
+
+    def test_unsupported_metadata(self, example_runs, tmp_path):
+        """
+        Test if metadata that can't be stored as JSON raises TypeError
+        instead of being saved as a string.
+        """
+        example_runs[0].model_metadata.hyperparameters = {"path": tmp_path}
+        with pytest.raises(TypeError):
+            dump_to_npz(example_runs, tmp_path / "results.npz")
+
+    def test_without_x(self, example_runs, tmp_path):
+        """
+        Test if x values are skipped when not included or not loaded.
+        """
+        npz_path = tmp_path / "results.npz"
+        dump_to_npz(example_runs, npz_path, include_x=False)
+        with np.load(npz_path) as npz_file:
+            assert not any(name.endswith("_x") for name in npz_file.files)
+
+        dump_to_npz(example_runs, npz_path)
+        loaded = load_from_npz(npz_path, load_x=False)
+        assert loaded[0].logs[0].x().shape == (3, 0)
+        assert loaded[0].bests_y(raw_values=True) == [0.7, 18.0]
+
+    def test_convert(self, example_runs, tmp_path):
+        """
+        Test if a compressed pickle is converted to an npz file next to it.
+        """
+        pickle_path = tmp_path / "results.zstd.pkl"
+        dump_to_pickle(example_runs, pickle_path)
+        npz_path = convert_to_npz(pickle_path)
+
+        assert npz_path == tmp_path / "results.npz"
+        assert load_results(npz_path)[0].stats().equals(example_runs[0].stats())
+
+    def test_not_a_result_file(self, tmp_path):
+        """
+        Test if reading an npz file without metadata raises ValueError.
+        """
+        npz_path = tmp_path / "other.npz"
+        np.savez(npz_path, values=np.zeros(3))
+        with pytest.raises(ValueError):
+            load_from_npz(npz_path)
+
+    def test_list_all_results(self, example_runs, tmp_path):
+        """
+        Test if both pickle and npz files are listed.
+        """
+        dump_to_pickle(example_runs, tmp_path / "a.pkl")
+        dump_to_npz(example_runs, tmp_path / "b.npz")
+        (tmp_path / "c.csv").touch()
+
+        assert list_all_results(tmp_path) == [tmp_path / "a.pkl", tmp_path / "b.npz"]
+        with pytest.raises(ValueError):
+            list_all_results(tmp_path / "c.csv")
+
+    def test_mmap(self, example_runs, tmp_path):
+        """
+        Test if memory-mapped logs are read only views of the file with correct values.
+        """
+        npz_path = tmp_path / "results.npz"
+        dump_to_npz(example_runs, npz_path)
+        loaded = load_from_npz(npz_path, mmap=True)
+
+        ys = loaded[0].logs[0].y()
+        assert not ys.flags.writeable
+        base = ys
+        while base.base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+        assert np.array_equal(ys, [5.0, 1.5, 0.7])
+        assert np.array_equal(loaded[0].logs[1].x(), [[3.0, 3.0]])
+        assert loaded[1].bests_y(raw_values=True) == [0.7, 18.0]
+
+    def test_entries(self, example_runs, tmp_path):
+        """
+        Test if only selected entries are loaded, skipping out of range indices.
+        """
+        npz_path = tmp_path / "results.npz"
+        dump_to_npz(example_runs, npz_path)
+        loaded = load_results(npz_path, entries=[1, 5], lazy=True)
+
+        assert len(loaded) == 1
+        assert loaded[0].model_metadata.name == "lmm-cmaes"
+
+        pickle_path = tmp_path / "results.zstd.pkl"
+        dump_to_pickle(example_runs, pickle_path)
+        loaded = load_results(pickle_path, entries=[1, 5])
+        assert [run.model_metadata.name for run in loaded] == ["lmm-cmaes"]
+
+    def test_read_metadata(self, example_runs, tmp_path):
+        """
+        Test if metadata with log lengths and best values is read without the logs.
+        """
+        npz_path = tmp_path / "results.npz"
+        dump_to_npz(example_runs, npz_path)
+        metadata = read_npz_metadata(npz_path)
+
+        assert len(metadata["entries"]) == 2
+        assert metadata["entries"][0]["log_lengths"] == [3, 1]
+        assert metadata["entries"][0]["bests_y"] == [0.7, 18.0]